@@ -53,6 +53,7 @@ class RacingCoachClient:
             api_client: Authenticated API client for server communication.
         """
         self.api_client = api_client
+        self.lap_upload_handler: LapUploadHandler | None = None
 
         # Create event bus
         self.event_bus = EventBus(max_queue_size=100_000)
@@ -103,7 +104,13 @@ class RacingCoachClient:
         )
 
         if upload:
-            lap_upload_handler = LapUploadHandler(self.event_bus, self.api_client)
+            lap_upload_handler = LapUploadHandler(
+                self.event_bus,
+                self.api_client,
+                max_batch_size=settings.LAP_UPLOAD_BATCH_SIZE,
+                max_delay_ms=settings.LAP_UPLOAD_BATCH_DELAY_MS,
+            )
+            self.lap_upload_handler = lap_upload_handler
             handlers.append(
                 Handler[LapAndSession](
                     SystemEvents.LAP_TELEMETRY_SEQUENCE,
@@ -153,6 +160,8 @@ class RacingCoachClient:
         logger.info("Shutting down Racing Coach Client...")
         if self.collector:
             self.collector.stop()
+        if self.lap_upload_handler:
+            self.lap_upload_handler.close()
         if self.event_bus:
             self.event_bus.stop()
         logger.info("Racing Coach Client shut down gracefully.")
@@ -168,7 +177,9 @@ def main():
 
     # Authenticate with server (may prompt user for device authorization)
     logger.info("Authenticating with server...")
-    api_client = get_authenticated_client(settings.SERVER_URL)
+    api_client = get_authenticated_client(
+        settings.SERVER_URL, connect_retries=settings.HTTP_CONNECT_RETRIES
+    )
 
     # Create the racing coach client
     client = RacingCoachClient(api_client)
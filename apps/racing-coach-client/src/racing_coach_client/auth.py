@@ -7,12 +7,14 @@ Tokens are stored in a config file at ~/.config/racing-coach/device_token.
 import contextlib
 import logging
 import platform
+import socket
 import sys
 import time
 import webbrowser
 from http import HTTPStatus
 from pathlib import Path
 
+import httpx
 from racing_coach_server_client import AuthenticatedClient, Client
 from racing_coach_server_client.api.auth import initiate_device_authorization, poll_device_token
 from racing_coach_server_client.models import (
@@ -31,6 +33,9 @@ TOKEN_FILE = "device_token"
 # Authentication header configuration
 DEVICE_TOKEN_HEADER = "X-Device-Token"
 
+# Socket send buffer size, large enough to hold a typical lap upload
+SEND_BUFFER_SIZE = 1 << 20
+
 
 class AuthenticationError(Exception):
     """Authentication failed."""
@@ -215,7 +220,7 @@ def run_device_auth_flow(base_url: str) -> str:
 # -----------------------------------------------------------------------------
 
 
-def get_authenticated_client(base_url: str) -> AuthenticatedClient:
+def get_authenticated_client(base_url: str, connect_retries: int = 3) -> AuthenticatedClient:
     """Get an authenticated API client.
 
     If a valid token is stored, uses it. Otherwise, runs the interactive
@@ -223,6 +228,8 @@ def get_authenticated_client(base_url: str) -> AuthenticatedClient:
 
     Args:
         base_url: The server URL.
+        connect_retries: Times a request is retried when no connection to the server
+            could be established.
 
     Returns:
         An authenticated client ready for use.
@@ -251,4 +258,22 @@ def get_authenticated_client(base_url: str) -> AuthenticatedClient:
         token=token,
         prefix="",  # No prefix, just the raw token
         auth_header_name=DEVICE_TOKEN_HEADER,
+        httpx_args={"transport": create_transport(connect_retries)},
+    )
+
+
+def create_transport(connect_retries: int) -> httpx.HTTPTransport:
+    """Create the HTTP transport used for requests to the server.
+
+    httpx only retries failures to establish a connection, with exponential backoff
+    between attempts. A request that reached the server is never sent again, so a
+    lap upload that timed out after the server stored it cannot be submitted twice.
+
+    httpcore already disables Nagle's algorithm (TCP_NODELAY) on every connection. The
+    send buffer is enlarged so a whole lap can be handed to the kernel without waiting
+    for the server to acknowledge earlier segments.
+    """
+    return httpx.HTTPTransport(
+        retries=connect_retries,
+        socket_options=[(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)],
     )
@@ -18,6 +18,16 @@ class Settings(BaseSettings):
     LAP_COMPLETION_THRESHOLD: float = 95.0
     """Percentage of lap distance to consider lap complete"""
 
+    # Upload configuration
+    LAP_UPLOAD_BATCH_SIZE: int = 1
+    """Number of laps sent per upload request (1 uploads each lap as soon as it completes)"""
+
+    LAP_UPLOAD_BATCH_DELAY_MS: float = 2000.0
+    """Maximum time in milliseconds a completed lap waits for its upload batch to fill"""
+
+    HTTP_CONNECT_RETRIES: int = 3
+    """Times a request is retried when no connection to the server could be established"""
+
     # Telemetry source configuration
     TELEMETRY_MODE: Literal["live", "replay"] = "replay"
     """Telemetry mode: 'live' for iRacing SDK, 'replay' for IBT files"""
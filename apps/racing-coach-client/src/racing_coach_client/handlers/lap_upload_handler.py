@@ -1,13 +1,20 @@
+import json
 import logging
+import threading
+from collections.abc import Callable, Iterator
+from functools import cached_property
 
+import httpx
+from pydantic_core import to_json
 from racing_coach_core.events import Event, EventBus, HandlerContext, SystemEvents
 from racing_coach_core.events.checking import method_handles
 from racing_coach_core.schemas.events import LapAndSession, LapUploadResult
 from racing_coach_server_client import AuthenticatedClient, Client
-from racing_coach_server_client.api.telemetry import upload_lap
+from racing_coach_server_client.api.telemetry import upload_laps_batch
 from racing_coach_server_client.models import (
-    BodyUploadLap,
-    LapUploadResponse,
+    LapBatchUploadItem,
+    LapBatchUploadRequest,
+    LapBatchUploadResponse,
 )
 from racing_coach_server_client.models import (
     LapTelemetry as ApiLapTelemetry,
@@ -19,11 +26,189 @@ from racing_coach_server_client.models import (
 logger = logging.getLogger(__name__)
 
 
+_FRAMES_PER_CHUNK = 256
+"""Frames serialized into each chunk of a streamed lap upload."""
+
+
+def _lap_number(data: LapAndSession) -> int:
+    return data.LapTelemetry.frames[0].lap_number if data.LapTelemetry.frames else -1
+
+
+def iter_lap_upload_body(data: LapAndSession) -> Iterator[bytes]:
+    """Yield the JSON body of the upload_lap endpoint in chunks.
+
+    Frames are serialized a chunk at a time straight to JSON bytes, so the full payload is
+    never materialized as a dict tree or a single bytes object. Sent as the request content,
+    the body goes out with chunked transfer encoding while later frames are still being
+    serialized.
+    """
+    lap = data.LapTelemetry
+    frames = lap.frames
+
+    yield (
+        b'{"session":'
+        + to_json(data.SessionFrame)
+        + b',"lap":{"lap_time":'
+        + json.dumps(lap.lap_time).encode()
+        + b',"frames":['
+    )
+    for start in range(0, len(frames), _FRAMES_PER_CHUNK):
+        chunk = b",".join(to_json(frame) for frame in frames[start : start + _FRAMES_PER_CHUNK])
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]}}"
+
+
+class LapUploadBatcher:
+    """Accumulates completed laps and uploads them to the server in batches.
+
+    A batch is flushed as a single request once ``max_batch_size`` laps are pending or
+    ``max_delay_ms`` has elapsed since the first pending lap, whichever comes first. Once
+    closed, laps are no longer batched and each one is uploaded as soon as it is added.
+    """
+
+    def __init__(
+        self,
+        api_client: AuthenticatedClient | Client,
+        on_result: Callable[[LapAndSession, str | None], None],
+        max_batch_size: int = 8,
+        max_delay_ms: float = 2000.0,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            api_client: The API client for server communication
+            on_result: Called once per lap after its batch was sent, with an error
+                message or None on success
+            max_batch_size: Number of pending laps that triggers an immediate flush
+            max_delay_ms: Maximum time a lap may wait before its batch is flushed
+        """
+        self.api_client = api_client
+        self.on_result = on_result
+        self.max_batch_size = max_batch_size
+        self.max_delay_ms = max_delay_ms
+
+        self._lock = threading.Lock()
+        self._sends_done = threading.Condition(self._lock)
+        self._pending: list[LapAndSession] = []
+        self._timer: threading.Timer | None = None
+        self._in_flight = 0
+        self._closed = False
+
+    def add(self, data: LapAndSession) -> None:
+        """Queue a lap for upload, flushing if the batch is full."""
+        batch: list[LapAndSession] = []
+        with self._lock:
+            self._pending.append(data)
+            if self._closed or len(self._pending) >= self.max_batch_size:
+                batch = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_delay_ms / 1000.0, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if batch:
+            self._send(batch)
+
+    def flush(self) -> None:
+        """Upload all pending laps immediately."""
+        with self._lock:
+            batch = self._take_pending()
+
+        if batch:
+            self._send(batch)
+
+    def close(self) -> None:
+        """Flush any pending laps and wait for every upload in flight to finish.
+
+        The flush timer is cancelled, so no result is reported after this returns. Laps
+        added afterwards are uploaded immediately.
+        """
+        with self._lock:
+            self._closed = True
+        self.flush()
+        with self._lock:
+            self._sends_done.wait_for(lambda: self._in_flight == 0)
+
+    def _take_pending(self) -> list[LapAndSession]:
+        """Detach the pending batch and cancel the flush timer. Caller holds the lock.
+
+        A non-empty batch counts as in flight until ``_send`` has finished with it.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = self._pending
+        self._pending = []
+        if batch:
+            self._in_flight += 1
+        return batch
+
+    def _send(self, batch: list[LapAndSession]) -> None:
+        try:
+            self._upload(batch)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._sends_done.notify_all()
+
+    def _upload(self, batch: list[LapAndSession]) -> None:
+        try:
+            body = LapBatchUploadRequest(
+                laps=[
+                    LapBatchUploadItem(
+                        lap=ApiLapTelemetry.from_dict(data.LapTelemetry.json_dump),
+                        session=ApiSessionFrame.from_dict(data.SessionFrame.json_dump),
+                        lap_id=data.lap_id,
+                    )
+                    for data in batch
+                ]
+            )
+
+            response = upload_laps_batch.sync(client=self.api_client, body=body)
+            error_msg = None if isinstance(response, LapBatchUploadResponse) else str(response)
+
+        except Exception as e:
+            error_msg = str(e)
+
+        if error_msg is None:
+            logger.info("✓ Uploaded batch of %d laps", len(batch))
+        else:
+            logger.error("✗ Failed to upload batch of %d laps: %s", len(batch), error_msg)
+
+        for data in batch:
+            self.on_result(data, error_msg)
+
+
 class LapUploadHandler:
-    def __init__(self, event_bus: EventBus, api_client: AuthenticatedClient | Client):
+    def __init__(
+        self,
+        event_bus: EventBus,
+        api_client: AuthenticatedClient | Client,
+        max_batch_size: int = 1,
+        max_delay_ms: float = 2000.0,
+    ):
+        """Initialize the lap upload handler.
+
+        Args:
+            event_bus: The event bus for publishing upload results
+            api_client: The API client for server communication
+            max_batch_size: Laps per upload request. With 1, every lap is uploaded as soon
+                as it completes; larger values batch laps through ``LapUploadBatcher``.
+            max_delay_ms: Maximum time a lap waits for its batch to fill up
+        """
         self.event_bus = event_bus
         self.api_client = api_client
 
+        self.batcher: LapUploadBatcher | None = None
+        if max_batch_size > 1:
+            self.batcher = LapUploadBatcher(
+                api_client,
+                on_result=self._publish_result,
+                max_batch_size=max_batch_size,
+                max_delay_ms=max_delay_ms,
+            )
+
     @method_handles(SystemEvents.LAP_TELEMETRY_SEQUENCE)
     def handle_lap_complete_event(self, context: HandlerContext[LapAndSession]):
         """Handle the lap complete event."""
@@ -33,60 +218,73 @@ class LapUploadHandler:
             logger.error("Lap telemetry or session frame is missing.")
             return
 
-        lap_number = data.LapTelemetry.frames[0].lap_number if data.LapTelemetry.frames else -1
+        if self.batcher is not None:
+            self.batcher.add(data)
+            return
 
-        try:
-            # Convert Pydantic models to API client models
-            body = BodyUploadLap(
-                lap=ApiLapTelemetry.from_dict(data.LapTelemetry.model_dump(mode="json")),
-                session=ApiSessionFrame.from_dict(data.SessionFrame.model_dump(mode="json")),
-            )
+        lap_number = _lap_number(data)
 
-            # Upload the lap telemetry to the server with client-generated lap_id
-            response = upload_lap.sync(
-                client=self.api_client,
-                body=body,
-                lap_id=data.lap_id,
+        try:
+            # Stream the lap telemetry to the server with client-generated lap_id
+            template = self._lap_upload_template
+            request = httpx.Request(
+                "POST",
+                template.url.copy_merge_params({"lap_id": str(data.lap_id)}),
+                headers=template.headers,
+                content=iter_lap_upload_body(data),
+                extensions=template.extensions,
             )
+            response = self.api_client.get_httpx_client().send(request)
 
-            if isinstance(response, LapUploadResponse):
-                logger.info(f"✓ Lap {lap_number} uploaded successfully (lap_id: {data.lap_id})")
-                self.event_bus.thread_safe_publish(
-                    Event(
-                        type=SystemEvents.LAP_UPLOAD_SUCCESS,
-                        data=LapUploadResult(
-                            lap_id=data.lap_id,
-                            lap_number=lap_number,
-                            success=True,
-                        ),
-                    )
-                )
+            if response.status_code == 200:
+                logger.info("✓ Lap %s uploaded successfully (lap_id: %s)", lap_number, data.lap_id)
+                self._publish_result(data, None)
             else:
-                error_msg = str(response)
-                logger.error(f"✗ Failed to upload lap {lap_number}: {error_msg}")
-                self.event_bus.thread_safe_publish(
-                    Event(
-                        type=SystemEvents.LAP_UPLOAD_FAILED,
-                        data=LapUploadResult(
-                            lap_id=data.lap_id,
-                            lap_number=lap_number,
-                            success=False,
-                            error_message=error_msg,
-                        ),
-                    )
-                )
+                error_msg = f"HTTP {response.status_code}: {response.text}"
+                logger.error("✗ Failed to upload lap %s: %s", lap_number, error_msg)
+                self._publish_result(data, error_msg)
 
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"✗ Failed to upload lap {lap_number}: {error_msg}")
-            self.event_bus.thread_safe_publish(
-                Event(
-                    type=SystemEvents.LAP_UPLOAD_FAILED,
-                    data=LapUploadResult(
-                        lap_id=data.lap_id,
-                        lap_number=lap_number,
-                        success=False,
-                        error_message=error_msg,
-                    ),
-                )
+            logger.error("✗ Failed to upload lap %s: %s", lap_number, error_msg)
+            self._publish_result(data, error_msg)
+
+    @cached_property
+    def _lap_upload_template(self) -> httpx.Request:
+        """Request for the upload_lap endpoint, built once and reused for every lap.
+
+        ``build_request`` joins the URL with the base URL and merges the client's default
+        headers, cookies and timeout on every call. Doing it once leaves only the query
+        parameter and body to fill in per lap.
+        """
+        template = self.api_client.get_httpx_client().build_request(
+            "POST",
+            "/api/v1/telemetry/lap",
+            headers={"Content-Type": "application/json"},
+        )
+        # The body is streamed, so let each request use chunked transfer encoding
+        del template.headers["Content-Length"]
+        return template
+
+    def close(self) -> None:
+        """Upload any laps still waiting in the batcher and wait for uploads in flight."""
+        if self.batcher is not None:
+            self.batcher.close()
+
+    def _publish_result(self, data: LapAndSession, error_msg: str | None) -> None:
+        """Publish the upload outcome for a single lap."""
+        self.event_bus.thread_safe_publish(
+            Event(
+                type=(
+                    SystemEvents.LAP_UPLOAD_SUCCESS
+                    if error_msg is None
+                    else SystemEvents.LAP_UPLOAD_FAILED
+                ),
+                data=LapUploadResult(
+                    lap_id=data.lap_id,
+                    lap_number=_lap_number(data),
+                    success=error_msg is None,
+                    error_message=error_msg,
+                ),
             )
+        )
@@ -4,14 +4,16 @@ This handler listens to LAP_METRICS_EXTRACTED events and uploads the metrics
 to the Racing Coach server.
 """
 
+import json
 import logging
 from dataclasses import asdict
+from functools import cached_property
 
+import httpx
 from racing_coach_core.events import Event, EventBus, HandlerContext, SystemEvents
 from racing_coach_core.events.checking import method_handles
 from racing_coach_core.schemas.events import MetricsAndSession, MetricsUploadResult
 from racing_coach_server_client import AuthenticatedClient, Client
-from racing_coach_server_client.api.metrics import upload_lap_metrics
 from racing_coach_server_client.models import LapMetrics as ApiLapMetrics
 from racing_coach_server_client.models import MetricsUploadRequest, MetricsUploadResponse
 
@@ -56,15 +58,23 @@ class MetricsUploadHandler:
             )
 
             # Upload the lap metrics to the server
-            response = upload_lap_metrics.sync(
-                client=self.api_client,
-                body=body,
+            template = self._metrics_upload_template
+            request = httpx.Request(
+                "POST",
+                template.url,
+                headers=template.headers,
+                content=json.dumps(body.to_dict()).encode(),
+                extensions=template.extensions,
             )
+            response = self.api_client.get_httpx_client().send(request)
 
-            if isinstance(response, MetricsUploadResponse):
-                lap_num = lap_metrics.lap_number
-                metrics_id = response.lap_metrics_id
-                logger.info(f"✓ Lap {lap_num} metrics uploaded (id: {metrics_id})")
+            if response.status_code == 200:
+                parsed = MetricsUploadResponse.from_dict(response.json())
+                logger.info(
+                    "✓ Lap %s metrics uploaded (id: %s)",
+                    lap_metrics.lap_number,
+                    parsed.lap_metrics_id,
+                )
                 self.event_bus.thread_safe_publish(
                     Event(
                         type=SystemEvents.METRICS_UPLOAD_SUCCESS,
@@ -76,9 +86,9 @@ class MetricsUploadHandler:
                     )
                 )
             else:
-                error_msg = str(response)
+                error_msg = f"HTTP {response.status_code}: {response.text}"
                 logger.error(
-                    f"✗ Failed to upload metrics for lap {lap_metrics.lap_number}: {error_msg}"
+                    "✗ Failed to upload metrics for lap %s: %s", lap_metrics.lap_number, error_msg
                 )
                 self.event_bus.thread_safe_publish(
                     Event(
@@ -95,7 +105,7 @@ class MetricsUploadHandler:
         except Exception as e:
             error_msg = str(e)
             logger.error(
-                f"✗ Failed to upload metrics for lap {lap_metrics.lap_number}: {error_msg}"
+                "✗ Failed to upload metrics for lap %s: %s", lap_metrics.lap_number, error_msg
             )
             self.event_bus.thread_safe_publish(
                 Event(
@@ -108,3 +118,19 @@ class MetricsUploadHandler:
                     ),
                 )
             )
+
+    @cached_property
+    def _metrics_upload_template(self) -> httpx.Request:
+        """Request for the upload_lap_metrics endpoint, built once and reused for every lap.
+
+        Resolving the URL against the base URL and merging the client's default headers
+        happens here once, so each upload only encodes its body.
+        """
+        template = self.api_client.get_httpx_client().build_request(
+            "POST",
+            "/api/v1/metrics/lap",
+            headers={"Content-Type": "application/json"},
+        )
+        # Each request sets the Content-Length of its own body
+        del template.headers["Content-Length"]
+        return template
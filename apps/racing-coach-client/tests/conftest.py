@@ -277,36 +277,36 @@ def _create_telemetry_data_dict(telemetry_data: TelemetryFrame) -> dict[str, Any
         "PlayerTrackSurface": telemetry_data.track_surface,
         "OnPitRoad": telemetry_data.on_pit_road,
         # Tire temps
-        "LFtempCL": telemetry_data.tire_temps["LF"]["left"],
-        "LFtempCM": telemetry_data.tire_temps["LF"]["middle"],
-        "LFtempCR": telemetry_data.tire_temps["LF"]["right"],
-        "RFtempCL": telemetry_data.tire_temps["RF"]["left"],
-        "RFtempCM": telemetry_data.tire_temps["RF"]["middle"],
-        "RFtempCR": telemetry_data.tire_temps["RF"]["right"],
-        "LRtempCL": telemetry_data.tire_temps["LR"]["left"],
-        "LRtempCM": telemetry_data.tire_temps["LR"]["middle"],
-        "LRtempCR": telemetry_data.tire_temps["LR"]["right"],
-        "RRtempCL": telemetry_data.tire_temps["RR"]["left"],
-        "RRtempCM": telemetry_data.tire_temps["RR"]["middle"],
-        "RRtempCR": telemetry_data.tire_temps["RR"]["right"],
+        "LFtempCL": telemetry_data.lf_tire_temp_left,
+        "LFtempCM": telemetry_data.lf_tire_temp_middle,
+        "LFtempCR": telemetry_data.lf_tire_temp_right,
+        "RFtempCL": telemetry_data.rf_tire_temp_left,
+        "RFtempCM": telemetry_data.rf_tire_temp_middle,
+        "RFtempCR": telemetry_data.rf_tire_temp_right,
+        "LRtempCL": telemetry_data.lr_tire_temp_left,
+        "LRtempCM": telemetry_data.lr_tire_temp_middle,
+        "LRtempCR": telemetry_data.lr_tire_temp_right,
+        "RRtempCL": telemetry_data.rr_tire_temp_left,
+        "RRtempCM": telemetry_data.rr_tire_temp_middle,
+        "RRtempCR": telemetry_data.rr_tire_temp_right,
         # Tire wear
-        "LFwearL": telemetry_data.tire_wear["LF"]["left"],
-        "LFwearM": telemetry_data.tire_wear["LF"]["middle"],
-        "LFwearR": telemetry_data.tire_wear["LF"]["right"],
-        "RFwearL": telemetry_data.tire_wear["RF"]["left"],
-        "RFwearM": telemetry_data.tire_wear["RF"]["middle"],
-        "RFwearR": telemetry_data.tire_wear["RF"]["right"],
-        "LRwearL": telemetry_data.tire_wear["LR"]["left"],
-        "LRwearM": telemetry_data.tire_wear["LR"]["middle"],
-        "LRwearR": telemetry_data.tire_wear["LR"]["right"],
-        "RRwearL": telemetry_data.tire_wear["RR"]["left"],
-        "RRwearM": telemetry_data.tire_wear["RR"]["middle"],
-        "RRwearR": telemetry_data.tire_wear["RR"]["right"],
+        "LFwearL": telemetry_data.lf_tire_wear_left,
+        "LFwearM": telemetry_data.lf_tire_wear_middle,
+        "LFwearR": telemetry_data.lf_tire_wear_right,
+        "RFwearL": telemetry_data.rf_tire_wear_left,
+        "RFwearM": telemetry_data.rf_tire_wear_middle,
+        "RFwearR": telemetry_data.rf_tire_wear_right,
+        "LRwearL": telemetry_data.lr_tire_wear_left,
+        "LRwearM": telemetry_data.lr_tire_wear_middle,
+        "LRwearR": telemetry_data.lr_tire_wear_right,
+        "RRwearL": telemetry_data.rr_tire_wear_left,
+        "RRwearM": telemetry_data.rr_tire_wear_middle,
+        "RRwearR": telemetry_data.rr_tire_wear_right,
         # Brake pressure
-        "LFbrakeLinePress": telemetry_data.brake_line_pressure["LF"],
-        "RFbrakeLinePress": telemetry_data.brake_line_pressure["RF"],
-        "LRbrakeLinePress": telemetry_data.brake_line_pressure["LR"],
-        "RRbrakeLinePress": telemetry_data.brake_line_pressure["RR"],
+        "LFbrakeLinePress": telemetry_data.lf_brake_pressure,
+        "RFbrakeLinePress": telemetry_data.rf_brake_pressure,
+        "LRbrakeLinePress": telemetry_data.lr_brake_pressure,
+        "RRbrakeLinePress": telemetry_data.rr_brake_pressure,
     }
 
 
@@ -0,0 +1,239 @@
+"""Tests for LapUploadHandler and LapUploadBatcher."""
+
+import json
+import threading
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+from racing_coach_client.handlers.lap_upload_handler import (
+    LapUploadBatcher,
+    LapUploadHandler,
+    iter_lap_upload_body,
+)
+from racing_coach_core.events.base import EventBus, SystemEvents
+from racing_coach_core.schemas.events import LapAndSession
+from racing_coach_core.schemas.telemetry import LapTelemetry, SessionFrame
+from racing_coach_server_client import Client
+from racing_coach_server_client.models import LapBatchUploadResponse
+
+from tests.factories import LapAndSessionFactory, LapTelemetryFactory, TelemetryFrameFactory
+
+_BATCH_SYNC = "racing_coach_client.handlers.lap_upload_handler.upload_laps_batch.sync"
+
+
+def _batch_response(laps: list[LapAndSession]) -> LapBatchUploadResponse:
+    return LapBatchUploadResponse(
+        status="success",
+        message=f"Received {len(laps)} laps",
+        lap_ids=[str(lap.lap_id) for lap in laps],
+    )
+
+
+@pytest.mark.unit
+class TestStreamedUploadBody:
+    """Unit tests for the streamed upload_lap request body."""
+
+    @pytest.mark.parametrize("frame_count", [1, 256, 600])
+    def test_body_is_valid_upload_json(
+        self,
+        frame_count: int,
+        lap_and_session_factory: LapAndSessionFactory,
+        lap_telemetry_factory: LapTelemetryFactory,
+        telemetry_frame_factory: TelemetryFrameFactory,
+    ) -> None:
+        """Test that the joined chunks decode to the original lap and session."""
+        lap = lap_telemetry_factory.build(frames=telemetry_frame_factory.batch(frame_count))
+        data = lap_and_session_factory.build(LapTelemetry=lap)
+
+        body = json.loads(b"".join(iter_lap_upload_body(data)))
+
+        assert LapTelemetry.model_validate(body["lap"]) == lap
+        assert SessionFrame.model_validate(body["session"]) == data.SessionFrame
+
+    def test_handler_streams_single_lap(
+        self, lap_and_session_factory: LapAndSessionFactory
+    ) -> None:
+        """Test that an unbatched lap is posted as a chunked body and reported once."""
+        requests: list[httpx.Request] = []
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            request.read()
+            requests.append(request)
+            return httpx.Response(200, json={"status": "success", "message": "", "lap_id": ""})
+
+        api_client = Client(base_url="http://test", headers={"Authorization": "Bearer token"})
+        api_client.set_httpx_client(
+            httpx.Client(
+                base_url="http://test",
+                headers={"Authorization": "Bearer token"},
+                transport=httpx.MockTransport(handle),
+            )
+        )
+        mock_bus = MagicMock()
+        handler = LapUploadHandler(mock_bus, api_client)
+        laps = [lap_and_session_factory.build() for _ in range(2)]
+
+        for lap in laps:
+            handler.handle_lap_complete_event(MagicMock(event=MagicMock(data=lap)))
+
+        assert [request.url.params["lap_id"] for request in requests] == [
+            str(lap.lap_id) for lap in laps
+        ]
+        for request, lap in zip(requests, laps, strict=True):
+            assert request.url.path == "/api/v1/telemetry/lap"
+            assert request.headers["Authorization"] == "Bearer token"
+            assert request.headers["Transfer-Encoding"] == "chunked"
+            assert json.loads(request.content)["lap"]["lap_time"] == lap.LapTelemetry.lap_time
+        events = [call.args[0] for call in mock_bus.thread_safe_publish.call_args_list]
+        assert [event.type for event in events] == [SystemEvents.LAP_UPLOAD_SUCCESS] * 2
+
+
+@pytest.mark.unit
+class TestLapUploadBatcher:
+    """Unit tests for LapUploadBatcher."""
+
+    def test_flushes_when_batch_is_full(
+        self, lap_and_session_factory: LapAndSessionFactory
+    ) -> None:
+        """Test that reaching max_batch_size sends one request for all pending laps."""
+        laps = [lap_and_session_factory.build() for _ in range(3)]
+        results: list[tuple[UUID, str | None]] = []
+        batcher = LapUploadBatcher(
+            MagicMock(),
+            on_result=lambda data, error: results.append((data.lap_id, error)),
+            max_batch_size=3,
+            max_delay_ms=60_000,
+        )
+
+        with patch(_BATCH_SYNC, return_value=_batch_response(laps)) as mock_sync:
+            for lap in laps:
+                batcher.add(lap)
+
+        mock_sync.assert_called_once()
+        body = mock_sync.call_args.kwargs["body"]
+        assert [item.lap_id for item in body.laps] == [lap.lap_id for lap in laps]
+        assert results == [(lap.lap_id, None) for lap in laps]
+
+    def test_flush_sends_partial_batch(self, lap_and_session_factory: LapAndSessionFactory) -> None:
+        """Test that flush() uploads pending laps before the batch is full."""
+        lap = lap_and_session_factory.build()
+        results: list[tuple[UUID, str | None]] = []
+        batcher = LapUploadBatcher(
+            MagicMock(),
+            on_result=lambda data, error: results.append((data.lap_id, error)),
+            max_batch_size=10,
+            max_delay_ms=60_000,
+        )
+
+        with patch(_BATCH_SYNC, return_value=_batch_response([lap])) as mock_sync:
+            batcher.add(lap)
+            mock_sync.assert_not_called()
+
+            batcher.close()
+
+        mock_sync.assert_called_once()
+        assert results == [(lap.lap_id, None)]
+
+    def test_close_waits_for_timer_flush_in_flight(
+        self, lap_and_session_factory: LapAndSessionFactory
+    ) -> None:
+        """Test that close() returns only after a concurrent timer flush has reported."""
+        lap = lap_and_session_factory.build()
+        results: list[tuple[UUID, str | None]] = []
+        batcher = LapUploadBatcher(
+            MagicMock(),
+            on_result=lambda data, error: results.append((data.lap_id, error)),
+            max_batch_size=10,
+            max_delay_ms=1,
+        )
+        upload_started = threading.Event()
+        release_upload = threading.Event()
+
+        def blocking_sync(**_: object) -> LapBatchUploadResponse:
+            upload_started.set()
+            release_upload.wait(timeout=5)
+            return _batch_response([lap])
+
+        with patch(_BATCH_SYNC, side_effect=blocking_sync) as mock_sync:
+            batcher.add(lap)
+            assert upload_started.wait(timeout=5)
+
+            closer = threading.Thread(target=batcher.close)
+            closer.start()
+            closer.join(timeout=0.1)
+            assert closer.is_alive()
+            assert results == []
+
+            release_upload.set()
+            closer.join(timeout=5)
+
+        assert not closer.is_alive()
+        mock_sync.assert_called_once()
+        assert results == [(lap.lap_id, None)]
+
+    def test_add_after_close_sends_immediately(
+        self, lap_and_session_factory: LapAndSessionFactory
+    ) -> None:
+        """Test that a closed batcher uploads each lap without waiting for the timer."""
+        lap = lap_and_session_factory.build()
+        results: list[tuple[UUID, str | None]] = []
+        batcher = LapUploadBatcher(
+            MagicMock(),
+            on_result=lambda data, error: results.append((data.lap_id, error)),
+            max_batch_size=10,
+            max_delay_ms=60_000,
+        )
+        batcher.close()
+
+        with patch(_BATCH_SYNC, return_value=_batch_response([lap])) as mock_sync:
+            batcher.add(lap)
+
+        mock_sync.assert_called_once()
+        assert results == [(lap.lap_id, None)]
+
+    def test_failed_batch_reports_error_for_every_lap(
+        self, lap_and_session_factory: LapAndSessionFactory
+    ) -> None:
+        """Test that a failed request is reported for each lap in the batch."""
+        laps = [lap_and_session_factory.build() for _ in range(2)]
+        results: list[tuple[UUID, str | None]] = []
+        batcher = LapUploadBatcher(
+            MagicMock(),
+            on_result=lambda data, error: results.append((data.lap_id, error)),
+            max_batch_size=2,
+        )
+
+        with patch(_BATCH_SYNC, side_effect=ConnectionError("server unavailable")):
+            for lap in laps:
+                batcher.add(lap)
+
+        assert [lap_id for lap_id, _ in results] == [lap.lap_id for lap in laps]
+        assert all(error == "server unavailable" for _, error in results)
+
+
+@pytest.mark.unit
+class TestLapUploadHandlerBatching:
+    """Unit tests for LapUploadHandler with batching enabled."""
+
+    def test_batching_disabled_by_default(self, event_bus: EventBus) -> None:
+        """Test that the handler uploads laps individually unless configured otherwise."""
+        handler = LapUploadHandler(event_bus, MagicMock())
+
+        assert handler.batcher is None
+
+    def test_publishes_result_per_lap(self, lap_and_session_factory: LapAndSessionFactory) -> None:
+        """Test that a batched upload publishes one success event per lap."""
+        mock_bus = MagicMock()
+        handler = LapUploadHandler(mock_bus, MagicMock(), max_batch_size=5, max_delay_ms=60_000)
+        laps = [lap_and_session_factory.build() for _ in range(2)]
+
+        with patch(_BATCH_SYNC, return_value=_batch_response(laps)):
+            for lap in laps:
+                handler.handle_lap_complete_event(MagicMock(event=MagicMock(data=lap)))
+            handler.close()
+
+        events = [call.args[0] for call in mock_bus.thread_safe_publish.call_args_list]
+        assert [event.type for event in events] == [SystemEvents.LAP_UPLOAD_SUCCESS] * 2
+        assert [event.data.lap_id for event in events] == [lap.lap_id for lap in laps]
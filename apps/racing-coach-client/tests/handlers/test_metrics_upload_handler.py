@@ -0,0 +1,88 @@
+"""Tests for MetricsUploadHandler."""
+
+import json
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+from racing_coach_client.handlers.metrics_upload_handler import MetricsUploadHandler
+from racing_coach_core.algs.events import LapMetrics
+from racing_coach_core.events.base import SystemEvents
+from racing_coach_core.schemas.events import MetricsAndSession
+from racing_coach_server_client import Client
+
+from tests.factories import SessionFrameFactory
+
+
+def _metrics_and_session(
+    session_frame_factory: SessionFrameFactory, lap_number: int
+) -> MetricsAndSession:
+    return MetricsAndSession(
+        LapMetrics=LapMetrics(
+            lap_number=lap_number,
+            lap_time=90.5,
+            braking_zones=[],
+            corners=[],
+            total_corners=0,
+            total_braking_zones=0,
+            average_corner_speed=0.0,
+            max_speed=80.0,
+            min_speed=20.0,
+        ),
+        SessionFrame=session_frame_factory.build(),
+        lap_id=uuid4(),
+    )
+
+
+@pytest.mark.unit
+class TestMetricsUploadHandler:
+    """Unit tests for MetricsUploadHandler."""
+
+    @pytest.mark.parametrize(
+        ("status_code", "event_type"),
+        [
+            (200, SystemEvents.METRICS_UPLOAD_SUCCESS),
+            (500, SystemEvents.METRICS_UPLOAD_FAILED),
+        ],
+    )
+    def test_posts_metrics_for_each_lap(
+        self,
+        status_code: int,
+        event_type: SystemEvents,
+        session_frame_factory: SessionFrameFactory,
+    ) -> None:
+        """Test that each lap is posted with the client's headers and reported once."""
+        requests: list[httpx.Request] = []
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                status_code,
+                json={"status": "success", "message": "", "lap_metrics_id": "id"},
+            )
+
+        api_client = Client(base_url="http://test")
+        api_client.set_httpx_client(
+            httpx.Client(
+                base_url="http://test",
+                headers={"Authorization": "Bearer token"},
+                transport=httpx.MockTransport(handle),
+            )
+        )
+        mock_bus = MagicMock()
+        handler = MetricsUploadHandler(mock_bus, api_client)
+        laps = [_metrics_and_session(session_frame_factory, lap_number) for lap_number in (1, 2)]
+
+        for lap in laps:
+            handler.handle_metrics_extracted(MagicMock(event=MagicMock(data=lap)))
+
+        for request, lap in zip(requests, laps, strict=True):
+            assert request.url.path == "/api/v1/metrics/lap"
+            assert request.headers["Authorization"] == "Bearer token"
+            assert request.headers["Content-Length"] == str(len(request.content))
+            body = json.loads(request.content)
+            assert body["lap_id"] == str(lap.lap_id)
+            assert body["lap_metrics"]["lap_number"] == lap.LapMetrics.lap_number
+        events = [call.args[0] for call in mock_bus.thread_safe_publish.call_args_list]
+        assert [event.type for event in events] == [event_type] * 2
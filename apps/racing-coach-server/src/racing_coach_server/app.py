@@ -2,6 +2,7 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from racing_coach_server.config import settings
 from racing_coach_server.logging import setup_logging
@@ -27,5 +28,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses such as lap telemetry for clients that send Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size)
+
 # Include routers
 app.include_router(api_router, prefix="/api/v1")
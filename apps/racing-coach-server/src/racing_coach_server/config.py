@@ -26,5 +26,8 @@ class Settings(BaseSettings):
     # CORS settings - comma-separated list of allowed origins
     cors_origins: str = "http://localhost:3000,http://localhost:4321"
 
+    # Responses at least this large (in bytes) are gzip-compressed for clients that accept it
+    gzip_minimum_size: int = 1000
+
 
 settings = Settings()
@@ -5,16 +5,13 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query
 from racing_coach_core.algs.events import BrakingMetrics, CornerMetrics
+from racing_coach_core.schemas.responses import MetricsUploadResponse
 
 from racing_coach_server.database.engine import transactional_session
 from racing_coach_server.dependencies import AsyncSessionDep, MetricsServiceDep
 from racing_coach_server.metrics.comparison_schemas import LapComparisonResponse
 from racing_coach_server.metrics.comparison_service import LapComparisonService
-from racing_coach_server.metrics.schemas import (
-    LapMetricsResponse,
-    MetricsUploadRequest,
-    MetricsUploadResponse,
-)
+from racing_coach_server.metrics.schemas import LapMetricsResponse, MetricsUploadRequest
 from racing_coach_server.sessions.exceptions import LapNotFoundError
 
 logger = logging.getLogger(__name__)
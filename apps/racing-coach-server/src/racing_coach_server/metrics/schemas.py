@@ -15,14 +15,6 @@ class MetricsUploadRequest(BaseModel):
     lap_id: str  # UUID as string from client
 
 
-class MetricsUploadResponse(BaseModel):
-    """Response model for metrics upload."""
-
-    status: str
-    message: str
-    lap_metrics_id: str  # UUID as string
-
-
 class LapMetricsResponse(BaseModel):
     """Response model for retrieving lap metrics."""
 
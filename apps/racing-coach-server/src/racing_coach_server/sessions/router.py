@@ -15,12 +15,29 @@ from racing_coach_server.sessions.schemas import (
     SessionSummary,
     TelemetryFrameResponse,
 )
+from racing_coach_server.telemetry.models import Lap
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def _lap_detail_response(lap: Lap) -> LapDetailResponse:
+    """Build the lap detail response for a lap loaded with its session and metrics."""
+    return LapDetailResponse(
+        lap_id=str(lap.id),
+        session_id=str(lap.track_session_id),
+        lap_number=lap.lap_number,
+        lap_time=lap.lap_time,
+        is_valid=lap.is_valid,
+        track_name=lap.track_session.track_name,
+        track_config_name=lap.track_session.track_config_name,
+        car_name=lap.track_session.car_name,
+        has_metrics=lap.metrics is not None,
+        created_at=lap.created_at,
+    )
+
+
 @router.get(
     "",
     response_model=SessionListResponse,
@@ -65,6 +82,37 @@ async def list_sessions(
         raise HTTPException(status_code=500, detail=f"Server error: {str(e)}") from e
 
 
+@router.get(
+    "/laps/{lap_id}",
+    response_model=LapDetailResponse,
+    operation_id="getLapDetail",
+    tags=["sessions"],
+)
+async def get_lap_by_id(
+    lap_id: UUID,
+    session_service: SessionServiceDep,
+) -> LapDetailResponse:
+    """
+    Get detailed information about a lap without knowing its session.
+
+    The response includes the lap's session_id, so clients holding only a lap ID can
+    reach the session's other endpoints with one request.
+    """
+    try:
+        lap = await session_service.get_lap_by_id(lap_id)
+
+        if not lap:
+            raise HTTPException(status_code=404, detail=f"Lap {lap_id} not found")
+
+        return _lap_detail_response(lap)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting lap {lap_id}: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Server error: {str(e)}") from e
+
+
 @router.get(
     "/{session_id}",
     response_model=SessionDetailResponse,
@@ -141,18 +189,7 @@ async def get_lap(
                 detail=f"Lap {lap_id} does not belong to session {session_id}",
             )
 
-        return LapDetailResponse(
-            lap_id=str(lap.id),
-            session_id=str(lap.track_session_id),
-            lap_number=lap.lap_number,
-            lap_time=lap.lap_time,
-            is_valid=lap.is_valid,
-            track_name=lap.track_session.track_name,
-            track_config_name=lap.track_session.track_config_name,
-            car_name=lap.track_session.car_name,
-            has_metrics=lap.metrics is not None,
-            created_at=lap.created_at,
-        )
+        return _lap_detail_response(lap)
 
     except HTTPException:
         raise
@@ -201,9 +238,10 @@ async def get_lap_telemetry(
                 detail=f"No telemetry data found for lap {lap_id}",
             )
 
-        # Convert to response format
+        # Convert to response format. The rows were validated when they were uploaded and
+        # the column types match the response fields, so skip validating every frame again.
         frames = [
-            TelemetryFrameResponse(
+            TelemetryFrameResponse.model_construct(
                 timestamp=frame.timestamp,
                 session_time=frame.session_time,
                 lap_number=frame.lap_number,
@@ -238,7 +276,7 @@ async def get_lap_telemetry(
             for frame in telemetry_frames
         ]
 
-        return LapTelemetryResponse(
+        return LapTelemetryResponse.model_construct(
             lap_id=str(lap_id),
             session_id=str(session_id),
             lap_number=lap.lap_number,
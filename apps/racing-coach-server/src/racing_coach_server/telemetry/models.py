@@ -303,42 +303,42 @@ class Telemetry(Base):
             longitude=frame.longitude,
             altitude=frame.altitude,
             # Tire temps - Left Front
-            lf_tire_temp_left=frame.tire_temps.get("LF", {}).get("left"),
-            lf_tire_temp_middle=frame.tire_temps.get("LF", {}).get("middle"),
-            lf_tire_temp_right=frame.tire_temps.get("LF", {}).get("right"),
+            lf_tire_temp_left=frame.lf_tire_temp_left,
+            lf_tire_temp_middle=frame.lf_tire_temp_middle,
+            lf_tire_temp_right=frame.lf_tire_temp_right,
             # Tire temps - Right Front
-            rf_tire_temp_left=frame.tire_temps.get("RF", {}).get("left"),
-            rf_tire_temp_middle=frame.tire_temps.get("RF", {}).get("middle"),
-            rf_tire_temp_right=frame.tire_temps.get("RF", {}).get("right"),
+            rf_tire_temp_left=frame.rf_tire_temp_left,
+            rf_tire_temp_middle=frame.rf_tire_temp_middle,
+            rf_tire_temp_right=frame.rf_tire_temp_right,
             # Tire temps - Left Rear
-            lr_tire_temp_left=frame.tire_temps.get("LR", {}).get("left"),
-            lr_tire_temp_middle=frame.tire_temps.get("LR", {}).get("middle"),
-            lr_tire_temp_right=frame.tire_temps.get("LR", {}).get("right"),
+            lr_tire_temp_left=frame.lr_tire_temp_left,
+            lr_tire_temp_middle=frame.lr_tire_temp_middle,
+            lr_tire_temp_right=frame.lr_tire_temp_right,
             # Tire temps - Right Rear
-            rr_tire_temp_left=frame.tire_temps.get("RR", {}).get("left"),
-            rr_tire_temp_middle=frame.tire_temps.get("RR", {}).get("middle"),
-            rr_tire_temp_right=frame.tire_temps.get("RR", {}).get("right"),
+            rr_tire_temp_left=frame.rr_tire_temp_left,
+            rr_tire_temp_middle=frame.rr_tire_temp_middle,
+            rr_tire_temp_right=frame.rr_tire_temp_right,
             # Tire wear - Left Front
-            lf_tire_wear_left=frame.tire_wear.get("LF", {}).get("left"),
-            lf_tire_wear_middle=frame.tire_wear.get("LF", {}).get("middle"),
-            lf_tire_wear_right=frame.tire_wear.get("LF", {}).get("right"),
+            lf_tire_wear_left=frame.lf_tire_wear_left,
+            lf_tire_wear_middle=frame.lf_tire_wear_middle,
+            lf_tire_wear_right=frame.lf_tire_wear_right,
             # Tire wear - Right Front
-            rf_tire_wear_left=frame.tire_wear.get("RF", {}).get("left"),
-            rf_tire_wear_middle=frame.tire_wear.get("RF", {}).get("middle"),
-            rf_tire_wear_right=frame.tire_wear.get("RF", {}).get("right"),
+            rf_tire_wear_left=frame.rf_tire_wear_left,
+            rf_tire_wear_middle=frame.rf_tire_wear_middle,
+            rf_tire_wear_right=frame.rf_tire_wear_right,
             # Tire wear - Left Rear
-            lr_tire_wear_left=frame.tire_wear.get("LR", {}).get("left"),
-            lr_tire_wear_middle=frame.tire_wear.get("LR", {}).get("middle"),
-            lr_tire_wear_right=frame.tire_wear.get("LR", {}).get("right"),
+            lr_tire_wear_left=frame.lr_tire_wear_left,
+            lr_tire_wear_middle=frame.lr_tire_wear_middle,
+            lr_tire_wear_right=frame.lr_tire_wear_right,
             # Tire wear - Right Rear
-            rr_tire_wear_left=frame.tire_wear.get("RR", {}).get("left"),
-            rr_tire_wear_middle=frame.tire_wear.get("RR", {}).get("middle"),
-            rr_tire_wear_right=frame.tire_wear.get("RR", {}).get("right"),
+            rr_tire_wear_left=frame.rr_tire_wear_left,
+            rr_tire_wear_middle=frame.rr_tire_wear_middle,
+            rr_tire_wear_right=frame.rr_tire_wear_right,
             # Brake pressure
-            lf_brake_pressure=frame.brake_line_pressure.get("LF"),
-            rf_brake_pressure=frame.brake_line_pressure.get("RF"),
-            lr_brake_pressure=frame.brake_line_pressure.get("LR"),
-            rr_brake_pressure=frame.brake_line_pressure.get("RR"),
+            lf_brake_pressure=frame.lf_brake_pressure,
+            rf_brake_pressure=frame.rf_brake_pressure,
+            lr_brake_pressure=frame.lr_brake_pressure,
+            rr_brake_pressure=frame.rr_brake_pressure,
             # Track conditions
             track_temp=frame.track_temp,
             track_wetness=frame.track_wetness,
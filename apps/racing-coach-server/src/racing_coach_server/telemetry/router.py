@@ -4,11 +4,12 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException
-from racing_coach_core.schemas.responses import LapUploadResponse
+from racing_coach_core.schemas.responses import LapBatchUploadResponse, LapUploadResponse
 from racing_coach_core.schemas.telemetry import LapTelemetry, SessionFrame
 
 from racing_coach_server.database.engine import transactional_session
 from racing_coach_server.dependencies import AsyncSessionDep, SessionServiceDep, TelemetryServiceDep
+from racing_coach_server.telemetry.schemas import LapBatchUploadRequest
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +77,66 @@ async def upload_lap(
         raise HTTPException(status_code=500, detail=f"Server error: {str(e)}") from e
 
 
+@router.post(
+    "/laps",
+    response_model=LapBatchUploadResponse,
+    tags=["telemetry"],
+    operation_id="uploadLapsBatch",
+)
+async def upload_laps_batch(
+    request: LapBatchUploadRequest,
+    session_service: SessionServiceDep,
+    telemetry_service: TelemetryServiceDep,
+    db: AsyncSessionDep,
+) -> LapBatchUploadResponse:
+    """
+    Upload several laps with telemetry data in a single request.
+
+    All laps are written in one transaction: if any lap fails, none of them are stored.
+    Sessions shared between laps are looked up once per request.
+    """
+    if not request.laps:
+        raise HTTPException(status_code=400, detail="No laps provided")
+
+    try:
+        async with transactional_session(db):
+            session_ids: dict[UUID, UUID] = {}
+            lap_ids: list[str] = []
+            total_frames = 0
+
+            for item in request.laps:
+                session_id = item.session.session_id
+                if session_id not in session_ids:
+                    db_track_session = await session_service.add_or_get_session(item.session)
+                    session_ids[session_id] = db_track_session.id
+                track_session_id = session_ids[session_id]
+
+                db_lap = await session_service.add_lap(
+                    track_session_id=track_session_id,
+                    lap_number=item.lap.frames[0].lap_number,
+                    lap_id=item.lap_id,
+                )
+
+                await telemetry_service.add_telemetry_sequence(
+                    telemetry_sequence=item.lap, lap_id=db_lap.id, session_id=track_session_id
+                )
+
+                lap_ids.append(str(db_lap.id))
+                total_frames += len(item.lap.frames)
+
+            logger.info(f"Successfully uploaded {len(lap_ids)} laps with {total_frames} frames")
+
+            return LapBatchUploadResponse(
+                status="success",
+                message=f"Received {len(lap_ids)} laps with {total_frames} frames",
+                lap_ids=lap_ids,
+            )
+
+    except Exception as e:
+        logger.error(f"Error uploading lap batch: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Server error: {str(e)}") from e
+
+
 @router.get(
     "/sessions/latest",
     tags=["telemetry"],
@@ -1,5 +1,7 @@
 """Pydantic schemas for telemetry feature request/response models."""
 
+from uuid import UUID
+
 from pydantic import BaseModel
 
 # from racing_coach_core.schemas.responses import LapUploadResponse
@@ -14,3 +16,17 @@ class LapUploadRequest(BaseModel):
 
     lap: LapTelemetry
     session: SessionFrame
+
+
+class LapBatchUploadItem(BaseModel):
+    """A single lap within a batched upload."""
+
+    lap: LapTelemetry
+    session: SessionFrame
+    lap_id: UUID | None = None
+
+
+class LapBatchUploadRequest(BaseModel):
+    """Request model for uploading several laps in one request."""
+
+    laps: list[LapBatchUploadItem]
@@ -78,11 +78,11 @@ class TrackBoundary(TimestampMixin, Base):
             track_id=schema.track_id,
             track_name=schema.track_name,
             track_config_name=schema.track_config_name,
-            grid_distance_pct=schema.grid_distance_pct,
-            left_latitude=schema.left_latitude,
-            left_longitude=schema.left_longitude,
-            right_latitude=schema.right_latitude,
-            right_longitude=schema.right_longitude,
+            grid_distance_pct=schema.grid_distance_pct.tolist(),
+            left_latitude=schema.left_latitude.tolist(),
+            left_longitude=schema.left_longitude.tolist(),
+            right_latitude=schema.right_latitude.tolist(),
+            right_longitude=schema.right_longitude.tolist(),
             grid_size=schema.grid_size,
             source_left_frames=schema.source_left_frames,
             source_right_frames=schema.source_right_frames,
@@ -108,11 +108,11 @@ class TrackBoundaryService:
         if existing:
             # Update existing boundary
             existing.track_name = boundary_schema.track_name
-            existing.grid_distance_pct = boundary_schema.grid_distance_pct
-            existing.left_latitude = boundary_schema.left_latitude
-            existing.left_longitude = boundary_schema.left_longitude
-            existing.right_latitude = boundary_schema.right_latitude
-            existing.right_longitude = boundary_schema.right_longitude
+            existing.grid_distance_pct = boundary_schema.grid_distance_pct.tolist()
+            existing.left_latitude = boundary_schema.left_latitude.tolist()
+            existing.left_longitude = boundary_schema.left_longitude.tolist()
+            existing.right_latitude = boundary_schema.right_latitude.tolist()
+            existing.right_longitude = boundary_schema.right_longitude.tolist()
             existing.grid_size = boundary_schema.grid_size
             existing.source_left_frames = boundary_schema.source_left_frames
             existing.source_right_frames = boundary_schema.source_right_frames
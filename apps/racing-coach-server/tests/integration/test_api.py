@@ -1,6 +1,7 @@
 """Integration tests for API endpoints with real database."""
 
 from typing import Any
+from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient, Response
@@ -9,7 +10,12 @@ from racing_coach_server.telemetry.models import Lap, Telemetry, TrackSession
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from tests.polyfactories import SessionFrameFactory, TelemetryFrameFactory, TrackSessionFactory
+from tests.polyfactories import (
+    LapFactory,
+    SessionFrameFactory,
+    TelemetryFrameFactory,
+    TrackSessionFactory,
+)
 
 
 @pytest.mark.integration
@@ -211,6 +217,51 @@ class TestTelemetryEndpoints:
         assert "No sessions found" in response.json()["detail"]
 
 
+@pytest.mark.integration
+@pytest.mark.slow
+class TestSessionEndpoints:
+    """Integration tests for session API endpoints."""
+
+    async def test_get_lap_by_id_returns_session(
+        self,
+        test_client: AsyncClient,
+        db_session: AsyncSession,
+        track_session_factory: TrackSessionFactory,
+        lap_factory: LapFactory,
+    ) -> None:
+        """Test looking up a lap by ID alone returns the session it belongs to."""
+        # Arrange
+        track_session = track_session_factory.build()
+        db_session.add(track_session)
+        await db_session.flush()
+        lap = lap_factory.build(track_session_id=track_session.id, lap_number=3)
+        db_session.add(lap)
+        await db_session.commit()
+
+        # Act
+        response = await test_client.get(f"/api/v1/sessions/laps/{lap.id}")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["lap_id"] == str(lap.id)
+        assert data["session_id"] == str(track_session.id)
+        assert data["lap_number"] == 3
+        assert data["track_name"] == track_session.track_name
+
+    async def test_get_lap_by_id_not_found(
+        self,
+        test_client: AsyncClient,
+    ) -> None:
+        """Test looking up an unknown lap ID returns 404."""
+        # Act
+        response = await test_client.get(f"/api/v1/sessions/laps/{uuid4()}")
+
+        # Assert
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"]
+
+
 @pytest.mark.integration
 @pytest.mark.slow
 class TestTransactionManagement:
@@ -132,6 +132,110 @@ class TestTelemetryRouter:
         mock_session_service.add_lap.assert_called_once()
         mock_telemetry_service.add_telemetry_sequence.assert_called_once()
 
+    async def test_upload_laps_batch_success(
+        self,
+        telemetry_frame_factory: TelemetryFrameFactory,
+        session_frame_factory: SessionFrameFactory,
+        track_session_factory: TrackSessionFactory,
+    ):
+        """Test uploading several laps for one session in a single request."""
+        # Arrange
+        session_frame = session_frame_factory.build()
+        mock_track_session = track_session_factory.build(id=session_frame.session_id)
+
+        lap_ids = [uuid4(), uuid4()]
+        mock_laps = [
+            Lap(
+                id=lap_id,
+                track_session_id=session_frame.session_id,
+                lap_number=lap_number,
+                lap_time=None,
+                is_valid=False,
+            )
+            for lap_number, lap_id in enumerate(lap_ids, start=1)
+        ]
+
+        mock_session_service = AsyncMock()
+        mock_session_service.add_or_get_session.return_value = mock_track_session
+        mock_session_service.add_lap.side_effect = mock_laps
+
+        mock_telemetry_service = AsyncMock()
+        mock_telemetry_service.add_telemetry_sequence.return_value = None
+
+        mock_db = AsyncMock()
+
+        async def mock_session_service_dep():
+            return mock_session_service
+
+        async def mock_telemetry_service_dep():
+            return mock_telemetry_service
+
+        async def mock_db_dep():
+            return mock_db
+
+        @asynccontextmanager
+        async def mock_transaction(session: AsyncSession):
+            yield session
+
+        from racing_coach_server.database.engine import get_async_session
+        from racing_coach_server.dependencies import (
+            get_session_service,
+            get_telemetry_service,
+        )
+
+        app.dependency_overrides[get_session_service] = mock_session_service_dep
+        app.dependency_overrides[get_telemetry_service] = mock_telemetry_service_dep
+        app.dependency_overrides[get_async_session] = mock_db_dep
+
+        session_data = {
+            **session_frame.model_dump(),
+            "timestamp": session_frame.timestamp.isoformat(),
+            "session_id": str(session_frame.session_id),
+        }
+        data: dict[str, Any] = {
+            "laps": [
+                {
+                    "lap": {
+                        "frames": [
+                            {
+                                **frame.model_dump(),
+                                "timestamp": frame.timestamp.isoformat(),
+                            }
+                            for frame in (
+                                telemetry_frame_factory.build(lap_number=lap_number)
+                                for _ in range(10)
+                            )
+                        ],
+                        "lap_time": 90.5,
+                    },
+                    "session": session_data,
+                    "lap_id": str(lap_id),
+                }
+                for lap_number, lap_id in enumerate(lap_ids, start=1)
+            ]
+        }
+
+        with patch("racing_coach_server.telemetry.router.transactional_session") as mock_txn:
+            mock_txn.side_effect = mock_transaction
+
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                # Act
+                response = await client.post("/api/v1/telemetry/laps", json=data)
+
+        # Clean up override
+        app.dependency_overrides.clear()
+
+        # Assert
+        assert response.status_code == 200
+        body: dict[str, Any] = response.json()
+        assert body["status"] == "success"
+        assert body["lap_ids"] == [str(lap_id) for lap_id in lap_ids]
+        mock_session_service.add_or_get_session.assert_called_once()
+        assert mock_session_service.add_lap.call_count == 2
+        assert mock_telemetry_service.add_telemetry_sequence.call_count == 2
+
     async def test_get_latest_session_success(
         self,
         track_session_factory: TrackSessionFactory,
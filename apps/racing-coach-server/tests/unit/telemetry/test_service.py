@@ -55,19 +55,34 @@ class TestTelemetryService:
 
         # Create a frame with specific tire data
         frame = telemetry_frame_factory.build(
-            tire_temps={
-                "LF": {"left": 80.0, "middle": 85.0, "right": 82.0},
-                "RF": {"left": 81.0, "middle": 86.0, "right": 83.0},
-                "LR": {"left": 78.0, "middle": 83.0, "right": 80.0},
-                "RR": {"left": 79.0, "middle": 84.0, "right": 81.0},
-            },
-            tire_wear={
-                "LF": {"left": 0.95, "middle": 0.93, "right": 0.94},
-                "RF": {"left": 0.94, "middle": 0.92, "right": 0.93},
-                "LR": {"left": 0.96, "middle": 0.94, "right": 0.95},
-                "RR": {"left": 0.95, "middle": 0.93, "right": 0.94},
-            },
-            brake_line_pressure={"LF": 2.5, "RF": 2.5, "LR": 2.0, "RR": 2.0},
+            lf_tire_temp_left=80.0,
+            lf_tire_temp_middle=85.0,
+            lf_tire_temp_right=82.0,
+            rf_tire_temp_left=81.0,
+            rf_tire_temp_middle=86.0,
+            rf_tire_temp_right=83.0,
+            lr_tire_temp_left=78.0,
+            lr_tire_temp_middle=83.0,
+            lr_tire_temp_right=80.0,
+            rr_tire_temp_left=79.0,
+            rr_tire_temp_middle=84.0,
+            rr_tire_temp_right=81.0,
+            lf_tire_wear_left=0.95,
+            lf_tire_wear_middle=0.93,
+            lf_tire_wear_right=0.94,
+            rf_tire_wear_left=0.94,
+            rf_tire_wear_middle=0.92,
+            rf_tire_wear_right=0.93,
+            lr_tire_wear_left=0.96,
+            lr_tire_wear_middle=0.94,
+            lr_tire_wear_right=0.95,
+            rr_tire_wear_left=0.95,
+            rr_tire_wear_middle=0.93,
+            rr_tire_wear_right=0.94,
+            lf_brake_pressure=2.5,
+            rf_brake_pressure=2.5,
+            lr_brake_pressure=2.0,
+            rr_brake_pressure=2.0,
         )
 
         telemetry_sequence = lap_telemetry_factory.build(frames=[frame])
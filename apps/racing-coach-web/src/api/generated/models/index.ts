@@ -92,12 +92,9 @@ export * from "./sessionListResponse";
 export * from "./sessionSummary";
 export * from "./sessionSummaryTrackConfigName";
 export * from "./telemetryFrame";
-export * from "./telemetryFrameBrakeLinePressure";
 export * from "./telemetryFrameResponse";
 export * from "./telemetryFrameResponseAirTemp";
 export * from "./telemetryFrameResponseTrackTemp";
-export * from "./telemetryFrameTireTemps";
-export * from "./telemetryFrameTireWear";
 export * from "./trackBoundaryListResponse";
 export * from "./trackBoundaryResponse";
 export * from "./trackBoundaryResponseTrackConfigName";
@@ -107,6 +104,7 @@ export * from "./trackBoundarySummaryTrackConfigName";
 export * from "./trackBoundarySummaryTrackLength";
 export * from "./trackBoundaryUploadResponse";
 export * from "./trackBoundaryUploadResponseTrackConfigName";
+export * from "./trackSurface";
 export * from "./uploadLapParams";
 export * from "./userResponse";
 export * from "./userResponseDisplayName";
@@ -5,9 +5,7 @@
  * API server for racing telemetry data collection and analysis
  * OpenAPI spec version: 0.1.0
  */
-import type { TelemetryFrameTireTemps } from "./telemetryFrameTireTemps";
-import type { TelemetryFrameTireWear } from "./telemetryFrameTireWear";
-import type { TelemetryFrameBrakeLinePressure } from "./telemetryFrameBrakeLinePressure";
+import type { TrackSurface } from "./trackSurface";
 
 /**
  * A single frame of driving telemetry data.
@@ -73,12 +71,62 @@ export interface TelemetryFrame {
   longitude: number;
   /** Altitude in meters */
   altitude: number;
-  /** Tire temperatures (LF,RF,LR,RR: left,middle,right) */
-  tire_temps: TelemetryFrameTireTemps;
-  /** Tire wear percentage (LF,RF,LR,RR: left,middle,right) */
-  tire_wear: TelemetryFrameTireWear;
-  /** Brake line pressure per wheel in bar */
-  brake_line_pressure: TelemetryFrameBrakeLinePressure;
+  /** Left front tire left temperature in Celsius */
+  lf_tire_temp_left: number;
+  /** Left front tire middle temperature in Celsius */
+  lf_tire_temp_middle: number;
+  /** Left front tire right temperature in Celsius */
+  lf_tire_temp_right: number;
+  /** Right front tire left temperature in Celsius */
+  rf_tire_temp_left: number;
+  /** Right front tire middle temperature in Celsius */
+  rf_tire_temp_middle: number;
+  /** Right front tire right temperature in Celsius */
+  rf_tire_temp_right: number;
+  /** Left rear tire left temperature in Celsius */
+  lr_tire_temp_left: number;
+  /** Left rear tire middle temperature in Celsius */
+  lr_tire_temp_middle: number;
+  /** Left rear tire right temperature in Celsius */
+  lr_tire_temp_right: number;
+  /** Right rear tire left temperature in Celsius */
+  rr_tire_temp_left: number;
+  /** Right rear tire middle temperature in Celsius */
+  rr_tire_temp_middle: number;
+  /** Right rear tire right temperature in Celsius */
+  rr_tire_temp_right: number;
+  /** Left front tire left wear percentage */
+  lf_tire_wear_left: number;
+  /** Left front tire middle wear percentage */
+  lf_tire_wear_middle: number;
+  /** Left front tire right wear percentage */
+  lf_tire_wear_right: number;
+  /** Right front tire left wear percentage */
+  rf_tire_wear_left: number;
+  /** Right front tire middle wear percentage */
+  rf_tire_wear_middle: number;
+  /** Right front tire right wear percentage */
+  rf_tire_wear_right: number;
+  /** Left rear tire left wear percentage */
+  lr_tire_wear_left: number;
+  /** Left rear tire middle wear percentage */
+  lr_tire_wear_middle: number;
+  /** Left rear tire right wear percentage */
+  lr_tire_wear_right: number;
+  /** Right rear tire left wear percentage */
+  rr_tire_wear_left: number;
+  /** Right rear tire middle wear percentage */
+  rr_tire_wear_middle: number;
+  /** Right rear tire right wear percentage */
+  rr_tire_wear_right: number;
+  /** Left front brake line pressure in bar */
+  lf_brake_pressure: number;
+  /** Right front brake line pressure in bar */
+  rf_brake_pressure: number;
+  /** Left rear brake line pressure in bar */
+  lr_brake_pressure: number;
+  /** Right rear brake line pressure in bar */
+  rr_brake_pressure: number;
   /** Track temperature in Celsius */
   track_temp: number;
   /** Track wetness level */
@@ -88,7 +136,7 @@ export interface TelemetryFrame {
   /** Current session flags */
   session_flags: number;
   /** Current track surface type */
-  track_surface: number;
+  track_surface: TrackSurface;
   /** Whether car is on pit road */
   on_pit_road: boolean;
 }
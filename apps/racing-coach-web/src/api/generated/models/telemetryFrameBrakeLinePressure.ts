@@ -1,12 +0,0 @@
-/**
- * Generated by orval v7.17.0 🍺
- * Do not edit manually.
- * Racing Coach Server
- * API server for racing telemetry data collection and analysis
- * OpenAPI spec version: 0.1.0
- */
-
-/**
- * Brake line pressure per wheel in bar
- */
-export type TelemetryFrameBrakeLinePressure = { [key: string]: number };
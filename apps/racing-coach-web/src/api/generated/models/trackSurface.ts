@@ -0,0 +1,22 @@
+/**
+ * Generated by orval v7.17.0 🍺
+ * Do not edit manually.
+ * Racing Coach Server
+ * API server for racing telemetry data collection and analysis
+ * OpenAPI spec version: 0.1.0
+ */
+/**
+
+/**
+ * Surface under the player's car, as reported by the SDK's PlayerTrackSurface.
+ */
+export type TrackSurface = (typeof TrackSurface)[keyof typeof TrackSurface];
+
+// eslint-disable-next-line @typescript-eslint/no-redeclare
+export const TrackSurface = {
+  NUMBER_MINUS_1: -1,
+  NUMBER_0: 0,
+  NUMBER_1: 1,
+  NUMBER_2: 2,
+  NUMBER_3: 3,
+} as const;
@@ -43,8 +43,30 @@ export interface TelemetryFrame {
   position_x: number;
   position_y: number;
   position_z: number;
-  tire_temps: Record<string, Record<string, number>>;
-  tire_wear: Record<string, Record<string, number>>;
+  lf_tire_temp_left: number;
+  lf_tire_temp_middle: number;
+  lf_tire_temp_right: number;
+  rf_tire_temp_left: number;
+  rf_tire_temp_middle: number;
+  rf_tire_temp_right: number;
+  lr_tire_temp_left: number;
+  lr_tire_temp_middle: number;
+  lr_tire_temp_right: number;
+  rr_tire_temp_left: number;
+  rr_tire_temp_middle: number;
+  rr_tire_temp_right: number;
+  lf_tire_wear_left: number;
+  lf_tire_wear_middle: number;
+  lf_tire_wear_right: number;
+  rf_tire_wear_left: number;
+  rf_tire_wear_middle: number;
+  rf_tire_wear_right: number;
+  lr_tire_wear_left: number;
+  lr_tire_wear_middle: number;
+  lr_tire_wear_right: number;
+  rr_tire_wear_left: number;
+  rr_tire_wear_middle: number;
+  rr_tire_wear_right: number;
   track_temp: number;
   air_temp: number;
 }
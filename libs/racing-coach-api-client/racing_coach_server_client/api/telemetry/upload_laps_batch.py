@@ -0,0 +1,186 @@
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.http_validation_error import HTTPValidationError
+from ...models.lap_batch_upload_request import LapBatchUploadRequest
+from ...models.lap_batch_upload_response import LapBatchUploadResponse
+from ...types import Response
+
+
+def _get_kwargs(
+    *,
+    body: LapBatchUploadRequest,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+
+    _kwargs: dict[str, Any] = {
+        "method": "post",
+        "url": "/api/v1/telemetry/laps",
+    }
+
+    _kwargs["json"] = body.to_dict()
+
+    headers["Content-Type"] = "application/json"
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def _parse_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> HTTPValidationError | LapBatchUploadResponse | None:
+    if response.status_code == 200:
+        response_200 = LapBatchUploadResponse.from_dict(response.json())
+
+        return response_200
+
+    if response.status_code == 422:
+        response_422 = HTTPValidationError.from_dict(response.json())
+
+        return response_422
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[HTTPValidationError | LapBatchUploadResponse]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    *,
+    client: AuthenticatedClient | Client,
+    body: LapBatchUploadRequest,
+) -> Response[HTTPValidationError | LapBatchUploadResponse]:
+    """Upload Laps Batch
+
+     Upload several laps with telemetry data in a single request.
+
+    All laps are written in one transaction: if any lap fails, none of them are stored.
+    Sessions shared between laps are looked up once per request.
+
+    Args:
+        body (LapBatchUploadRequest): Request model for uploading several laps in one request.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[HTTPValidationError | LapBatchUploadResponse]
+    """
+
+    kwargs = _get_kwargs(
+        body=body,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    *,
+    client: AuthenticatedClient | Client,
+    body: LapBatchUploadRequest,
+) -> HTTPValidationError | LapBatchUploadResponse | None:
+    """Upload Laps Batch
+
+     Upload several laps with telemetry data in a single request.
+
+    All laps are written in one transaction: if any lap fails, none of them are stored.
+    Sessions shared between laps are looked up once per request.
+
+    Args:
+        body (LapBatchUploadRequest): Request model for uploading several laps in one request.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        HTTPValidationError | LapBatchUploadResponse
+    """
+
+    return sync_detailed(
+        client=client,
+        body=body,
+    ).parsed
+
+
+async def asyncio_detailed(
+    *,
+    client: AuthenticatedClient | Client,
+    body: LapBatchUploadRequest,
+) -> Response[HTTPValidationError | LapBatchUploadResponse]:
+    """Upload Laps Batch
+
+     Upload several laps with telemetry data in a single request.
+
+    All laps are written in one transaction: if any lap fails, none of them are stored.
+    Sessions shared between laps are looked up once per request.
+
+    Args:
+        body (LapBatchUploadRequest): Request model for uploading several laps in one request.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[HTTPValidationError | LapBatchUploadResponse]
+    """
+
+    kwargs = _get_kwargs(
+        body=body,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    *,
+    client: AuthenticatedClient | Client,
+    body: LapBatchUploadRequest,
+) -> HTTPValidationError | LapBatchUploadResponse | None:
+    """Upload Laps Batch
+
+     Upload several laps with telemetry data in a single request.
+
+    All laps are written in one transaction: if any lap fails, none of them are stored.
+    Sessions shared between laps are looked up once per request.
+
+    Args:
+        body (LapBatchUploadRequest): Request model for uploading several laps in one request.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        HTTPValidationError | LapBatchUploadResponse
+    """
+
+    return (
+        await asyncio_detailed(
+            client=client,
+            body=body,
+        )
+    ).parsed
@@ -25,6 +25,9 @@ from .device_token_request import DeviceTokenRequest
 from .device_token_response import DeviceTokenResponse
 from .health_check_response import HealthCheckResponse
 from .http_validation_error import HTTPValidationError
+from .lap_batch_upload_item import LapBatchUploadItem
+from .lap_batch_upload_request import LapBatchUploadRequest
+from .lap_batch_upload_response import LapBatchUploadResponse
 from .lap_comparison_response import LapComparisonResponse
 from .lap_comparison_summary import LapComparisonSummary
 from .lap_detail_response import LapDetailResponse
@@ -48,16 +51,12 @@ from .session_frame import SessionFrame
 from .session_list_response import SessionListResponse
 from .session_summary import SessionSummary
 from .telemetry_frame import TelemetryFrame
-from .telemetry_frame_brake_line_pressure import TelemetryFrameBrakeLinePressure
 from .telemetry_frame_response import TelemetryFrameResponse
-from .telemetry_frame_tire_temps import TelemetryFrameTireTemps
-from .telemetry_frame_tire_temps_additional_property import TelemetryFrameTireTempsAdditionalProperty
-from .telemetry_frame_tire_wear import TelemetryFrameTireWear
-from .telemetry_frame_tire_wear_additional_property import TelemetryFrameTireWearAdditionalProperty
 from .track_boundary_list_response import TrackBoundaryListResponse
 from .track_boundary_response import TrackBoundaryResponse
 from .track_boundary_summary import TrackBoundarySummary
 from .track_boundary_upload_response import TrackBoundaryUploadResponse
+from .track_surface import TrackSurface
 from .user_response import UserResponse
 from .validation_error import ValidationError
 
@@ -85,6 +84,9 @@ __all__ = (
     "DeviceTokenResponse",
     "HealthCheckResponse",
     "HTTPValidationError",
+    "LapBatchUploadItem",
+    "LapBatchUploadRequest",
+    "LapBatchUploadResponse",
     "LapComparisonResponse",
     "LapComparisonSummary",
     "LapDetailResponse",
@@ -108,16 +110,12 @@ __all__ = (
     "SessionListResponse",
     "SessionSummary",
     "TelemetryFrame",
-    "TelemetryFrameBrakeLinePressure",
     "TelemetryFrameResponse",
-    "TelemetryFrameTireTemps",
-    "TelemetryFrameTireTempsAdditionalProperty",
-    "TelemetryFrameTireWear",
-    "TelemetryFrameTireWearAdditionalProperty",
     "TrackBoundaryListResponse",
     "TrackBoundaryResponse",
     "TrackBoundarySummary",
     "TrackBoundaryUploadResponse",
+    "TrackSurface",
     "UserResponse",
     "ValidationError",
 )
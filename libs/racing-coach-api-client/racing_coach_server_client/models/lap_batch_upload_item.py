@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+from uuid import UUID
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import UNSET, Unset
+
+if TYPE_CHECKING:
+    from ..models.lap_telemetry import LapTelemetry
+    from ..models.session_frame import SessionFrame
+
+
+T = TypeVar("T", bound="LapBatchUploadItem")
+
+
+@_attrs_define
+class LapBatchUploadItem:
+    """A single lap within a batched upload.
+
+    Attributes:
+        lap (LapTelemetry):
+        session (SessionFrame): Frame of data pertaining to a session.
+        lap_id (None | Unset | UUID):
+    """
+
+    lap: LapTelemetry
+    session: SessionFrame
+    lap_id: None | Unset | UUID = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        lap = self.lap.to_dict()
+
+        session = self.session.to_dict()
+
+        lap_id: None | str | Unset
+        if isinstance(self.lap_id, Unset):
+            lap_id = UNSET
+        elif isinstance(self.lap_id, UUID):
+            lap_id = str(self.lap_id)
+        else:
+            lap_id = self.lap_id
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "lap": lap,
+                "session": session,
+            }
+        )
+        if lap_id is not UNSET:
+            field_dict["lap_id"] = lap_id
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.lap_telemetry import LapTelemetry
+        from ..models.session_frame import SessionFrame
+
+        d = dict(src_dict)
+        lap = LapTelemetry.from_dict(d.pop("lap"))
+
+        session = SessionFrame.from_dict(d.pop("session"))
+
+        def _parse_lap_id(data: object) -> None | Unset | UUID:
+            if data is None:
+                return data
+            if isinstance(data, Unset):
+                return data
+            try:
+                if not isinstance(data, str):
+                    raise TypeError()
+                lap_id_type_0 = UUID(data)
+
+                return lap_id_type_0
+            except (TypeError, ValueError, AttributeError, KeyError):
+                pass
+            return cast(None | Unset | UUID, data)
+
+        lap_id = _parse_lap_id(d.pop("lap_id", UNSET))
+
+        lap_batch_upload_item = cls(
+            lap=lap,
+            session=session,
+            lap_id=lap_id,
+        )
+
+        lap_batch_upload_item.additional_properties = d
+        return lap_batch_upload_item
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
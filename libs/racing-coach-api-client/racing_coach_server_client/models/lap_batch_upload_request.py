@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+if TYPE_CHECKING:
+    from ..models.lap_batch_upload_item import LapBatchUploadItem
+
+
+T = TypeVar("T", bound="LapBatchUploadRequest")
+
+
+@_attrs_define
+class LapBatchUploadRequest:
+    """Request model for uploading several laps in one request.
+
+    Attributes:
+        laps (list[LapBatchUploadItem]):
+    """
+
+    laps: list[LapBatchUploadItem]
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        laps = []
+        for laps_item_data in self.laps:
+            laps_item = laps_item_data.to_dict()
+            laps.append(laps_item)
+
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        field_dict.update(
+            {
+                "laps": laps,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.lap_batch_upload_item import LapBatchUploadItem
+
+        d = dict(src_dict)
+        laps = []
+        _laps = d.pop("laps")
+        for laps_item_data in _laps:
+            laps_item = LapBatchUploadItem.from_dict(laps_item_data)
+
+            laps.append(laps_item)
+
+        lap_batch_upload_request = cls(
+            laps=laps,
+        )
+
+        lap_batch_upload_request.additional_properties = d
+        return lap_batch_upload_request
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
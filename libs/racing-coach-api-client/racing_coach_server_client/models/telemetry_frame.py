@@ -2,20 +2,15 @@ from __future__ import annotations
 
 import datetime
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 from dateutil.parser import isoparse
 
+from ..models.track_surface import TrackSurface
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.telemetry_frame_brake_line_pressure import TelemetryFrameBrakeLinePressure
-    from ..models.telemetry_frame_tire_temps import TelemetryFrameTireTemps
-    from ..models.telemetry_frame_tire_wear import TelemetryFrameTireWear
-
-
 T = TypeVar("T", bound="TelemetryFrame")
 
 
@@ -53,14 +48,39 @@ class TelemetryFrame:
         latitude (float): Latitude in degrees
         longitude (float): Longitude in degrees
         altitude (float): Altitude in meters
-        tire_temps (TelemetryFrameTireTemps): Tire temperatures (LF,RF,LR,RR: left,middle,right)
-        tire_wear (TelemetryFrameTireWear): Tire wear percentage (LF,RF,LR,RR: left,middle,right)
-        brake_line_pressure (TelemetryFrameBrakeLinePressure): Brake line pressure per wheel in bar
+        lf_tire_temp_left (float): Left front tire left temperature in Celsius
+        lf_tire_temp_middle (float): Left front tire middle temperature in Celsius
+        lf_tire_temp_right (float): Left front tire right temperature in Celsius
+        rf_tire_temp_left (float): Right front tire left temperature in Celsius
+        rf_tire_temp_middle (float): Right front tire middle temperature in Celsius
+        rf_tire_temp_right (float): Right front tire right temperature in Celsius
+        lr_tire_temp_left (float): Left rear tire left temperature in Celsius
+        lr_tire_temp_middle (float): Left rear tire middle temperature in Celsius
+        lr_tire_temp_right (float): Left rear tire right temperature in Celsius
+        rr_tire_temp_left (float): Right rear tire left temperature in Celsius
+        rr_tire_temp_middle (float): Right rear tire middle temperature in Celsius
+        rr_tire_temp_right (float): Right rear tire right temperature in Celsius
+        lf_tire_wear_left (float): Left front tire left wear percentage
+        lf_tire_wear_middle (float): Left front tire middle wear percentage
+        lf_tire_wear_right (float): Left front tire right wear percentage
+        rf_tire_wear_left (float): Right front tire left wear percentage
+        rf_tire_wear_middle (float): Right front tire middle wear percentage
+        rf_tire_wear_right (float): Right front tire right wear percentage
+        lr_tire_wear_left (float): Left rear tire left wear percentage
+        lr_tire_wear_middle (float): Left rear tire middle wear percentage
+        lr_tire_wear_right (float): Left rear tire right wear percentage
+        rr_tire_wear_left (float): Right rear tire left wear percentage
+        rr_tire_wear_middle (float): Right rear tire middle wear percentage
+        rr_tire_wear_right (float): Right rear tire right wear percentage
+        lf_brake_pressure (float): Left front brake line pressure in bar
+        rf_brake_pressure (float): Right front brake line pressure in bar
+        lr_brake_pressure (float): Left rear brake line pressure in bar
+        rr_brake_pressure (float): Right rear brake line pressure in bar
         track_temp (float): Track temperature in Celsius
         track_wetness (int): Track wetness level
         air_temp (float): Air temperature in Celsius
         session_flags (int): Current session flags
-        track_surface (int): Current track surface type
+        track_surface (TrackSurface): Surface under the player's car, as reported by the SDK's PlayerTrackSurface.
         on_pit_road (bool): Whether car is on pit road
         timestamp (datetime.datetime | Unset): Timestamp of the telemetry frame
     """
@@ -94,14 +114,39 @@ class TelemetryFrame:
     latitude: float
     longitude: float
     altitude: float
-    tire_temps: TelemetryFrameTireTemps
-    tire_wear: TelemetryFrameTireWear
-    brake_line_pressure: TelemetryFrameBrakeLinePressure
+    lf_tire_temp_left: float
+    lf_tire_temp_middle: float
+    lf_tire_temp_right: float
+    rf_tire_temp_left: float
+    rf_tire_temp_middle: float
+    rf_tire_temp_right: float
+    lr_tire_temp_left: float
+    lr_tire_temp_middle: float
+    lr_tire_temp_right: float
+    rr_tire_temp_left: float
+    rr_tire_temp_middle: float
+    rr_tire_temp_right: float
+    lf_tire_wear_left: float
+    lf_tire_wear_middle: float
+    lf_tire_wear_right: float
+    rf_tire_wear_left: float
+    rf_tire_wear_middle: float
+    rf_tire_wear_right: float
+    lr_tire_wear_left: float
+    lr_tire_wear_middle: float
+    lr_tire_wear_right: float
+    rr_tire_wear_left: float
+    rr_tire_wear_middle: float
+    rr_tire_wear_right: float
+    lf_brake_pressure: float
+    rf_brake_pressure: float
+    lr_brake_pressure: float
+    rr_brake_pressure: float
     track_temp: float
     track_wetness: int
     air_temp: float
     session_flags: int
-    track_surface: int
+    track_surface: TrackSurface
     on_pit_road: bool
     timestamp: datetime.datetime | Unset = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
@@ -165,11 +210,61 @@ class TelemetryFrame:
 
         altitude = self.altitude
 
-        tire_temps = self.tire_temps.to_dict()
+        lf_tire_temp_left = self.lf_tire_temp_left
+
+        lf_tire_temp_middle = self.lf_tire_temp_middle
+
+        lf_tire_temp_right = self.lf_tire_temp_right
+
+        rf_tire_temp_left = self.rf_tire_temp_left
+
+        rf_tire_temp_middle = self.rf_tire_temp_middle
+
+        rf_tire_temp_right = self.rf_tire_temp_right
+
+        lr_tire_temp_left = self.lr_tire_temp_left
+
+        lr_tire_temp_middle = self.lr_tire_temp_middle
+
+        lr_tire_temp_right = self.lr_tire_temp_right
+
+        rr_tire_temp_left = self.rr_tire_temp_left
+
+        rr_tire_temp_middle = self.rr_tire_temp_middle
+
+        rr_tire_temp_right = self.rr_tire_temp_right
+
+        lf_tire_wear_left = self.lf_tire_wear_left
+
+        lf_tire_wear_middle = self.lf_tire_wear_middle
+
+        lf_tire_wear_right = self.lf_tire_wear_right
+
+        rf_tire_wear_left = self.rf_tire_wear_left
+
+        rf_tire_wear_middle = self.rf_tire_wear_middle
+
+        rf_tire_wear_right = self.rf_tire_wear_right
+
+        lr_tire_wear_left = self.lr_tire_wear_left
+
+        lr_tire_wear_middle = self.lr_tire_wear_middle
+
+        lr_tire_wear_right = self.lr_tire_wear_right
+
+        rr_tire_wear_left = self.rr_tire_wear_left
+
+        rr_tire_wear_middle = self.rr_tire_wear_middle
+
+        rr_tire_wear_right = self.rr_tire_wear_right
+
+        lf_brake_pressure = self.lf_brake_pressure
+
+        rf_brake_pressure = self.rf_brake_pressure
 
-        tire_wear = self.tire_wear.to_dict()
+        lr_brake_pressure = self.lr_brake_pressure
 
-        brake_line_pressure = self.brake_line_pressure.to_dict()
+        rr_brake_pressure = self.rr_brake_pressure
 
         track_temp = self.track_temp
 
@@ -179,7 +274,7 @@ class TelemetryFrame:
 
         session_flags = self.session_flags
 
-        track_surface = self.track_surface
+        track_surface = self.track_surface.value
 
         on_pit_road = self.on_pit_road
 
@@ -220,9 +315,34 @@ class TelemetryFrame:
                 "latitude": latitude,
                 "longitude": longitude,
                 "altitude": altitude,
-                "tire_temps": tire_temps,
-                "tire_wear": tire_wear,
-                "brake_line_pressure": brake_line_pressure,
+                "lf_tire_temp_left": lf_tire_temp_left,
+                "lf_tire_temp_middle": lf_tire_temp_middle,
+                "lf_tire_temp_right": lf_tire_temp_right,
+                "rf_tire_temp_left": rf_tire_temp_left,
+                "rf_tire_temp_middle": rf_tire_temp_middle,
+                "rf_tire_temp_right": rf_tire_temp_right,
+                "lr_tire_temp_left": lr_tire_temp_left,
+                "lr_tire_temp_middle": lr_tire_temp_middle,
+                "lr_tire_temp_right": lr_tire_temp_right,
+                "rr_tire_temp_left": rr_tire_temp_left,
+                "rr_tire_temp_middle": rr_tire_temp_middle,
+                "rr_tire_temp_right": rr_tire_temp_right,
+                "lf_tire_wear_left": lf_tire_wear_left,
+                "lf_tire_wear_middle": lf_tire_wear_middle,
+                "lf_tire_wear_right": lf_tire_wear_right,
+                "rf_tire_wear_left": rf_tire_wear_left,
+                "rf_tire_wear_middle": rf_tire_wear_middle,
+                "rf_tire_wear_right": rf_tire_wear_right,
+                "lr_tire_wear_left": lr_tire_wear_left,
+                "lr_tire_wear_middle": lr_tire_wear_middle,
+                "lr_tire_wear_right": lr_tire_wear_right,
+                "rr_tire_wear_left": rr_tire_wear_left,
+                "rr_tire_wear_middle": rr_tire_wear_middle,
+                "rr_tire_wear_right": rr_tire_wear_right,
+                "lf_brake_pressure": lf_brake_pressure,
+                "rf_brake_pressure": rf_brake_pressure,
+                "lr_brake_pressure": lr_brake_pressure,
+                "rr_brake_pressure": rr_brake_pressure,
                 "track_temp": track_temp,
                 "track_wetness": track_wetness,
                 "air_temp": air_temp,
@@ -238,10 +358,6 @@ class TelemetryFrame:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.telemetry_frame_brake_line_pressure import TelemetryFrameBrakeLinePressure
-        from ..models.telemetry_frame_tire_temps import TelemetryFrameTireTemps
-        from ..models.telemetry_frame_tire_wear import TelemetryFrameTireWear
-
         d = dict(src_dict)
         session_time = d.pop("session_time")
 
@@ -301,11 +417,61 @@ class TelemetryFrame:
 
         altitude = d.pop("altitude")
 
-        tire_temps = TelemetryFrameTireTemps.from_dict(d.pop("tire_temps"))
+        lf_tire_temp_left = d.pop("lf_tire_temp_left")
+
+        lf_tire_temp_middle = d.pop("lf_tire_temp_middle")
+
+        lf_tire_temp_right = d.pop("lf_tire_temp_right")
+
+        rf_tire_temp_left = d.pop("rf_tire_temp_left")
+
+        rf_tire_temp_middle = d.pop("rf_tire_temp_middle")
+
+        rf_tire_temp_right = d.pop("rf_tire_temp_right")
+
+        lr_tire_temp_left = d.pop("lr_tire_temp_left")
+
+        lr_tire_temp_middle = d.pop("lr_tire_temp_middle")
+
+        lr_tire_temp_right = d.pop("lr_tire_temp_right")
+
+        rr_tire_temp_left = d.pop("rr_tire_temp_left")
+
+        rr_tire_temp_middle = d.pop("rr_tire_temp_middle")
+
+        rr_tire_temp_right = d.pop("rr_tire_temp_right")
+
+        lf_tire_wear_left = d.pop("lf_tire_wear_left")
+
+        lf_tire_wear_middle = d.pop("lf_tire_wear_middle")
+
+        lf_tire_wear_right = d.pop("lf_tire_wear_right")
+
+        rf_tire_wear_left = d.pop("rf_tire_wear_left")
+
+        rf_tire_wear_middle = d.pop("rf_tire_wear_middle")
+
+        rf_tire_wear_right = d.pop("rf_tire_wear_right")
+
+        lr_tire_wear_left = d.pop("lr_tire_wear_left")
+
+        lr_tire_wear_middle = d.pop("lr_tire_wear_middle")
+
+        lr_tire_wear_right = d.pop("lr_tire_wear_right")
+
+        rr_tire_wear_left = d.pop("rr_tire_wear_left")
+
+        rr_tire_wear_middle = d.pop("rr_tire_wear_middle")
+
+        rr_tire_wear_right = d.pop("rr_tire_wear_right")
+
+        lf_brake_pressure = d.pop("lf_brake_pressure")
+
+        rf_brake_pressure = d.pop("rf_brake_pressure")
 
-        tire_wear = TelemetryFrameTireWear.from_dict(d.pop("tire_wear"))
+        lr_brake_pressure = d.pop("lr_brake_pressure")
 
-        brake_line_pressure = TelemetryFrameBrakeLinePressure.from_dict(d.pop("brake_line_pressure"))
+        rr_brake_pressure = d.pop("rr_brake_pressure")
 
         track_temp = d.pop("track_temp")
 
@@ -315,7 +481,7 @@ class TelemetryFrame:
 
         session_flags = d.pop("session_flags")
 
-        track_surface = d.pop("track_surface")
+        track_surface = TrackSurface(d.pop("track_surface"))
 
         on_pit_road = d.pop("on_pit_road")
 
@@ -356,9 +522,34 @@ class TelemetryFrame:
             latitude=latitude,
             longitude=longitude,
             altitude=altitude,
-            tire_temps=tire_temps,
-            tire_wear=tire_wear,
-            brake_line_pressure=brake_line_pressure,
+            lf_tire_temp_left=lf_tire_temp_left,
+            lf_tire_temp_middle=lf_tire_temp_middle,
+            lf_tire_temp_right=lf_tire_temp_right,
+            rf_tire_temp_left=rf_tire_temp_left,
+            rf_tire_temp_middle=rf_tire_temp_middle,
+            rf_tire_temp_right=rf_tire_temp_right,
+            lr_tire_temp_left=lr_tire_temp_left,
+            lr_tire_temp_middle=lr_tire_temp_middle,
+            lr_tire_temp_right=lr_tire_temp_right,
+            rr_tire_temp_left=rr_tire_temp_left,
+            rr_tire_temp_middle=rr_tire_temp_middle,
+            rr_tire_temp_right=rr_tire_temp_right,
+            lf_tire_wear_left=lf_tire_wear_left,
+            lf_tire_wear_middle=lf_tire_wear_middle,
+            lf_tire_wear_right=lf_tire_wear_right,
+            rf_tire_wear_left=rf_tire_wear_left,
+            rf_tire_wear_middle=rf_tire_wear_middle,
+            rf_tire_wear_right=rf_tire_wear_right,
+            lr_tire_wear_left=lr_tire_wear_left,
+            lr_tire_wear_middle=lr_tire_wear_middle,
+            lr_tire_wear_right=lr_tire_wear_right,
+            rr_tire_wear_left=rr_tire_wear_left,
+            rr_tire_wear_middle=rr_tire_wear_middle,
+            rr_tire_wear_right=rr_tire_wear_right,
+            lf_brake_pressure=lf_brake_pressure,
+            rf_brake_pressure=rf_brake_pressure,
+            lr_brake_pressure=lr_brake_pressure,
+            rr_brake_pressure=rr_brake_pressure,
             track_temp=track_temp,
             track_wetness=track_wetness,
             air_temp=air_temp,
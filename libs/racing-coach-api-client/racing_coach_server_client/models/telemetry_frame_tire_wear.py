@@ -1,59 +0,0 @@
-from __future__ import annotations
-
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
-
-from attrs import define as _attrs_define
-from attrs import field as _attrs_field
-
-if TYPE_CHECKING:
-    from ..models.telemetry_frame_tire_wear_additional_property import TelemetryFrameTireWearAdditionalProperty
-
-
-T = TypeVar("T", bound="TelemetryFrameTireWear")
-
-
-@_attrs_define
-class TelemetryFrameTireWear:
-    """Tire wear percentage (LF,RF,LR,RR: left,middle,right)"""
-
-    additional_properties: dict[str, TelemetryFrameTireWearAdditionalProperty] = _attrs_field(init=False, factory=dict)
-
-    def to_dict(self) -> dict[str, Any]:
-        field_dict: dict[str, Any] = {}
-        for prop_name, prop in self.additional_properties.items():
-            field_dict[prop_name] = prop.to_dict()
-
-        return field_dict
-
-    @classmethod
-    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.telemetry_frame_tire_wear_additional_property import TelemetryFrameTireWearAdditionalProperty
-
-        d = dict(src_dict)
-        telemetry_frame_tire_wear = cls()
-
-        additional_properties = {}
-        for prop_name, prop_dict in d.items():
-            additional_property = TelemetryFrameTireWearAdditionalProperty.from_dict(prop_dict)
-
-            additional_properties[prop_name] = additional_property
-
-        telemetry_frame_tire_wear.additional_properties = additional_properties
-        return telemetry_frame_tire_wear
-
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> TelemetryFrameTireWearAdditionalProperty:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: TelemetryFrameTireWearAdditionalProperty) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
@@ -67,9 +67,34 @@ def create_telemetry_frame(
         latitude=0.0,
         longitude=0.0,
         altitude=0.0,
-        tire_temps={"LF": {"left": 80.0, "middle": 85.0, "right": 82.0}},
-        tire_wear={"LF": {"left": 0.95, "middle": 0.93, "right": 0.94}},
-        brake_line_pressure={"LF": 2.5},
+        lf_tire_temp_left=80.0,
+        lf_tire_temp_middle=85.0,
+        lf_tire_temp_right=82.0,
+        rf_tire_temp_left=0.0,
+        rf_tire_temp_middle=0.0,
+        rf_tire_temp_right=0.0,
+        lr_tire_temp_left=0.0,
+        lr_tire_temp_middle=0.0,
+        lr_tire_temp_right=0.0,
+        rr_tire_temp_left=0.0,
+        rr_tire_temp_middle=0.0,
+        rr_tire_temp_right=0.0,
+        lf_tire_wear_left=0.95,
+        lf_tire_wear_middle=0.93,
+        lf_tire_wear_right=0.94,
+        rf_tire_wear_left=0.0,
+        rf_tire_wear_middle=0.0,
+        rf_tire_wear_right=0.0,
+        lr_tire_wear_left=0.0,
+        lr_tire_wear_middle=0.0,
+        lr_tire_wear_right=0.0,
+        rr_tire_wear_left=0.0,
+        rr_tire_wear_middle=0.0,
+        rr_tire_wear_right=0.0,
+        lf_brake_pressure=2.5,
+        rf_brake_pressure=0.0,
+        lr_brake_pressure=0.0,
+        rr_brake_pressure=0.0,
         track_temp=30.0,
         track_wetness=0,
         air_temp=25.0,
@@ -259,9 +284,9 @@ def benchmark_braking_zones(frame_counts: list[int], iterations: int = 50) -> li
     """Benchmark braking zone extraction for different telemetry sizes."""
     from racing_coach_core.algs.metrics import _extract_braking_zones as py_extract_braking_zones
     from racing_coach_core.rust_ext import (
-        _convert_sequence_to_rust_frames,
         _rs_AnalysisConfig,
         _rs_extract_braking_zones,
+        _sequence_to_rust_columns,
         is_rust_available,
     )
 
@@ -277,7 +302,7 @@ def benchmark_braking_zones(frame_counts: list[int], iterations: int = 50) -> li
 
     for num_frames in frame_counts:
         sequence = generate_realistic_lap(num_frames, num_corners=10)
-        rust_frames = _convert_sequence_to_rust_frames(sequence)
+        rust_columns = _sequence_to_rust_columns(sequence)
         config = _rs_AnalysisConfig()
 
         print(f"\nFrames: {num_frames:,} (~{num_frames/60:.1f}s at 60Hz)")
@@ -288,7 +313,7 @@ def benchmark_braking_zones(frame_counts: list[int], iterations: int = 50) -> li
 
         # Rust implementation
         def rs_braking():
-            return _rs_extract_braking_zones(rust_frames, config=config)
+            return _rs_extract_braking_zones(rust_columns, config=config)
 
         py_results = benchmark_function("Python", py_braking, iterations)
         rs_results = benchmark_function("Rust", rs_braking, iterations)
@@ -303,9 +328,9 @@ def benchmark_corners(frame_counts: list[int], iterations: int = 50) -> list[tup
     """Benchmark corner extraction for different telemetry sizes."""
     from racing_coach_core.algs.metrics import _extract_corners as py_extract_corners
     from racing_coach_core.rust_ext import (
-        _convert_sequence_to_rust_frames,
         _rs_AnalysisConfig,
         _rs_extract_corners,
+        _sequence_to_rust_columns,
         is_rust_available,
     )
 
@@ -321,7 +346,7 @@ def benchmark_corners(frame_counts: list[int], iterations: int = 50) -> list[tup
 
     for num_frames in frame_counts:
         sequence = generate_realistic_lap(num_frames, num_corners=10)
-        rust_frames = _convert_sequence_to_rust_frames(sequence)
+        rust_columns = _sequence_to_rust_columns(sequence)
         config = _rs_AnalysisConfig()
 
         print(f"\nFrames: {num_frames:,} (~{num_frames/60:.1f}s at 60Hz)")
@@ -332,7 +357,7 @@ def benchmark_corners(frame_counts: list[int], iterations: int = 50) -> list[tup
 
         # Rust implementation
         def rs_corners():
-            return _rs_extract_corners(rust_frames, config=config)
+            return _rs_extract_corners(rust_columns, config=config)
 
         py_results = benchmark_function("Python", py_corners, iterations)
         rs_results = benchmark_function("Rust", rs_corners, iterations)
@@ -348,9 +373,9 @@ def benchmark_lap_metrics(frame_counts: list[int], iterations: int = 50) -> list
     from racing_coach_core.algs.metrics import extract_lap_metrics as py_extract_lap_metrics
     from racing_coach_core.rust_ext import (
         _convert_rust_lap_metrics,
-        _convert_sequence_to_rust_frames,
         _rs_AnalysisConfig,
         _rs_extract_lap_metrics,
+        _sequence_to_rust_columns,
         is_rust_available,
     )
 
@@ -366,7 +391,7 @@ def benchmark_lap_metrics(frame_counts: list[int], iterations: int = 50) -> list
 
     for num_frames in frame_counts:
         sequence = generate_realistic_lap(num_frames, num_corners=10)
-        rust_frames = _convert_sequence_to_rust_frames(sequence)
+        rust_columns = _sequence_to_rust_columns(sequence)
         config = _rs_AnalysisConfig()
 
         print(f"\nFrames: {num_frames:,} (~{num_frames/60:.1f}s at 60Hz)")
@@ -377,11 +402,11 @@ def benchmark_lap_metrics(frame_counts: list[int], iterations: int = 50) -> list
 
         # Rust implementation (raw, no conversion)
         def rs_metrics_raw():
-            return _rs_extract_lap_metrics(rust_frames, lap_number=1, config=config)
+            return _rs_extract_lap_metrics(rust_columns, lap_number=1, config=config)
 
         # Rust implementation (with conversion to Python types)
         def rs_metrics_full():
-            result = _rs_extract_lap_metrics(rust_frames, lap_number=1, config=config)
+            result = _rs_extract_lap_metrics(rust_columns, lap_number=1, config=config)
             return _convert_rust_lap_metrics(result)
 
         py_results = benchmark_function("Python", py_metrics, iterations)
@@ -403,7 +428,7 @@ def benchmark_lap_metrics(frame_counts: list[int], iterations: int = 50) -> list
 def benchmark_data_conversion(frame_counts: list[int], iterations: int = 50) -> None:
     """Benchmark the overhead of converting Python data to Rust types."""
     from racing_coach_core.rust_ext import (
-        _convert_sequence_to_rust_frames,
+        _sequence_to_rust_columns,
         is_rust_available,
     )
 
@@ -421,7 +446,7 @@ def benchmark_data_conversion(frame_counts: list[int], iterations: int = 50) ->
         print(f"\nFrames: {num_frames:,}")
 
         def convert():
-            return _convert_sequence_to_rust_frames(sequence)
+            return _sequence_to_rust_columns(sequence)
 
         results = benchmark_function("Conversion", convert, iterations)
         print(f"  Conversion time: {results['mean_ms']:.4f} ms")
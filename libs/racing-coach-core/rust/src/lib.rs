@@ -25,7 +25,7 @@ pub mod utils;
 pub use detection::{extract_braking_zones, extract_corners};
 pub use pipeline::extract_lap_metrics;
 pub use results::{BrakingMetrics, CornerMetrics, LapMetrics};
-pub use types::{AnalysisConfig, TelemetryFrame};
+pub use types::{AnalysisConfig, TelemetryColumns, TelemetryFrame};
 
 // ============================================================================
 // Python-facing wrapper functions
@@ -98,6 +98,73 @@ fn py_extract_corners(
     Ok(extract_corners(&frames, &config))
 }
 
+/// Extract comprehensive lap metrics from column-oriented telemetry.
+///
+/// Same analysis as py_extract_lap_metrics, but takes one float64 buffer per field
+/// instead of a list of TelemetryFrame objects.
+///
+/// # Arguments
+/// * `columns` - Mapping of field name to float64 buffer (e.g. NumPy arrays)
+/// * `lap_number` - The lap number (default: 0)
+/// * `lap_time` - Optional lap time in seconds
+/// * `config` - Optional AnalysisConfig (uses defaults if not provided)
+///
+/// # Returns
+/// * LapMetrics containing all detected events and statistics
+#[pyfunction]
+#[pyo3(signature = (columns, lap_number=0, lap_time=None, config=None))]
+fn py_extract_lap_metrics_from_columns(
+    py: Python<'_>,
+    columns: TelemetryColumns,
+    lap_number: i32,
+    lap_time: Option<f64>,
+    config: Option<AnalysisConfig>,
+) -> PyResult<LapMetrics> {
+    let frames = columns.to_frames(py)?;
+    let config = config.unwrap_or_default();
+    Ok(extract_lap_metrics(&frames, &config, lap_number, lap_time))
+}
+
+/// Extract braking zones from column-oriented telemetry.
+///
+/// # Arguments
+/// * `columns` - Mapping of field name to float64 buffer (e.g. NumPy arrays)
+/// * `config` - Optional AnalysisConfig (uses defaults if not provided)
+///
+/// # Returns
+/// * List of BrakingMetrics for each detected braking zone
+#[pyfunction]
+#[pyo3(signature = (columns, config=None))]
+fn py_extract_braking_zones_from_columns(
+    py: Python<'_>,
+    columns: TelemetryColumns,
+    config: Option<AnalysisConfig>,
+) -> PyResult<Vec<BrakingMetrics>> {
+    let frames = columns.to_frames(py)?;
+    let config = config.unwrap_or_default();
+    Ok(extract_braking_zones(&frames, &config))
+}
+
+/// Extract corners from column-oriented telemetry.
+///
+/// # Arguments
+/// * `columns` - Mapping of field name to float64 buffer (e.g. NumPy arrays)
+/// * `config` - Optional AnalysisConfig (uses defaults if not provided)
+///
+/// # Returns
+/// * List of CornerMetrics for each detected corner
+#[pyfunction]
+#[pyo3(signature = (columns, config=None))]
+fn py_extract_corners_from_columns(
+    py: Python<'_>,
+    columns: TelemetryColumns,
+    config: Option<AnalysisConfig>,
+) -> PyResult<Vec<CornerMetrics>> {
+    let frames = columns.to_frames(py)?;
+    let config = config.unwrap_or_default();
+    Ok(extract_corners(&frames, &config))
+}
+
 /// A simple hello world function to verify Rust + PyO3 integration works.
 ///
 /// Call this from Python to verify the Rust extension is properly installed:
@@ -159,6 +226,9 @@ fn _rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(py_extract_lap_metrics, m)?)?;
     m.add_function(wrap_pyfunction!(py_extract_braking_zones, m)?)?;
     m.add_function(wrap_pyfunction!(py_extract_corners, m)?)?;
+    m.add_function(wrap_pyfunction!(py_extract_lap_metrics_from_columns, m)?)?;
+    m.add_function(wrap_pyfunction!(py_extract_braking_zones_from_columns, m)?)?;
+    m.add_function(wrap_pyfunction!(py_extract_corners_from_columns, m)?)?;
     m.add_function(wrap_pyfunction!(hello_from_rust, m)?)?;
     m.add_function(wrap_pyfunction!(compute_speed_stats, m)?)?;
 
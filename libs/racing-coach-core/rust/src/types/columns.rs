@@ -0,0 +1,76 @@
+//! Column-oriented telemetry input.
+
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+
+use super::TelemetryFrame;
+
+/// A lap of telemetry as one float64 buffer per frame field.
+///
+/// Extracted from any mapping of field name to buffer (e.g. a dict of NumPy arrays), so a
+/// whole lap crosses the Python boundary as eight buffers instead of one object per frame.
+#[derive(FromPyObject)]
+pub struct TelemetryColumns {
+    #[pyo3(item)]
+    brake: PyBuffer<f64>,
+    #[pyo3(item)]
+    throttle: PyBuffer<f64>,
+    #[pyo3(item)]
+    speed: PyBuffer<f64>,
+    #[pyo3(item)]
+    lap_distance: PyBuffer<f64>,
+    #[pyo3(item)]
+    steering_angle: PyBuffer<f64>,
+    #[pyo3(item)]
+    lateral_acceleration: PyBuffer<f64>,
+    #[pyo3(item)]
+    longitudinal_acceleration: PyBuffer<f64>,
+    #[pyo3(item)]
+    timestamp: PyBuffer<f64>,
+}
+
+impl TelemetryColumns {
+    /// Copy the columns into analysis frames.
+    ///
+    /// Returns a `ValueError` if the columns differ in length.
+    pub fn to_frames(&self, py: Python<'_>) -> PyResult<Vec<TelemetryFrame>> {
+        let brake = self.brake.to_vec(py)?;
+        let throttle = self.throttle.to_vec(py)?;
+        let speed = self.speed.to_vec(py)?;
+        let lap_distance = self.lap_distance.to_vec(py)?;
+        let steering_angle = self.steering_angle.to_vec(py)?;
+        let lateral_acceleration = self.lateral_acceleration.to_vec(py)?;
+        let longitudinal_acceleration = self.longitudinal_acceleration.to_vec(py)?;
+        let timestamp = self.timestamp.to_vec(py)?;
+
+        let len = brake.len();
+        let lengths = [
+            throttle.len(),
+            speed.len(),
+            lap_distance.len(),
+            steering_angle.len(),
+            lateral_acceleration.len(),
+            longitudinal_acceleration.len(),
+            timestamp.len(),
+        ];
+        if lengths.iter().any(|&n| n != len) {
+            return Err(PyValueError::new_err(
+                "telemetry columns must all have the same length",
+            ));
+        }
+
+        Ok((0..len)
+            .map(|i| TelemetryFrame {
+                brake: brake[i],
+                steering_angle: steering_angle[i],
+                throttle: throttle[i],
+                speed: speed[i],
+                lap_distance: lap_distance[i],
+                timestamp: timestamp[i],
+                lateral_acceleration: lateral_acceleration[i],
+                longitudinal_acceleration: longitudinal_acceleration[i],
+            })
+            .collect())
+    }
+}
@@ -1,7 +1,9 @@
 //! Input types for telemetry analysis.
 
+mod columns;
 mod config;
 mod frame;
 
+pub use columns::TelemetryColumns;
 pub use config::AnalysisConfig;
 pub use frame::TelemetryFrame;
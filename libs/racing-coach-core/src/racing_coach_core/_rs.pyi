@@ -1,5 +1,6 @@
 """Type stubs for the Rust extension module."""
 
+from collections.abc import Buffer, Mapping
 from typing import Optional
 
 # ============================================================================
@@ -301,6 +302,58 @@ def py_extract_corners(
     """
     ...
 
+def py_extract_lap_metrics_from_columns(
+    columns: Mapping[str, Buffer],
+    lap_number: int = 0,
+    lap_time: float | None = None,
+    config: AnalysisConfig | None = None,
+) -> LapMetrics:
+    """Extract comprehensive lap metrics from column-oriented telemetry.
+
+    Args:
+        columns: Float64 buffer (e.g. NumPy array) per TelemetryFrame field
+        lap_number: The lap number (default: 0)
+        lap_time: Optional lap time in seconds
+        config: Optional AnalysisConfig (uses defaults if not provided)
+
+    Returns:
+        LapMetrics containing all detected events and statistics
+
+    Raises:
+        ValueError: If the columns differ in length
+    """
+    ...
+
+def py_extract_braking_zones_from_columns(
+    columns: Mapping[str, Buffer],
+    config: AnalysisConfig | None = None,
+) -> list[BrakingMetrics]:
+    """Extract braking zones from column-oriented telemetry.
+
+    Args:
+        columns: Float64 buffer (e.g. NumPy array) per TelemetryFrame field
+        config: Optional AnalysisConfig (uses defaults if not provided)
+
+    Returns:
+        List of BrakingMetrics for each detected braking zone
+    """
+    ...
+
+def py_extract_corners_from_columns(
+    columns: Mapping[str, Buffer],
+    config: AnalysisConfig | None = None,
+) -> list[CornerMetrics]:
+    """Extract corners from column-oriented telemetry.
+
+    Args:
+        columns: Float64 buffer (e.g. NumPy array) per TelemetryFrame field
+        config: Optional AnalysisConfig (uses defaults if not provided)
+
+    Returns:
+        List of CornerMetrics for each detected corner
+    """
+    ...
+
 def hello_from_rust(name: str | None = None) -> str:
     """A simple hello world function to verify Rust + PyO3 integration works."""
     ...
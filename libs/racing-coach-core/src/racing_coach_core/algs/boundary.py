@@ -248,20 +248,17 @@ def compute_lateral_positions(
     Returns:
         AugmentedTelemetrySequence with lateral positions
     """
-    lateral_positions: list[float] = []
-
-    for frame in telemetry_sequence.frames:
-        lat_pos = get_lateral_position(
-            track_boundary,
-            frame.lap_distance_pct,
-            frame.latitude,
-            frame.longitude,
-        )
-        lateral_positions.append(lat_pos)
+    arrays = telemetry_sequence.frame_arrays
+    lateral_positions = compute_lateral_positions_vectorized(
+        track_boundary,
+        arrays["lap_distance_pct"],
+        arrays["latitude"],
+        arrays["longitude"],
+    )
 
     return AugmentedTelemetrySequence(
         frames=telemetry_sequence.frames,
-        lateral_positions=lateral_positions,
+        lateral_positions=lateral_positions.tolist(),
     )
 
 
@@ -286,25 +283,9 @@ def compute_lateral_positions_vectorized(
     Returns:
         Array of lateral positions (-1 to 1, can exceed for off-track)
     """
-    # Pre-convert boundary data to numpy arrays
-    left_lat = np.array(track_boundary.left_latitude)
-    left_lon = np.array(track_boundary.left_longitude)
-    right_lat = np.array(track_boundary.right_latitude)
-    right_lon = np.array(track_boundary.right_longitude)
-
-    # Normalize and find grid indices
-    lap_dist_norm = lap_distance_pct % 1.0
-    grid_spacing = 1.0 / track_boundary.grid_size
-    idx_float = lap_dist_norm / grid_spacing
-    idx_low = (idx_float.astype(int)) % track_boundary.grid_size
-    idx_high = (idx_low + 1) % track_boundary.grid_size
-    t = idx_float - idx_float.astype(int)
-
-    # Vectorized interpolation of boundaries
-    interp_left_lat = (1 - t) * left_lat[idx_low] + t * left_lat[idx_high]
-    interp_left_lon = (1 - t) * left_lon[idx_low] + t * left_lon[idx_high]
-    interp_right_lat = (1 - t) * right_lat[idx_low] + t * right_lat[idx_high]
-    interp_right_lon = (1 - t) * right_lon[idx_low] + t * right_lon[idx_high]
+    interp_left_lat, interp_left_lon, interp_right_lat, interp_right_lon = (
+        track_boundary.boundary_at(np.asarray(lap_distance_pct))
+    )
 
     # Vectorized projection
     track_vec_lat = interp_right_lat - interp_left_lat
@@ -313,10 +294,12 @@ def compute_lateral_positions_vectorized(
     car_vec_lon = longitudes - interp_left_lon
 
     track_dot = track_vec_lat**2 + track_vec_lon**2
-    # Avoid division by zero
-    track_dot = np.maximum(track_dot, 1e-12)
+    # Boundaries too close return center, as in _project_to_lateral_position
+    degenerate = track_dot < 1e-12
 
-    projection = (car_vec_lat * track_vec_lat + car_vec_lon * track_vec_lon) / track_dot
-    lateral_positions = 2.0 * projection - 1.0
+    projection = (car_vec_lat * track_vec_lat + car_vec_lon * track_vec_lon) / np.where(
+        degenerate, 1.0, track_dot
+    )
+    lateral_positions = np.where(degenerate, 0.0, 2.0 * projection - 1.0)
 
     return lateral_positions
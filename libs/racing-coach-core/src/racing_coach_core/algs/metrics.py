@@ -209,8 +209,8 @@ def _extract_braking_zones(
 
         end_frame = frames[end_idx]
 
-        # Calculate braking duration
-        duration = (end_frame.timestamp - start_frame.timestamp).total_seconds()
+        # Durations use the SDK session clock, the same time axis as the Rust analysis
+        duration = end_frame.session_time - start_frame.session_time
 
         # Calculate deceleration metrics
         initial_decel = _calculate_deceleration(frames, start_idx, min(start_idx + 5, end_idx))
@@ -274,7 +274,7 @@ def _extract_corners(
         throttle_frame = frames[stats.throttle_application_idx]
 
         # Calculate time and distance
-        time_in_corner = (exit_frame.timestamp - turn_in_frame.timestamp).total_seconds()
+        time_in_corner = exit_frame.session_time - turn_in_frame.session_time
         corner_distance = normalize_lap_distance_delta(
             exit_frame.lap_distance - turn_in_frame.lap_distance
         )
@@ -326,7 +326,7 @@ def _calculate_deceleration(
     speed_delta = end_frame.speed - start_frame.speed
 
     # Time delta (seconds)
-    time_delta = (end_frame.timestamp - start_frame.timestamp).total_seconds()
+    time_delta = end_frame.session_time - start_frame.session_time
 
     if time_delta <= 0:
         return 0.0
@@ -411,7 +411,7 @@ def _compute_corner_metrics(
     throttle_frame = frames[stats.throttle_application_idx]
 
     # Calculate time and distance
-    time_in_corner = (exit_frame.timestamp - turn_in_frame.timestamp).total_seconds()
+    time_in_corner = exit_frame.session_time - turn_in_frame.session_time
     corner_distance = normalize_lap_distance_delta(
         exit_frame.lap_distance - turn_in_frame.lap_distance
     )
@@ -1,9 +1,15 @@
 import asyncio
+import itertools
 import logging
+import operator
+import os
+import sys
+import threading
+import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
 from racing_coach_core.schemas.events import (
@@ -17,14 +23,158 @@ from racing_coach_core.schemas.events import (
 )
 from racing_coach_core.schemas.telemetry import TelemetryFrame
 
+from .ringbuf import MPSCRing
+
+__all__ = [
+    "INLINE_COST_THRESHOLD_US",
+    "Event",
+    "EventBus",
+    "EventBusStats",
+    "EventType",
+    "Handler",
+    "HandlerContext",
+    "HandlerFunc",
+    "HandlerMethod",
+    "HandlerType",
+    "SystemEvents",
+]
+
 logger = logging.getLogger(__name__)
 
+_MAX_BATCH_SIZE = 64
+"""Maximum number of events taken off the queue per consumer iteration."""
+
+INLINE_COST_THRESHOLD_US = 100
+"""Handlers declaring a ``__cost_us__`` below this run on the event loop thread.
+
+Handing a tiny handler to the thread pool and waiting for it costs more than running it.
+"""
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the event bus loop, using uvloop when it is installed.
+
+    uvloop is an optional dependency (``racing-coach-core[fast]``) and is not available on
+    Windows.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop  # pyright: ignore[reportMissingImports]
+        except ImportError:
+            pass
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _pin_worker_to_core(cores: list[int], counter: "itertools.count[int]") -> None:
+    """ThreadPoolExecutor initializer that pins each new worker thread to its own core."""
+    core = cores[next(counter) % len(cores)]
+
+    if hasattr(os, "sched_setaffinity"):
+        # On Linux, pid 0 refers to the calling thread
+        os.sched_setaffinity(0, {core})
+    elif sys.platform == "win32":
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), 1 << core)
+    else:
+        return
+
+    thread = threading.current_thread()
+    thread.name = f"{thread.name}-core{core}"
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to nanoseconds since the epoch without float rounding."""
+    seconds = int(value.replace(microsecond=0).timestamp())
+    return seconds * 1_000_000_000 + value.microsecond * 1000
+
+
+def _replace_at[V](
+    items: tuple[V | None, ...], index: int, value: V | None
+) -> tuple[V | None, ...]:
+    """Return a copy of items with items[index] set to value, padding with None as needed."""
+    padded = list(items) + [None] * (index + 1 - len(items))
+    padded[index] = value
+    return tuple(padded)
+
+
+def _group_handlers(
+    handlers: list["HandlerFunc[Any]"],
+) -> tuple[tuple["HandlerFunc[Any]", ...], ...]:
+    """Partition handlers by their ``__event_group__``, keeping registration order.
+
+    Handlers without a group each form their own group.
+    """
+    groups: dict[Any, list[HandlerFunc[Any]]] = {}
+    for handler in handlers:
+        groups.setdefault(getattr(handler, "__event_group__", id(handler)), []).append(handler)
+    return tuple(tuple(group) for group in groups.values())
+
+
+def _run_group(
+    group: tuple["HandlerFunc[Any]", ...], contexts: list["HandlerContext[Any]"]
+) -> None:
+    """Run a group of handlers for each event in turn in the current worker thread."""
+    for context in contexts:
+        for handler in group:
+            try:
+                handler(context)
+            except Exception:
+                logger.exception(f"Error in handler {handler} for event {context.event.type}")
+
+
+type _Dispatcher = Callable[
+    [asyncio.AbstractEventLoop, list[Event[Any]]], asyncio.Future[None] | None
+]
+"""Runs the handlers of one event type for a run of its events, see _make_dispatcher."""
 
-@dataclass(frozen=True)
+
+def _wait_all(
+    loop: asyncio.AbstractEventLoop, futures: list[asyncio.Future[None]]
+) -> asyncio.Future[None]:
+    """Return a future that completes once all futures are done, however they finished.
+
+    Lighter than ``asyncio.gather`` for results nobody reads: one future and a counter
+    instead of a gathering future that collects every result.
+    """
+    done = loop.create_future()
+    remaining = len(futures)
+
+    def on_done(future: asyncio.Future[None]) -> None:
+        nonlocal remaining
+        if not future.cancelled() and (error := future.exception()) is not None:
+            logger.error(f"Error running handlers: {error}")
+        remaining -= 1
+        if remaining == 0 and not done.done():
+            done.set_result(None)
+
+    for future in futures:
+        future.add_done_callback(on_done)
+    return done
+
+
+_event_type_ids: dict[tuple[str, Any], int] = {}
+"""Index of every distinct event type, see ``EventType._id``."""
+_event_type_ids_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
 class EventType[T]:
     name: str
     # data_type: type = field(default=type[T])
     data_type: type = type[T]
+    # Small integer shared by all equal event types, used by the EventBus to look up
+    # handlers by list index instead of hashing the event type for every event
+    _id: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        key = (self.name, self.data_type)
+        with _event_type_ids_lock:
+            type_id = _event_type_ids.setdefault(key, len(_event_type_ids))
+        object.__setattr__(self, "_id", type_id)
 
     def __repr__(self) -> str:
         return f"EventType<{self.name}>"
@@ -43,14 +193,34 @@ class SystemEvents:
     METRICS_UPLOAD_FAILED: EventType[MetricsUploadResult] = EventType("METRICS_UPLOAD_FAILED")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class Event[T]:
     type: EventType[T]
     data: T
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int
+    """Creation time in nanoseconds since the epoch."""
+
+    def __init__(
+        self,
+        type: EventType[T],
+        data: T,
+        timestamp: datetime | None = None,
+        timestamp_ns: int | None = None,
+    ) -> None:
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns() if timestamp is None else _datetime_to_ns(timestamp)
+        object.__setattr__(self, "type", type)
+        object.__setattr__(self, "data", data)
+        object.__setattr__(self, "timestamp_ns", timestamp_ns)
 
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a naive local datetime, built only when requested."""
+        seconds, nanoseconds = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds) + timedelta(microseconds=nanoseconds // 1000)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class HandlerContext[T]:
     event_bus: "EventBus"
     event: Event[T]
@@ -62,31 +232,84 @@ type HandlerMethod[T] = Callable[[Any, HandlerContext[T]], Any]
 type HandlerType[T] = HandlerFunc[T] | HandlerMethod[T]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Handler[T]:
     type: EventType[T]
     # fn: Callable[[HandlerContext[T]], Any]
     fn: HandlerFunc[T]
 
 
+@dataclass(frozen=True, slots=True)
+class EventBusStats:
+    queued: int
+    """Events waiting in the queue."""
+    dropped: int
+    """Events dropped because the queue was full, since the bus was created."""
+
+
 class EventBus:
     """Event bus for broadcasting events."""
 
     def __init__(
         self,
         max_queue_size: int = 1000,  # 0 = no limit
-        max_workers: int | None = None,  # None = use all available cores
+        max_workers: int | None = None,  # None = one worker per CPU core
         thread_name_prefix: str = "EventHandler",
+        pin_workers: bool = False,
     ) -> None:
-        """Initialize the event bus."""
+        """Initialize the event bus.
+
+        Args:
+            max_queue_size: Maximum number of queued events, 0 for no limit
+            max_workers: Number of handler threads. Defaults to the number of CPU cores
+                rather than ThreadPoolExecutor's ``cpu_count() + 4``, since handlers are
+                mostly CPU-bound.
+            thread_name_prefix: Name prefix of the handler threads
+            pin_workers: Pin each handler thread to its own CPU core, leaving the first
+                core to the event loop thread. Reduces context switches and keeps a
+                handler's data in the same core's caches. Supported on Linux and Windows.
+        """
 
         self._handlers: dict[EventType[Any], list[HandlerFunc[Any]]] = {}
+        # Dispatch function for each event type with queued handlers, indexed by
+        # EventType._id and built by _make_dispatcher. Replaced as a whole whenever the
+        # handlers change; None for event types without queued handlers, and event types
+        # created after the last change may be past its end.
+        self._dispatchers: tuple[_Dispatcher | None, ...] = ()
+        # Snapshot of the handlers marked with ``__event_sync__``, indexed the same way.
+        # They are called inline by the publisher and never go through the queue or the
+        # thread pool.
+        self._sync_handlers: tuple[tuple[HandlerFunc[Any], ...] | None, ...] = ()
         self._max_queue_size = max_queue_size
-        self._queue: asyncio.Queue[Event[Any]] | None = None  # Created in start()
+        self._queue: MPSCRing[Event[Any]] | None = None  # Created in start()
+        # Set to wake the consumer task when it is waiting for events (see _process_events)
+        self._wakeup: asyncio.Event | None = None
+        self._consumer_idle = False
+        # Set by the consumer whenever it frees up queue slots, for publishers waiting on a
+        # full queue
+        self._not_full: asyncio.Event | None = None
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        initializer = None
+        initargs: tuple[Any, ...] = ()
+        if pin_workers:
+            cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+            cores = cores or list(range(os.cpu_count() or 1))
+            # Reserve the first core for the event loop thread when there are enough
+            worker_cores = cores[1:] if len(cores) > 1 else cores
+            initializer = _pin_worker_to_core
+            initargs = (worker_cores, itertools.count())
+
         self._thread_pool = ThreadPoolExecutor(
-            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+            max_workers=max_workers,
+            thread_name_prefix=thread_name_prefix,
+            initializer=initializer,
+            initargs=initargs,
         )
         self._running: bool = False
+        self._dropped_events = 0
+        self._dropped_events_lock = threading.Lock()
         # self._process_task: asyncio.Task | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
 
@@ -101,11 +324,13 @@ class EventBus:
 
         if handler not in self._handlers[event_type]:
             self._handlers[event_type].append(handler)
+            self._update_groups(event_type)
             logger.info(f"Added handler {handler} for event {event_type}")
 
     def register_handler(self, handler: Handler[Any]) -> None:
         """Register a new event handler."""
         self._handlers.setdefault(handler.type, []).append(handler.fn)
+        self._update_groups(handler.type)
         logger.info(f"Registered handler {handler.fn} for event {handler.type}")
 
     def register_handlers(self, handlers: list[Handler[Any]]) -> None:
@@ -115,8 +340,91 @@ class EventBus:
     def unsubscribe[T](self, event_type: EventType[T], handler: HandlerFunc[T]) -> None:
         if event_type in self._handlers and handler in self._handlers[event_type]:
             self._handlers[event_type].remove(handler)
+            self._update_groups(event_type)
             logger.info(f"Removed handler {handler} for event {event_type}")
 
+    def _update_groups(self, event_type: EventType[Any]) -> None:
+        """Publish new handler snapshots after the handlers of an event type changed."""
+        sync_handlers: list[HandlerFunc[Any]] = []
+        inline_handlers: list[HandlerFunc[Any]] = []
+        queued_handlers: list[HandlerFunc[Any]] = []
+        for handler in self._handlers[event_type]:
+            cost_us = getattr(handler, "__cost_us__", None)
+            if getattr(handler, "__event_sync__", False):
+                sync_handlers.append(handler)
+            elif cost_us is not None and cost_us < INLINE_COST_THRESHOLD_US:
+                inline_handlers.append(handler)
+            else:
+                queued_handlers.append(handler)
+
+        self._sync_handlers = _replace_at(
+            self._sync_handlers, event_type._id, tuple(sync_handlers) or None
+        )
+        self._dispatchers = _replace_at(
+            self._dispatchers,
+            event_type._id,
+            self._make_dispatcher(_group_handlers(queued_handlers), tuple(inline_handlers))
+            if queued_handlers or inline_handlers
+            else None,
+        )
+
+    def _make_dispatcher(
+        self,
+        groups: tuple[tuple[HandlerFunc[Any], ...], ...],
+        inline: tuple[HandlerFunc[Any], ...],
+    ) -> _Dispatcher:
+        """Build the dispatch function for one event type's handlers.
+
+        Each handler group is submitted to the thread pool while the inline handlers run on
+        the loop thread. The dispatcher returns a future that completes when every group
+        has finished, or None if there is nothing to wait for. Handlers are bound in the
+        closure so dispatching does no lookups, and the common shapes (only inline
+        handlers, a single group) skip the parts they do not need.
+        """
+        pool = self._thread_pool
+
+        def contexts_for(events: list[Event[Any]]) -> list[HandlerContext[Any]]:
+            # Positional arguments: keyword matching costs a third of the construction time
+            return [HandlerContext(self, event) for event in events]
+
+        if not groups:
+
+            def dispatch_inline(
+                loop: asyncio.AbstractEventLoop, events: list[Event[Any]]
+            ) -> asyncio.Future[None] | None:
+                _run_group(inline, contexts_for(events))
+                return None
+
+            return dispatch_inline
+
+        if len(groups) == 1 and not inline:
+            (group,) = groups
+
+            def dispatch_one(
+                loop: asyncio.AbstractEventLoop, events: list[Event[Any]]
+            ) -> asyncio.Future[None] | None:
+                return loop.run_in_executor(pool, _run_group, group, contexts_for(events))
+
+            return dispatch_one
+
+        def dispatch(
+            loop: asyncio.AbstractEventLoop, events: list[Event[Any]]
+        ) -> asyncio.Future[None] | None:
+            contexts = contexts_for(events)
+            # Run all handler groups at the same time in their own threads
+            futures = [loop.run_in_executor(pool, _run_group, group, contexts) for group in groups]
+            # Cheap handlers run here while the pool works on the rest
+            if inline:
+                _run_group(inline, contexts)
+            return _wait_all(loop, futures)
+
+        return dispatch
+
+    def _has_queued_handlers(self, event_type: EventType[Any]) -> bool:
+        dispatchers = self._dispatchers
+        type_id = event_type._id
+        return type_id < len(dispatchers) and dispatchers[type_id] is not None
+
     def check_size_and_log(self):
         if self._queue and self._queue.qsize() >= self._max_queue_size - 1:
             logger.warning("Attempting to add event to almost full queue.")
@@ -124,58 +432,125 @@ class EventBus:
     async def publish(self, event: Event[Any]) -> None:
         """Publish an event to the bus.
 
-        This method can be called from any event loop. It will schedule the event
-        to be added to the EventBus's queue in the EventBus's own event loop.
+        This method can be called from any event loop. The event is added to the queue
+        directly; no coroutine is scheduled on the EventBus's loop and the caller's loop is
+        never blocked. If the queue is full, callers on the EventBus's own loop wait for a
+        free slot while callers on other loops drop the event, like ``thread_safe_publish``.
+        Use ``publish_async`` to wait for a free slot from any loop.
         """
         if not self._running or self._loop is None or self._queue is None:
             raise RuntimeError("Event bus not running")
 
+        self._run_sync_handlers(event)
+        if not self._has_queued_handlers(event.type):
+            return
+
         self.check_size_and_log()
 
-        # Check if we're in the EventBus's event loop
-        try:
-            current_loop = asyncio.get_running_loop()
-            if current_loop is self._loop:
-                # We're in the EventBus's event loop, can directly await
-                await self._queue.put(event)
-                logger.debug(f"Published event {event.type}")
-            else:
-                # We're in a different event loop, need to use run_coroutine_threadsafe
-                async def _put_event():
-                    await self._queue.put(event)  # type: ignore[union-attr]
-                    logger.debug(f"Published event {event.type}")
-
-                future = asyncio.run_coroutine_threadsafe(_put_event(), self._loop)
-                # Wait for completion (this blocks the current coroutine but that's okay)
-                future.result(timeout=5.0)
-        except RuntimeError:
-            # No event loop running, use run_coroutine_threadsafe
-            async def _put_event():
-                await self._queue.put(event)  # type: ignore[union-attr]
-                logger.debug(f"Published event {event.type}")
-
-            future = asyncio.run_coroutine_threadsafe(_put_event(), self._loop)
-            future.result(timeout=5.0)
+        if self._put_nowait(event):
+            return
+
+        if asyncio.get_running_loop() is self._loop:
+            await self._put(event)
+        else:
+            self._drop(event)
+
+    async def publish_async(self, event: Event[Any]) -> None:
+        """Publish an event to the bus, waiting for a free queue slot if it is full.
+
+        Can be awaited from any event loop without blocking it.
+        """
+        if not self._running or self._loop is None or self._queue is None:
+            raise RuntimeError("Event bus not running")
+
+        self._run_sync_handlers(event)
+        if not self._has_queued_handlers(event.type):
+            return
+
+        if self._put_nowait(event):
+            return
+
+        if asyncio.get_running_loop() is self._loop:
+            await self._put(event)
+        else:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self._put(event), self._loop)
+            )
 
     def thread_safe_publish(self, event: Event[Any]) -> None:
         """Called from non-async code or different threads to publish events."""
+        self.publish_sync(event)
+
+    def publish_sync(self, event: Event[Any]) -> None:
+        """Publish an event from any thread without awaiting.
+
+        Handlers marked as sync are called right here on the publisher's thread, before
+        this returns. The event only goes onto the queue if it also has other handlers, and
+        is dropped with a warning if the queue is full.
+        """
         if not self._running or self._loop is None or self._queue is None:
             raise RuntimeError("Event bus not running")
 
-        self.check_size_and_log()
+        self._run_sync_handlers(event)
+        if not self._has_queued_handlers(event.type):
+            return
 
-        async def _put_event():
-            await self._queue.put(event)  # type: ignore[union-attr]
-            logger.debug(f"Published event {event.type}")
+        self.check_size_and_log()
 
-        asyncio.run_coroutine_threadsafe(_put_event(), self._loop)
+        if not self._put_nowait(event):
+            self._drop(event)
+
+    def _run_sync_handlers(self, event: Event[Any]) -> None:
+        """Call the sync handlers of an event inline on the current thread."""
+        sync_handlers = self._sync_handlers
+        type_id = event.type._id
+        handlers = sync_handlers[type_id] if type_id < len(sync_handlers) else None
+        if handlers:
+            _run_group(handlers, [HandlerContext(self, event)])
+
+    def _drop(self, event: Event[Any]) -> None:
+        """Account for an event that did not fit in the queue."""
+        with self._dropped_events_lock:
+            self._dropped_events += 1
+        logger.warning(f"Event queue full, dropped event {event.type}")
+
+    def _put_nowait(self, event: Event[Any]) -> bool:
+        """Add an event to the queue from any thread. Returns False if the queue is full."""
+        if not self._queue.push(event):  # type: ignore[union-attr]
+            return False
+
+        logger.debug(f"Published event {event.type}")
+        # Only pay for a cross-thread wakeup if the consumer is (about to be) waiting
+        if self._consumer_idle:
+            self._loop.call_soon_threadsafe(self._wakeup.set)  # type: ignore[union-attr]
+        return True
+
+    async def _put(self, event: Event[Any]) -> None:
+        """Add an event to the queue, waiting for space if it is full. Runs on the bus loop."""
+        while not self._put_nowait(event):
+            self._not_full.clear()  # type: ignore[union-attr]
+            await self._not_full.wait()  # type: ignore[union-attr]
 
     def start(self) -> None:
         """Start the event bus."""
         if self._running:
             return
         self._running = True
-        self._loop = asyncio.new_event_loop()
+        self._loop = _new_event_loop()
+        # Start tasks eagerly: a coroutine scheduled on the bus loop (e.g. the put behind
+        # publish_async from another loop) runs to completion right away when it does not
+        # need to wait, instead of taking another trip through the scheduler
+        self._loop.set_task_factory(asyncio.eager_task_factory)
+
+        # Create the queue and its wakeup events here rather than in the loop thread, so
+        # they exist as soon as start() returns without waiting for the thread. The ring
+        # buffer is loop-agnostic, and asyncio.Event binds to the loop on first use.
+        self._wakeup = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._queue = MPSCRing(self._max_queue_size)
+        # Schedule the event processing task; events published before the loop thread gets
+        # going are simply drained on its first iteration
+        self._loop.create_task(self._process_events())
 
         # Create a new thread to run the event loop
         def run_event_loop():
@@ -183,29 +558,12 @@ class EventBus:
                 raise RuntimeError("Event bus not running")
 
             asyncio.set_event_loop(self._loop)
-            # Create the queue in the event loop that will use it
-            self._queue = asyncio.Queue(maxsize=self._max_queue_size)
-            # Schedule the event processing task
-            self._loop.create_task(self._process_events())
             # Run the loop forever until stop() is called
             self._loop.run_forever()
 
-        import threading
-
         self._thread = threading.Thread(target=run_event_loop, daemon=True)
         self._thread.start()
 
-        # Wait for the queue to be initialized
-        import time
-
-        timeout = 1.0
-        start_time = time.time()
-        while self._queue is None and time.time() - start_time < timeout:
-            time.sleep(0.01)
-
-        if self._queue is None:
-            raise RuntimeError("Failed to initialize event queue")
-
         logger.info("Event bus started")
 
     def stop(self) -> None:
@@ -278,35 +636,53 @@ class EventBus:
 
         # Clear references
         self._queue = None
+        self._wakeup = None
+        self._not_full = None
         self._loop = None
 
         logger.info("Event bus stopped and cleaned up")
 
     async def _process_events(self) -> None:
-        if self._loop is None or self._queue is None:
+        if (
+            self._loop is None
+            or self._queue is None
+            or self._wakeup is None
+            or self._not_full is None
+        ):
             raise RuntimeError("Event bus not properly initialized")
 
+        loop = self._loop
+        queue = self._queue
+        wakeup = self._wakeup
+
         while self._running:
             try:
-                event = await self._queue.get()
-                handlers = self._handlers.get(event.type, [])
-
-                context = HandlerContext(event_bus=self, event=event)
-
-                # for handler in handlers:
-                #     self._loop.run_in_executor(self._thread_pool, handler, context)
-
-                if handlers:
-                    # Run all handlers at the same time in their own threads
-                    await asyncio.gather(
-                        *(
-                            self._loop.run_in_executor(self._thread_pool, handler, context)
-                            for handler in handlers
-                        ),
-                        return_exceptions=True,
-                    )
-
-                self._queue.task_done()
+                # Take everything published since the last wakeup in one go, up to a batch
+                events = queue.drain(_MAX_BATCH_SIZE)
+
+                if not events:
+                    # Announce that we are going to sleep before checking the queue one last
+                    # time, so an event pushed in between either sees the flag or is found here
+                    self._consumer_idle = True
+                    if queue.empty():
+                        await wakeup.wait()
+                    wakeup.clear()
+                    self._consumer_idle = False
+                    continue
+
+                self._not_full.set()
+
+                # Consecutive events of the same type go to each handler group in a single
+                # executor submission; runs are dispatched in order to keep event ordering
+                dispatchers = self._dispatchers
+                for type_id, run in itertools.groupby(events, operator.attrgetter("type._id")):
+                    dispatch = dispatchers[type_id] if type_id < len(dispatchers) else None
+                    if dispatch is None:
+                        # Nobody is subscribed, so there is no need for contexts or futures
+                        continue
+                    waiter = dispatch(loop, list(run))
+                    if waiter is not None:
+                        await waiter
 
             except asyncio.CancelledError:
                 break
@@ -319,3 +695,10 @@ class EventBus:
     # @property
     def is_running(self) -> bool:
         return self._running
+
+    def stats(self) -> EventBusStats:
+        """Return the current queue length and the number of dropped events."""
+        return EventBusStats(
+            queued=self._queue.qsize() if self._queue is not None else 0,
+            dropped=self._dropped_events,
+        )
@@ -3,19 +3,35 @@ from collections.abc import Callable
 
 from racing_coach_core.events.base import EventType, HandlerFunc, HandlerMethod
 
+__all__ = ["func_handles", "method_handles"]
+
 logger = logging.getLogger(__name__)
 
 
 def func_handles[X](
     event_type: EventType[X],
+    group: str | None = None,
+    sync: bool = False,
+    cost_us: int | None = None,
 ) -> Callable[[HandlerFunc[X]], HandlerFunc[X]]:
     """
-    Ultra-minimal version that only adds the event type metadata.
+    Ultra-minimal version that only adds the event type metadata as ``__event_type__``.
     No wrapper function at all - zero runtime overhead.
+
+    ``group``: handlers sharing a group run one after another in a single worker thread.
+    ``sync``: call the handler inline on the publisher's thread; only for quick handlers.
+    ``cost_us``: typical run time in microseconds; handlers cheaper than
+    ``INLINE_COST_THRESHOLD_US`` run on the event loop thread instead of the thread pool.
     """
 
     def decorator(func: HandlerFunc[X]) -> HandlerFunc[X]:
-        # func._event_type = event_type  # type: ignore
+        func.__event_type__ = event_type  # type: ignore[attr-defined]
+        if group is not None:
+            func.__event_group__ = group  # type: ignore[attr-defined]
+        if sync:
+            func.__event_sync__ = True  # type: ignore[attr-defined]
+        if cost_us is not None:
+            func.__cost_us__ = cost_us  # type: ignore[attr-defined]
         return func
 
     return decorator
@@ -23,14 +39,25 @@ def func_handles[X](
 
 def method_handles[X](
     event_type: EventType[X],
+    group: str | None = None,
+    sync: bool = False,
+    cost_us: int | None = None,
 ) -> Callable[[HandlerMethod[X]], HandlerMethod[X]]:
     """
-    Ultra-minimal version that only adds the event type metadata.
+    Ultra-minimal version that only adds the event type metadata as ``__event_type__``.
     No wrapper function at all - zero runtime overhead.
+
+    ``group``, ``sync`` and ``cost_us`` work as in ``func_handles``.
     """
 
     def decorator(func: HandlerMethod[X]) -> HandlerMethod[X]:
-        # func._event_type = event_type  # type: ignore
+        func.__event_type__ = event_type  # type: ignore[attr-defined]
+        if group is not None:
+            func.__event_group__ = group  # type: ignore[attr-defined]
+        if sync:
+            func.__event_sync__ = True  # type: ignore[attr-defined]
+        if cost_us is not None:
+            func.__cost_us__ = cost_us  # type: ignore[attr-defined]
         return func
 
     return decorator
@@ -0,0 +1,86 @@
+"""Ring buffer used as the EventBus queue.
+
+Events are published from any number of threads (collectors, handlers) but consumed by a
+single task on the event bus loop, so only the producer side needs a lock.
+"""
+
+import threading
+
+
+class MPSCRing[T]:
+    """Multi-producer, single-consumer ring buffer.
+
+    Items live in a preallocated list of slots addressed by two ever-increasing indices.
+    Producers serialize on a lock to claim the ``head`` slot. The consumer owns ``tail``
+    and reads slots without locking: an item is only visible once ``head`` has moved
+    past it, and producers never write to a slot the consumer has not released.
+
+    A capacity of 0 makes the buffer unbounded; the slot list then doubles whenever it
+    fills up.
+    """
+
+    _INITIAL_UNBOUNDED_SLOTS = 1024
+
+    def __init__(self, capacity: int = 0) -> None:
+        self._capacity = capacity
+        self._slots: list[T | None] = [None] * (capacity or self._INITIAL_UNBOUNDED_SLOTS)
+        self._head = 0  # Next slot to write, advanced by producers under the lock
+        self._tail = 0  # Next slot to read, advanced by the consumer only
+        self._lock = threading.Lock()
+
+    def push(self, item: T) -> bool:
+        """Append an item. Returns False, leaving the buffer unchanged, if it is full."""
+        with self._lock:
+            slots = self._slots
+            head = self._head
+            if head - self._tail >= len(slots):
+                if self._capacity:
+                    return False
+                slots = self._grow(head)
+            slots[head % len(slots)] = item
+            self._head = head + 1
+        return True
+
+    def drain(self, max_items: int = 0) -> list[T]:
+        """Remove and return the available items in FIFO order, up to max_items if given.
+
+        Must only be called from the consumer.
+        """
+        # Read head before slots: a grown slot list is published before head moves past
+        # anything written to it
+        head = self._head
+        slots = self._slots
+        tail = self._tail
+        if max_items:
+            head = min(head, tail + max_items)
+
+        size = len(slots)
+        items: list[T] = []
+        for index in range(tail, head):
+            slot = index % size
+            items.append(slots[slot])  # type: ignore[arg-type]
+            slots[slot] = None  # Release the reference for garbage collection
+        self._tail = head
+        return items
+
+    def qsize(self) -> int:
+        """Number of items waiting to be drained."""
+        return self._head - self._tail
+
+    def empty(self) -> bool:
+        return self._head == self._tail
+
+    def __len__(self) -> int:
+        return self.qsize()
+
+    def _grow(self, head: int) -> list[T | None]:
+        """Double the slot list of an unbounded buffer. Caller holds the lock."""
+        old = self._slots
+        old_size = len(old)
+        new: list[T | None] = [None] * (old_size * 2)
+        # Copy every slot that may still be unread. The consumer can advance tail while
+        # this runs, so a stale tail only means copying a few already drained items.
+        for index in range(self._tail, head):
+            new[index % len(new)] = old[index % old_size]
+        self._slots = new
+        return new
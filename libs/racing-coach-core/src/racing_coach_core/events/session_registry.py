@@ -18,6 +18,11 @@ class SessionRegistry:
 
     Handlers inject this registry and query it when they need session information.
     The TelemetryCollector updates it when sessions start/end.
+
+    Reads happen on every telemetry frame while writes only happen at the start and end
+    of a session, so reads take no lock. Writers hold the lock to keep their checks
+    consistent and publish the new session with a single attribute assignment, which
+    readers see either entirely or not at all.
     """
 
     def __init__(self) -> None:
@@ -35,7 +40,11 @@ class SessionRegistry:
                     f"session {self._current_session.session_id} is still active"
                 )
             self._current_session = session
-            self._sessions[session.session_id] = session
+            # Copy on write: get_session reads without the lock, so publish a new dict
+            # rather than resizing the one readers may be looking at
+            sessions = dict(self._sessions)
+            sessions[session.session_id] = session
+            self._sessions = sessions
             logger.info(f"Session started: {session.session_id}")
 
     def end_session(self, session_id: UUID) -> None:
@@ -55,14 +64,13 @@ class SessionRegistry:
 
     def get_current_session(self) -> SessionFrame | None:
         """Get the current active session, or None if no session is active."""
-        with self._lock:
-            return self._current_session
+        return self._current_session
 
     def get_session(self, session_id: UUID) -> SessionFrame | None:
+        """Get a session that was started in this registry by its ID."""
         return self._sessions.get(session_id, None)
 
     @property
     def has_active_session(self) -> bool:
         """Check if there is an active session."""
-        with self._lock:
-            return self._current_session is not None
+        return self._current_session is not None
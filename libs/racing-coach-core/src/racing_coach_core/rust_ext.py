@@ -29,6 +29,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from racing_coach_core.algs.events import BrakingMetrics, CornerMetrics, LapMetrics
     from racing_coach_core.schemas.telemetry import TelemetrySequence
@@ -38,12 +40,15 @@ _RUST_AVAILABLE = False
 
 try:
     from racing_coach_core._rs import AnalysisConfig as _rs_AnalysisConfig
-    from racing_coach_core._rs import TelemetryFrame as _rs_TelemetryFrame
     from racing_coach_core._rs import compute_speed_stats as _rs_compute_speed_stats
     from racing_coach_core._rs import hello_from_rust as _rs_hello_from_rust
-    from racing_coach_core._rs import py_extract_braking_zones as _rs_extract_braking_zones
-    from racing_coach_core._rs import py_extract_corners as _rs_extract_corners
-    from racing_coach_core._rs import py_extract_lap_metrics as _rs_extract_lap_metrics
+    from racing_coach_core._rs import (
+        py_extract_braking_zones_from_columns as _rs_extract_braking_zones,
+    )
+    from racing_coach_core._rs import py_extract_corners_from_columns as _rs_extract_corners
+    from racing_coach_core._rs import (
+        py_extract_lap_metrics_from_columns as _rs_extract_lap_metrics,
+    )
 
     _RUST_AVAILABLE = True  # pyright: ignore[reportConstantRedefinition]
 except ImportError:
@@ -52,7 +57,6 @@ except ImportError:
     _rs_extract_lap_metrics = None  # type: ignore[assignment]
     _rs_extract_braking_zones = None  # type: ignore[assignment]
     _rs_extract_corners = None  # type: ignore[assignment]
-    _rs_TelemetryFrame = None  # type: ignore[assignment]
     _rs_AnalysisConfig = None  # type: ignore[assignment]
 
 
@@ -100,24 +104,30 @@ def compute_speed_stats(speeds: list[float]) -> tuple[float, float, float]:
     return (min(speeds), max(speeds), sum(speeds) / len(speeds))
 
 
-def _convert_sequence_to_rust_frames(sequence: TelemetrySequence) -> list:
-    """Convert a TelemetrySequence to Rust-compatible TelemetryFrame objects."""
-    if _rs_TelemetryFrame is None:
-        raise RuntimeError("Rust extension not available")
-
-    return [
-        _rs_TelemetryFrame(
-            brake=frame.brake,
-            throttle=frame.throttle,
-            speed=frame.speed,
-            lap_distance=frame.lap_distance,
-            steering_angle=frame.steering_angle,
-            lateral_acceleration=frame.lateral_acceleration,
-            longitudinal_acceleration=frame.longitudinal_acceleration,
-            timestamp=frame.timestamp.timestamp(),
-        )
-        for frame in sequence.frames
-    ]
+_RUST_FRAME_FIELDS = (
+    "brake",
+    "throttle",
+    "speed",
+    "lap_distance",
+    "steering_angle",
+    "lateral_acceleration",
+    "longitudinal_acceleration",
+)
+
+
+def _sequence_to_rust_columns(sequence: TelemetrySequence) -> dict[str, np.ndarray]:
+    """Convert a TelemetrySequence to the float64 columns taken by the Rust analysis.
+
+    The whole sequence crosses into Rust as one array per field rather than one
+    Rust TelemetryFrame object per frame. The arrays are shared with the sequence's
+    frame_arrays cache, and session_time serves as the time axis, as it does in the
+    Python implementation: the analysis only takes differences, and it avoids a
+    datetime conversion per frame.
+    """
+    arrays = sequence.frame_arrays
+    columns = {field: arrays[field] for field in _RUST_FRAME_FIELDS}
+    columns["timestamp"] = arrays["session_time"]
+    return columns
 
 
 def _convert_rust_braking_metrics(rust_metrics) -> BrakingMetrics:
@@ -205,13 +215,8 @@ def extract_lap_metrics(
     Returns:
         LapMetrics containing all detected braking zones, corners, and statistics.
     """
-    if (
-        _RUST_AVAILABLE
-        and _rs_extract_lap_metrics is not None
-        and _rs_TelemetryFrame is not None
-        and _rs_AnalysisConfig is not None
-    ):
-        rust_frames = _convert_sequence_to_rust_frames(sequence)
+    if _RUST_AVAILABLE and _rs_extract_lap_metrics is not None and _rs_AnalysisConfig is not None:
+        columns = _sequence_to_rust_columns(sequence)
         config = _rs_AnalysisConfig(
             brake_threshold=brake_threshold,
             steering_threshold=steering_threshold,
@@ -223,7 +228,7 @@ def extract_lap_metrics(
             lap_number = sequence.frames[0].lap_number
 
         rust_result = _rs_extract_lap_metrics(
-            rust_frames,
+            columns,
             lap_number=lap_number or 0,
             lap_time=lap_time,
             config=config,
@@ -259,19 +264,14 @@ def extract_braking_zones(
     Returns:
         List of BrakingMetrics for each detected braking zone.
     """
-    if (
-        _RUST_AVAILABLE
-        and _rs_extract_braking_zones is not None
-        and _rs_TelemetryFrame is not None
-        and _rs_AnalysisConfig is not None
-    ):
-        rust_frames = _convert_sequence_to_rust_frames(sequence)
+    if _RUST_AVAILABLE and _rs_extract_braking_zones is not None and _rs_AnalysisConfig is not None:
+        columns = _sequence_to_rust_columns(sequence)
         config = _rs_AnalysisConfig(
             brake_threshold=brake_threshold,
             steering_threshold=steering_threshold,
         )
 
-        rust_results = _rs_extract_braking_zones(rust_frames, config=config)
+        rust_results = _rs_extract_braking_zones(columns, config=config)
         return [_convert_rust_braking_metrics(r) for r in rust_results]
 
     # Python fallback
@@ -296,19 +296,14 @@ def extract_corners(
     Returns:
         List of CornerMetrics for each detected corner.
     """
-    if (
-        _RUST_AVAILABLE
-        and _rs_extract_corners is not None
-        and _rs_TelemetryFrame is not None
-        and _rs_AnalysisConfig is not None
-    ):
-        rust_frames = _convert_sequence_to_rust_frames(sequence)
+    if _RUST_AVAILABLE and _rs_extract_corners is not None and _rs_AnalysisConfig is not None:
+        columns = _sequence_to_rust_columns(sequence)
         config = _rs_AnalysisConfig(
             steering_threshold=steering_threshold,
             throttle_threshold=throttle_threshold,
         )
 
-        rust_results = _rs_extract_corners(rust_frames, config=config)
+        rust_results = _rs_extract_corners(columns, config=config)
         return [_convert_rust_corner_metrics(r) for r in rust_results]
 
     # Python fallback
@@ -1,5 +1,12 @@
 from .responses import HealthCheckResponse, LapUploadResponse
-from .telemetry import LapTelemetry, SessionFrame, TelemetryFrame, TelemetrySequence
+from .telemetry import (
+    LapTelemetry,
+    SessionFrame,
+    TelemetryFrame,
+    TelemetryFrameBuffer,
+    TelemetrySequence,
+    TrackSurface,
+)
 from .track import AugmentedTelemetryFrame, AugmentedTelemetrySequence, TrackBoundary
 
 __all__ = [
@@ -10,6 +17,8 @@ __all__ = [
     "LapUploadResponse",
     "SessionFrame",
     "TelemetryFrame",
+    "TelemetryFrameBuffer",
     "TelemetrySequence",
     "TrackBoundary",
+    "TrackSurface",
 ]
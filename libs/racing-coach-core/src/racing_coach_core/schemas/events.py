@@ -1,28 +1,38 @@
-from uuid import UUID
+"""Event payloads passed over the EventBus.
+
+The payloads only bundle models that were validated where they were built
+(``from_irsdk``, the lap handler, metrics extraction), so they are plain frozen
+dataclasses instead of pydantic models and cost nothing to construct per event.
+"""
 
-from pydantic import BaseModel
+from dataclasses import dataclass
+from uuid import UUID
 
 from ..algs.events import LapMetrics
 from .telemetry import LapTelemetry, SessionFrame, TelemetryFrame
 
 
-class TelemetryAndSession(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TelemetryAndSession:
     TelemetryFrame: TelemetryFrame
     SessionFrame: SessionFrame
 
 
-class TelemetryAndSessionId(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TelemetryAndSessionId:
     telemetry: TelemetryFrame
     session_id: UUID
 
 
-class LapAndSession(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LapAndSession:
     LapTelemetry: LapTelemetry
     SessionFrame: SessionFrame
     lap_id: UUID  # Client-generated UUID for this lap
 
 
-class MetricsAndSession(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MetricsAndSession:
     """Event data for lap metrics extraction."""
 
     LapMetrics: LapMetrics
@@ -30,19 +40,22 @@ class MetricsAndSession(BaseModel):
     lap_id: UUID  # Passed through from LapAndSession
 
 
-class SessionStart(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SessionStart:
     """Event data for session start."""
 
     SessionFrame: SessionFrame
 
 
-class SessionEnd(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SessionEnd:
     """Event data for session end."""
 
     session_id: UUID
 
 
-class LapUploadResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class LapUploadResult:
     """Event data for lap upload result."""
 
     lap_id: UUID
@@ -51,7 +64,8 @@ class LapUploadResult(BaseModel):
     error_message: str | None = None
 
 
-class MetricsUploadResult(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MetricsUploadResult:
     """Event data for metrics upload result."""
 
     lap_id: UUID
@@ -20,8 +20,16 @@ class LapUploadResponse(BaseModel):
     lap_id: str
 
 
+class LapBatchUploadResponse(BaseModel):
+    """Response model for a batched lap telemetry upload."""
+
+    status: str
+    message: str
+    lap_ids: list[str]
+
+
 class MetricsUploadResponse(BaseModel):
-    """Response model for lap metrics upload."""
+    """Response model for metrics upload."""
 
     status: str
     message: str
@@ -81,6 +89,21 @@ class SessionDetailResponse(BaseModel):
     created_at: datetime
 
 
+class LapDetailResponse(BaseModel):
+    """Response model for lap detail endpoint."""
+
+    lap_id: str
+    session_id: str
+    lap_number: int
+    lap_time: float | None
+    is_valid: bool
+    track_name: str
+    track_config_name: str | None
+    car_name: str
+    has_metrics: bool
+    created_at: datetime
+
+
 class TelemetryFrameResponse(BaseModel):
     """Response model for a single telemetry frame."""
 
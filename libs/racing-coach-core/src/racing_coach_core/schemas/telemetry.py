@@ -1,15 +1,48 @@
 import logging
+from collections.abc import Mapping
 from datetime import datetime
+from enum import IntEnum
+from functools import cached_property
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any, Protocol, Self, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, Self, runtime_checkable
 from uuid import UUID, uuid4
 
-import pandas as pd
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
 
+WHEELS = ("lf", "rf", "lr", "rr")
+"""Wheel prefixes of the per-wheel TelemetryFrame fields."""
+TIRE_POSITIONS = ("left", "middle", "right")
+"""Tread positions of the per-tire TelemetryFrame fields."""
+
+
+class TrackSurface(IntEnum):
+    """Surface under the player's car, as reported by the SDK's PlayerTrackSurface."""
+
+    NOT_IN_WORLD = -1
+    OFF_TRACK = 0
+    PIT_STALL = 1
+    APPROACHING_PITS = 2
+    ON_TRACK = 3
+
+
+_COLUMN_DTYPES: dict[Any, type[np.generic]] = {
+    float: np.float64,
+    int: np.int64,
+    bool: np.bool_,
+    TrackSurface: np.int8,
+}
+"""NumPy dtypes of the DataFrame columns built for scalar TelemetryFrame fields."""
+
+
 @runtime_checkable
 class TelemetryDataSource(Protocol):
     """
@@ -25,13 +58,83 @@ class TelemetryDataSource(Protocol):
         ...
 
 
+IRSDK_VARIABLES: dict[str, str] = {
+    "session_time": "SessionTime",
+    "lap_number": "Lap",
+    "lap_distance_pct": "LapDistPct",
+    "lap_distance": "LapDist",
+    "current_lap_time": "LapCurrentLapTime",
+    "last_lap_time": "LapLastLapTime",
+    "best_lap_time": "LapBestLapTime",
+    "speed": "Speed",
+    "rpm": "RPM",
+    "gear": "Gear",
+    "throttle": "Throttle",
+    "brake": "Brake",
+    "clutch": "Clutch",
+    "steering_angle": "SteeringWheelAngle",
+    "lateral_acceleration": "LatAccel",
+    "longitudinal_acceleration": "LongAccel",
+    "vertical_acceleration": "VertAccel",
+    "yaw_rate": "YawRate",
+    "roll_rate": "RollRate",
+    "pitch_rate": "PitchRate",
+    "velocity_x": "VelocityX",
+    "velocity_y": "VelocityY",
+    "velocity_z": "VelocityZ",
+    "yaw": "Yaw",
+    "pitch": "Pitch",
+    "roll": "Roll",
+    "latitude": "Lat",
+    "longitude": "Lon",
+    "altitude": "Alt",
+    "lf_tire_temp_left": "LFtempCL",
+    "lf_tire_temp_middle": "LFtempCM",
+    "lf_tire_temp_right": "LFtempCR",
+    "rf_tire_temp_left": "RFtempCL",
+    "rf_tire_temp_middle": "RFtempCM",
+    "rf_tire_temp_right": "RFtempCR",
+    "lr_tire_temp_left": "LRtempCL",
+    "lr_tire_temp_middle": "LRtempCM",
+    "lr_tire_temp_right": "LRtempCR",
+    "rr_tire_temp_left": "RRtempCL",
+    "rr_tire_temp_middle": "RRtempCM",
+    "rr_tire_temp_right": "RRtempCR",
+    "lf_tire_wear_left": "LFwearL",
+    "lf_tire_wear_middle": "LFwearM",
+    "lf_tire_wear_right": "LFwearR",
+    "rf_tire_wear_left": "RFwearL",
+    "rf_tire_wear_middle": "RFwearM",
+    "rf_tire_wear_right": "RFwearR",
+    "lr_tire_wear_left": "LRwearL",
+    "lr_tire_wear_middle": "LRwearM",
+    "lr_tire_wear_right": "LRwearR",
+    "rr_tire_wear_left": "RRwearL",
+    "rr_tire_wear_middle": "RRwearM",
+    "rr_tire_wear_right": "RRwearR",
+    "lf_brake_pressure": "LFbrakeLinePress",
+    "rf_brake_pressure": "RFbrakeLinePress",
+    "lr_brake_pressure": "LRbrakeLinePress",
+    "rr_brake_pressure": "RRbrakeLinePress",
+    "track_temp": "TrackTempCrew",
+    "track_wetness": "TrackWetness",
+    "air_temp": "AirTemp",
+    "session_flags": "SessionFlags",
+    "track_surface": "PlayerTrackSurface",
+    "on_pit_road": "OnPitRoad",
+}
+"""SDK variable read for each TelemetryFrame field other than the timestamp."""
+
+
 class TelemetryFrame(BaseModel):
     """A single frame of driving telemetry data."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Time
     timestamp: datetime = Field(
         description="Timestamp of the telemetry frame",
-        default_factory=lambda: datetime.now(),
+        default_factory=datetime.now,
     )
     session_time: float = Field(description="Seconds since session start")
 
@@ -77,16 +180,35 @@ class TelemetryFrame(BaseModel):
     longitude: float = Field(description="Longitude in degrees")
     altitude: float = Field(description="Altitude in meters")
 
-    # Tire Data
-    tire_temps: dict[str, dict[str, float]] = Field(
-        description="Tire temperatures (LF,RF,LR,RR: left,middle,right)"
-    )
-    tire_wear: dict[str, dict[str, float]] = Field(
-        description="Tire wear percentage (LF,RF,LR,RR: left,middle,right)"
-    )
-    brake_line_pressure: dict[str, float] = Field(
-        description="Brake line pressure per wheel in bar"
-    )
+    # Tire Data, per wheel (lf, rf, lr, rr) and tread position (left, middle, right)
+    lf_tire_temp_left: float = Field(description="Left front tire left temperature in Celsius")
+    lf_tire_temp_middle: float = Field(description="Left front tire middle temperature in Celsius")
+    lf_tire_temp_right: float = Field(description="Left front tire right temperature in Celsius")
+    rf_tire_temp_left: float = Field(description="Right front tire left temperature in Celsius")
+    rf_tire_temp_middle: float = Field(description="Right front tire middle temperature in Celsius")
+    rf_tire_temp_right: float = Field(description="Right front tire right temperature in Celsius")
+    lr_tire_temp_left: float = Field(description="Left rear tire left temperature in Celsius")
+    lr_tire_temp_middle: float = Field(description="Left rear tire middle temperature in Celsius")
+    lr_tire_temp_right: float = Field(description="Left rear tire right temperature in Celsius")
+    rr_tire_temp_left: float = Field(description="Right rear tire left temperature in Celsius")
+    rr_tire_temp_middle: float = Field(description="Right rear tire middle temperature in Celsius")
+    rr_tire_temp_right: float = Field(description="Right rear tire right temperature in Celsius")
+    lf_tire_wear_left: float = Field(description="Left front tire left wear percentage")
+    lf_tire_wear_middle: float = Field(description="Left front tire middle wear percentage")
+    lf_tire_wear_right: float = Field(description="Left front tire right wear percentage")
+    rf_tire_wear_left: float = Field(description="Right front tire left wear percentage")
+    rf_tire_wear_middle: float = Field(description="Right front tire middle wear percentage")
+    rf_tire_wear_right: float = Field(description="Right front tire right wear percentage")
+    lr_tire_wear_left: float = Field(description="Left rear tire left wear percentage")
+    lr_tire_wear_middle: float = Field(description="Left rear tire middle wear percentage")
+    lr_tire_wear_right: float = Field(description="Left rear tire right wear percentage")
+    rr_tire_wear_left: float = Field(description="Right rear tire left wear percentage")
+    rr_tire_wear_middle: float = Field(description="Right rear tire middle wear percentage")
+    rr_tire_wear_right: float = Field(description="Right rear tire right wear percentage")
+    lf_brake_pressure: float = Field(description="Left front brake line pressure in bar")
+    rf_brake_pressure: float = Field(description="Right front brake line pressure in bar")
+    lr_brake_pressure: float = Field(description="Left rear brake line pressure in bar")
+    rr_brake_pressure: float = Field(description="Right rear brake line pressure in bar")
 
     # Track Conditions
     track_temp: float = Field(description="Track temperature in Celsius")
@@ -95,9 +217,36 @@ class TelemetryFrame(BaseModel):
 
     # Session State
     session_flags: int = Field(description="Current session flags")
-    track_surface: int = Field(description="Current track surface type")
+    track_surface: TrackSurface = Field(description="Current track surface type")
     on_pit_road: bool = Field(description="Whether car is on pit road")
 
+    @property
+    def tire_temps(self) -> dict[str, dict[str, float]]:
+        """Tire temperatures grouped by wheel (LF,RF,LR,RR: left,middle,right)."""
+        return {
+            wheel.upper(): {
+                position: getattr(self, f"{wheel}_tire_temp_{position}")
+                for position in TIRE_POSITIONS
+            }
+            for wheel in WHEELS
+        }
+
+    @property
+    def tire_wear(self) -> dict[str, dict[str, float]]:
+        """Tire wear percentages grouped by wheel (LF,RF,LR,RR: left,middle,right)."""
+        return {
+            wheel.upper(): {
+                position: getattr(self, f"{wheel}_tire_wear_{position}")
+                for position in TIRE_POSITIONS
+            }
+            for wheel in WHEELS
+        }
+
+    @property
+    def brake_line_pressure(self) -> dict[str, float]:
+        """Brake line pressure in bar keyed by wheel (LF,RF,LR,RR)."""
+        return {wheel.upper(): getattr(self, f"{wheel}_brake_pressure") for wheel in WHEELS}
+
     @classmethod
     def from_irsdk(cls, source: TelemetryDataSource, timestamp: datetime) -> Self:
         """
@@ -107,6 +256,10 @@ class TelemetryFrame(BaseModel):
         dictionary-style access, including live iRacing SDK connections and
         recorded IBT file readers.
 
+        The SDK already returns correctly typed values, so the frame is built with
+        ``model_construct`` and skips validation. Only ``track_surface`` is converted,
+        to ``TrackSurface``. Use ``from_irsdk_validated`` for untrusted sources.
+
         Args:
             source: The telemetry data source (live or replay).
             timestamp: The timestamp of the telemetry frame.
@@ -116,104 +269,46 @@ class TelemetryFrame(BaseModel):
 
         Raises:
             KeyError: If required telemetry variables are missing.
+            ValueError: If PlayerTrackSurface is not a TrackSurface value.
         """
+        return cls.model_construct(**cls._irsdk_fields(source, timestamp))
 
-        return cls(
-            timestamp=timestamp,
-            session_time=source["SessionTime"],  # type: ignore
-            lap_number=source["Lap"],  # type: ignore
-            lap_distance_pct=source["LapDistPct"],  # type: ignore
-            lap_distance=source["LapDist"],  # type: ignore
-            current_lap_time=source["LapCurrentLapTime"],  # type: ignore
-            last_lap_time=source["LapLastLapTime"],  # type: ignore
-            best_lap_time=source["LapBestLapTime"],  # type: ignore
-            speed=source["Speed"],  # type: ignore
-            rpm=source["RPM"],  # type: ignore
-            gear=source["Gear"],  # type: ignore
-            throttle=source["Throttle"],  # type: ignore
-            brake=source["Brake"],  # type: ignore
-            clutch=source["Clutch"],  # type: ignore
-            steering_angle=source["SteeringWheelAngle"],  # type: ignore
-            lateral_acceleration=source["LatAccel"],  # type: ignore
-            longitudinal_acceleration=source["LongAccel"],  # type: ignore
-            vertical_acceleration=source["VertAccel"],  # type: ignore
-            yaw_rate=source["YawRate"],  # type: ignore
-            roll_rate=source["RollRate"],  # type: ignore
-            pitch_rate=source["PitchRate"],  # type: ignore
-            velocity_x=source["VelocityX"],  # type: ignore
-            velocity_y=source["VelocityY"],  # type: ignore
-            velocity_z=source["VelocityZ"],  # type: ignore
-            yaw=source["Yaw"],  # type: ignore
-            pitch=source["Pitch"],  # type: ignore
-            roll=source["Roll"],  # type: ignore
-            latitude=source["Lat"],  # type: ignore
-            longitude=source["Lon"],  # type: ignore
-            altitude=source["Alt"],  # type: ignore
-            tire_temps={
-                "LF": {
-                    "left": source["LFtempCL"],
-                    "middle": source["LFtempCM"],
-                    "right": source["LFtempCR"],
-                },
-                "RF": {
-                    "left": source["RFtempCL"],
-                    "middle": source["RFtempCM"],
-                    "right": source["RFtempCR"],
-                },
-                "LR": {
-                    "left": source["LRtempCL"],
-                    "middle": source["LRtempCM"],
-                    "right": source["LRtempCR"],
-                },
-                "RR": {
-                    "left": source["RRtempCL"],
-                    "middle": source["RRtempCM"],
-                    "right": source["RRtempCR"],
-                },
-            },  # type: ignore
-            tire_wear={
-                "LF": {
-                    "left": source["LFwearL"],
-                    "middle": source["LFwearM"],
-                    "right": source["LFwearR"],
-                },
-                "RF": {
-                    "left": source["RFwearL"],
-                    "middle": source["RFwearM"],
-                    "right": source["RFwearR"],
-                },
-                "LR": {
-                    "left": source["LRwearL"],
-                    "middle": source["LRwearM"],
-                    "right": source["LRwearR"],
-                },
-                "RR": {
-                    "left": source["RRwearL"],
-                    "middle": source["RRwearM"],
-                    "right": source["RRwearR"],
-                },
-            },  # type: ignore
-            brake_line_pressure={
-                "LF": source["LFbrakeLinePress"],
-                "RF": source["RFbrakeLinePress"],
-                "LR": source["LRbrakeLinePress"],
-                "RR": source["RRbrakeLinePress"],
-            },  # type: ignore
-            track_temp=source["TrackTempCrew"],  # type: ignore
-            track_wetness=source["TrackWetness"],  # type: ignore
-            air_temp=source["AirTemp"],  # type: ignore
-            session_flags=source["SessionFlags"],  # type: ignore
-            track_surface=source["PlayerTrackSurface"],  # type: ignore
-            on_pit_road=source["OnPitRoad"],  # type: ignore
-        )
+    @classmethod
+    def from_irsdk_validated(cls, source: TelemetryDataSource, timestamp: datetime) -> Self:
+        """Create a TelemetryFrame like ``from_irsdk``, running full pydantic validation.
+
+        Raises:
+            KeyError: If required telemetry variables are missing.
+            ValidationError: If a telemetry variable has the wrong type.
+        """
+        return cls(**cls._irsdk_values(source), timestamp=timestamp)
+
+    @staticmethod
+    def _irsdk_values(source: TelemetryDataSource) -> dict[str, Any]:
+        """Read the raw SDK value of every TelemetryFrame field except the timestamp."""
+        return {name: source[variable] for name, variable in IRSDK_VARIABLES.items()}
+
+    @staticmethod
+    def _irsdk_fields(source: TelemetryDataSource, timestamp: datetime) -> dict[str, Any]:
+        """Read the TelemetryFrame field values from a telemetry data source.
+
+        The SDK reports PlayerTrackSurface as an int, so it is converted to TrackSurface
+        here for the constructors that skip validation.
+        """
+        fields = TelemetryFrame._irsdk_values(source)
+        fields["track_surface"] = TrackSurface(fields["track_surface"])
+        fields["timestamp"] = timestamp
+        return fields
 
 
 class SessionFrame(BaseModel):
     """Frame of data pertaining to a session."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime = Field(
         description="Timestamp of the session frame",
-        default_factory=lambda: datetime.now(),
+        default_factory=datetime.now,
     )
 
     session_id: UUID = Field(description="Session ID", default_factory=uuid4)
@@ -241,7 +336,8 @@ class SessionFrame(BaseModel):
         Create a SessionFrame from a telemetry data source.
 
         This method extracts session metadata (track, car, series info) from
-        the telemetry source.
+        the telemetry source. Like ``TelemetryFrame.from_irsdk`` it trusts the SDK
+        values and skips validation; use ``from_irsdk_validated`` otherwise.
 
         Args:
             source: The telemetry data source (live or replay).
@@ -253,6 +349,23 @@ class SessionFrame(BaseModel):
         Raises:
             KeyError: If required session variables are missing.
         """
+        return cls.model_construct(**cls._irsdk_fields(source, timestamp))
+
+    @classmethod
+    def from_irsdk_validated(
+        cls, source: TelemetryDataSource, timestamp: datetime
+    ) -> "SessionFrame":
+        """Create a SessionFrame like ``from_irsdk``, running full pydantic validation.
+
+        Raises:
+            KeyError: If required session variables are missing.
+            ValidationError: If a session variable has the wrong type.
+        """
+        return cls(**cls._irsdk_fields(source, timestamp))
+
+    @staticmethod
+    def _irsdk_fields(source: TelemetryDataSource, timestamp: datetime) -> dict[str, Any]:
+        """Read the SessionFrame field values from a telemetry data source."""
         weekend_info = source["WeekendInfo"]
         driver_info = source["DriverInfo"]
         session_info: dict[str, Any] = source["SessionInfo"]  # type: ignore
@@ -263,7 +376,7 @@ class SessionFrame(BaseModel):
 
         driver = driver_info["Drivers"][car_idx]  # type: ignore
 
-        return cls(
+        return dict(
             timestamp=timestamp,
             track_id=weekend_info["TrackID"],  # type: ignore
             track_name=weekend_info["TrackDisplayName"],  # type: ignore
@@ -276,10 +389,156 @@ class SessionFrame(BaseModel):
             session_type=session["SessionType"],  # type: ignore
         )
 
+    @cached_property
+    def json_dump(self) -> dict[str, Any]:
+        """JSON-compatible dump of the session, computed once and shared by every consumer.
+
+        The cache is never invalidated, so the session must not be mutated once read.
+        """
+        return self.model_dump(mode="json")
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the session without the cached ``json_dump`` of the original."""
+        copy = super().model_copy(update=update, deep=deep)
+        copy.__dict__.pop("json_dump", None)
+        return copy
+
+
+FRAME_LIST_ADAPTER = TypeAdapter(list[TelemetryFrame])
+"""Validates a whole list of frame records in one call into pydantic-core."""
+
+
+def _group_column_fields() -> dict[type[np.generic], tuple[str, ...]]:
+    """Group the numeric TelemetryFrame fields by the dtype of their column."""
+    groups: dict[type[np.generic], list[str]] = {}
+    for name, field in TelemetryFrame.model_fields.items():
+        dtype = _COLUMN_DTYPES.get(field.annotation)
+        if dtype is not None:
+            groups.setdefault(dtype, []).append(name)
+    return {dtype: tuple(names) for dtype, names in groups.items()}
+
+
+_COLUMN_FIELDS = _group_column_fields()
+
+
+def _column_records(columns: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Zip equal-length field columns into one record dict per frame."""
+    names = tuple(columns)
+    return [dict(zip(names, row, strict=True)) for row in zip(*columns.values(), strict=True)]
+
+
+_SEQUENCE_CACHES = ("json_dump", "frame_arrays", "frames_dataframe")
+"""Names of the TelemetrySequence cached properties."""
+
 
 class TelemetrySequence(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     frames: list[TelemetryFrame]
 
+    @cached_property
+    def json_dump(self) -> dict[str, Any]:
+        """JSON-compatible dump of the sequence, computed once and shared by every consumer.
+
+        The cache is never invalidated, so the sequence must not be mutated once read.
+        """
+        return self.model_dump(mode="json")
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the sequence without the cached values derived from the original's frames.
+
+        ``model_copy`` copies ``__dict__``, where ``cached_property`` stores its values, so
+        ``model_copy(update=...)`` would otherwise keep serving the old ones.
+        """
+        copy = super().model_copy(update=update, deep=deep)
+        for name in _SEQUENCE_CACHES:
+            copy.__dict__.pop(name, None)
+        return copy
+
+    @cached_property
+    def frame_arrays(self) -> dict[str, np.ndarray]:
+        """One read-only NumPy array per numeric frame field, built once per sequence.
+
+        Columnar consumers (DataFrame export, Rust analysis, lap checks) share these
+        arrays instead of each walking the frames again. The cache is never invalidated,
+        so the sequence must not be mutated once read.
+        """
+        frames = self.frames
+        arrays: dict[str, np.ndarray] = {}
+        for dtype, names in _COLUMN_FIELDS.items():
+            # One attrgetter call per frame reads every field of this dtype in C, and
+            # NumPy converts the resulting row tuples in bulk
+            rows = list(map(attrgetter(*names), frames))
+            table = np.array(rows, dtype=dtype).reshape(len(frames), len(names))
+            for index, name in enumerate(names):
+                array = np.ascontiguousarray(table[:, index])
+                array.flags.writeable = False
+                arrays[name] = array
+        return arrays
+
+    @cached_property
+    def frames_dataframe(self) -> "pd.DataFrame":
+        """The frames as a DataFrame with one row per frame, built once per sequence.
+
+        Numeric columns come from frame_arrays rather than dumping every frame, and share
+        their read-only buffers instead of copying them, so derive a new DataFrame (e.g.
+        with ``assign``) rather than writing to this one.
+        """
+        import pandas as pd
+
+        arrays = self.frame_arrays
+        return pd.DataFrame(
+            {
+                name: arrays[name]
+                if name in arrays
+                else [getattr(frame, name) for frame in self.frames]
+                for name in TelemetryFrame.model_fields
+            },
+            copy=False,
+        )
+
+    def frames_table(self) -> "pa.Table":
+        """The frames as a pyarrow Table with one column per frame field.
+
+        Numeric columns wrap the frame_arrays buffers, so the table is cheap to build and
+        goes straight to parquet without a pandas round trip.
+        """
+        import pyarrow as pa
+
+        arrays = self.frame_arrays
+        return pa.table(
+            {
+                name: arrays[name]
+                if name in arrays
+                else [getattr(frame, name) for frame in self.frames]
+                for name in TelemetryFrame.model_fields
+            }
+        )
+
+    @classmethod
+    def from_frames_table(cls, table: "pa.Table", **fields: Any) -> Self:
+        """Build a sequence from a table laid out like ``frames_table``.
+
+        Every frame is validated in one bulk call into pydantic-core, and the sequence's
+        ``frame_arrays`` are read-only views of the table's numeric columns rather than
+        being gathered again from the new frames. Any other fields are passed through.
+        """
+        # Converting whole columns and zipping them is faster than arrow's to_pylist,
+        # which builds each row dict itself
+        records = _column_records(table.to_pydict())
+        sequence = cls(frames=FRAME_LIST_ADAPTER.validate_python(records), **fields)
+
+        arrays: dict[str, np.ndarray] = {}
+        for dtype, names in _COLUMN_FIELDS.items():
+            for name in names:
+                # Single-chunk numeric columns without nulls convert without a copy
+                array = np.asarray(table.column(name).to_numpy(), dtype=dtype)
+                array.flags.writeable = False
+                arrays[name] = array
+        # Seed the cached_property so frame_arrays is not rebuilt from the frames
+        sequence.__dict__["frame_arrays"] = arrays
+        return sequence
+
 
 class LapTelemetry(TelemetrySequence):
     # frames: list[TelemetryFrame] = Field(
@@ -296,25 +555,32 @@ class LapTelemetry(TelemetrySequence):
         return v
 
     def to_parquet(self, file_path: str | Path) -> None:
-        """Save the LapTelemetry object to a Parquet file."""
-        df = pd.DataFrame([frame.model_dump() for frame in self.frames])
+        """Save the LapTelemetry object to a Parquet file.
 
-        df["lap_time"] = self.lap_time  # will add the value to all rows
+        The lap time is stored in the file metadata rather than repeated on every row.
+        """
+        import pyarrow.parquet as pq
 
-        df.to_parquet(file_path)
+        lap_time = "" if self.lap_time is None else str(self.lap_time)
+        table = self.frames_table().replace_schema_metadata({b"lap_time": lap_time.encode()})
+        pq.write_table(table, file_path)
 
     @classmethod
     def from_parquet(cls, file_path: str | Path):
-        """Load a LapTelemetry object from a Parquet file."""
-        df = pd.read_parquet(file_path)  # pyright: ignore[reportUnknownMemberType]
-
-        # lap_time = df["lap_time"].iloc[0]
+        """Load a LapTelemetry object from a Parquet file.
 
-        # df = df.drop(columns=["lap_time"])
+        Every frame is validated in one bulk call into pydantic-core, which is faster than
+        calling model_construct per frame and restores the field types parquet loses. The
+        numeric columns are kept as the lap's ``frame_arrays``.
+        """
+        import pyarrow.parquet as pq
 
-        frames = [TelemetryFrame(**row) for _, row in df.iterrows()]  # type: ignore
+        # Reading only the frame fields skips the lap_time column of older files and
+        # fails fast on older layouts
+        table = pq.read_table(file_path, columns=list(TelemetryFrame.model_fields))
 
-        return cls(frames=frames, lap_time=None)
+        lap_time = (table.schema.metadata or {}).get(b"lap_time", b"").decode()
+        return cls.from_frames_table(table, lap_time=float(lap_time) if lap_time else None)
 
     def get_lap_time(self):
         return self.frames[-1].session_time - self.frames[0].session_time
@@ -325,14 +591,89 @@ class LapTelemetry(TelemetrySequence):
         # Can check for current track surface and see if it is off-track
         # Can also check if the incident count has increased since the start of the lap
 
-        for i, frame in enumerate(self.frames):
-            # -1: not in world
-            # 0: off track
-            # 1: pit stall
-            # 2: approaching pits
-            # 3: on track
+        off_track = self.frame_arrays["track_surface"] != TrackSurface.ON_TRACK
+        if not off_track.any():
+            return True, -1
+
+        return False, int(off_track.argmax())
+
 
-            if frame.track_surface != 3:
-                return False, i
+class TelemetryFrameBuffer:
+    """Growable NumPy columns filled straight from telemetry samples.
 
-        return True, -1
+    ``append_irsdk`` writes each sample into one preallocated table per column dtype
+    without creating a TelemetryFrame. Frames are only built by ``to_sequence``, which
+    also hands the columns to the sequence as its ``frame_arrays``.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self._capacity = max(capacity, 1)
+        self._length = 0
+        self._timestamps: list[datetime] = []
+        self._tables = {
+            dtype: np.empty((self._capacity, len(names)), dtype=dtype)
+            for dtype, names in _COLUMN_FIELDS.items()
+        }
+        self._getters = {dtype: itemgetter(*names) for dtype, names in _COLUMN_FIELDS.items()}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append_irsdk(self, source: TelemetryDataSource, timestamp: datetime) -> None:
+        """Append one sample read from a telemetry data source.
+
+        Each value is converted to the dtype of its column as it is written.
+
+        Raises:
+            KeyError: If required telemetry variables are missing.
+            ValueError: If a telemetry variable cannot be converted to its column dtype.
+        """
+        values = TelemetryFrame._irsdk_fields(source, timestamp)  # pyright: ignore[reportPrivateUsage]
+        index = self._length
+        if index == self._capacity:
+            self._grow()
+        for dtype, table in self._tables.items():
+            table[index] = self._getters[dtype](values)
+        self._timestamps.append(timestamp)
+        self._length = index + 1
+
+    def frame_arrays(self) -> dict[str, np.ndarray]:
+        """One read-only array per numeric frame field, as ``TelemetrySequence.frame_arrays``."""
+        arrays: dict[str, np.ndarray] = {}
+        for dtype, names in _COLUMN_FIELDS.items():
+            table = self._tables[dtype][: self._length]
+            for index, name in enumerate(names):
+                array = np.ascontiguousarray(table[:, index])
+                array.flags.writeable = False
+                arrays[name] = array
+        return arrays
+
+    def to_sequence[S: TelemetrySequence](self, sequence_type: type[S], **fields: Any) -> S:
+        """Build a sequence of the buffered frames, passing any other fields through.
+
+        The sequence's ``frame_arrays`` are taken from the buffer instead of being
+        gathered again from the new frames.
+        """
+        arrays = self.frame_arrays()
+        columns: dict[str, list[Any]] = {name: array.tolist() for name, array in arrays.items()}
+        columns["timestamp"] = self._timestamps
+        # One pydantic-core call builds the frames faster than model_construct per frame
+        frames = FRAME_LIST_ADAPTER.validate_python(_column_records(columns))
+
+        sequence = sequence_type(frames=frames, **fields)
+        # Seed the cached_property so frame_arrays is not rebuilt from the frames
+        sequence.__dict__["frame_arrays"] = arrays
+        return sequence
+
+    def clear(self) -> None:
+        """Drop the buffered samples, keeping the allocated tables for reuse."""
+        self._length = 0
+        self._timestamps = []
+
+    def _grow(self) -> None:
+        """Double the capacity of every table."""
+        self._capacity *= 2
+        for dtype, table in self._tables.items():
+            grown = np.empty((self._capacity, table.shape[1]), dtype=dtype)
+            grown[: self._length] = table[: self._length]
+            self._tables[dtype] = grown
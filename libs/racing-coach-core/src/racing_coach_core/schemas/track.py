@@ -3,19 +3,65 @@
 import logging
 from collections.abc import Iterator
 from pathlib import Path
-from typing import Self
+from typing import TYPE_CHECKING, Annotated, Self
 
 import numpy as np
-import pandas as pd
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    TypeAdapter,
+    WithJsonSchema,
+)
 
-from .telemetry import TelemetryFrame, TelemetrySequence
+from .telemetry import FRAME_LIST_ADAPTER, TelemetryFrame, TelemetrySequence
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 # Earth radius in meters
 EARTH_RADIUS_M = 6_371_000
 
+FloatArray = Annotated[
+    np.ndarray,
+    PlainValidator(lambda value: np.asarray(value, dtype=np.float64)),
+    PlainSerializer(lambda array: array.tolist(), return_type=list[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+"""float64 array field that accepts any sequence of floats and dumps back to a list."""
+
+_BOUNDARY_ARRAY_FIELDS = (
+    "grid_distance_pct",
+    "left_latitude",
+    "left_longitude",
+    "right_latitude",
+    "right_longitude",
+)
+
+
+def _interpolate_boundary(
+    lap_data: "pd.DataFrame", grid: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Interpolate a boundary lap's coordinates onto a lap distance grid.
+
+    Args:
+        lap_data: DataFrame with lap_distance_pct, latitude, longitude columns
+        grid: Lap distance percentages to interpolate at
+
+    Returns:
+        Tuple of (latitudes, longitudes) at each grid point
+    """
+    # np.unique sorts the distances and keeps the first sample of each in one pass,
+    # replacing a pandas sort_values and drop_duplicates over the whole frame
+    dist, first = np.unique(lap_data["lap_distance_pct"].to_numpy(), return_index=True)
+    lat = lap_data["latitude"].to_numpy()[first]
+    lon = lap_data["longitude"].to_numpy()[first]
+    return np.interp(grid, dist, lat), np.interp(grid, dist, lon)
+
 
 def _calculate_track_length(latitudes: np.ndarray, longitudes: np.ndarray) -> float:
     """
@@ -63,13 +109,13 @@ class TrackBoundary(BaseModel):
 
     # Boundary data - stored as aligned arrays for efficient computation
     # All arrays have the same length (grid_size)
-    grid_distance_pct: list[float] = Field(
+    grid_distance_pct: FloatArray = Field(
         description="Normalized lap distance grid points (0.0 to 1.0)"
     )
-    left_latitude: list[float] = Field(description="Left boundary latitudes")
-    left_longitude: list[float] = Field(description="Left boundary longitudes")
-    right_latitude: list[float] = Field(description="Right boundary latitudes")
-    right_longitude: list[float] = Field(description="Right boundary longitudes")
+    left_latitude: FloatArray = Field(description="Left boundary latitudes")
+    left_longitude: FloatArray = Field(description="Left boundary longitudes")
+    right_latitude: FloatArray = Field(description="Right boundary latitudes")
+    right_longitude: FloatArray = Field(description="Right boundary longitudes")
 
     # Metadata
     grid_size: int = Field(description="Number of grid points")
@@ -80,13 +126,28 @@ class TrackBoundary(BaseModel):
         description="Total track length in meters, calculated from centerline"
     )
 
+    def __eq__(self, other: object) -> bool:
+        """Compare by field value, using ``np.array_equal`` for the boundary arrays.
+
+        pydantic's generated ``__eq__`` compares ndarray fields element-wise, which
+        cannot be reduced to a single bool.
+        """
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            np.array_equal(getattr(self, name), getattr(other, name))
+            if name in _BOUNDARY_ARRAY_FIELDS
+            else getattr(self, name) == getattr(other, name)
+            for name in type(self).model_fields
+        )
+
     @classmethod
     def from_boundary_laps(
         cls,
         track_id: int,
         track_name: str,
-        left_lap_data: pd.DataFrame,  # columns: lap_distance_pct, latitude, longitude
-        right_lap_data: pd.DataFrame,  # columns: lap_distance_pct, latitude, longitude
+        left_lap_data: "pd.DataFrame",  # columns: lap_distance_pct, latitude, longitude
+        right_lap_data: "pd.DataFrame",  # columns: lap_distance_pct, latitude, longitude
         track_config_name: str | None = None,
         grid_size: int = 1000,
     ) -> Self:
@@ -109,31 +170,8 @@ class TrackBoundary(BaseModel):
         # Create uniform grid from 0.0 to just under 1.0
         grid = np.linspace(0.0, 1.0, grid_size, endpoint=True)
 
-        # Process left boundary
-        left_sorted = left_lap_data.sort_values("lap_distance_pct").drop_duplicates(
-            subset="lap_distance_pct", keep="first"
-        )
-
-        # Ensure we have data at 0.0 and near 1.0 for proper interpolation
-        left_dist = left_sorted["lap_distance_pct"].values
-        left_lat = left_sorted["latitude"].values
-        left_lon = left_sorted["longitude"].values
-
-        # Use numpy interp with handling for wrap-around
-        left_lat_interp = np.interp(grid, left_dist, left_lat)
-        left_lon_interp = np.interp(grid, left_dist, left_lon)
-
-        # Process right boundary
-        right_sorted = right_lap_data.sort_values("lap_distance_pct").drop_duplicates(
-            subset="lap_distance_pct", keep="first"
-        )
-
-        right_dist = right_sorted["lap_distance_pct"].values
-        right_lat = right_sorted["latitude"].values
-        right_lon = right_sorted["longitude"].values
-
-        right_lat_interp = np.interp(grid, right_dist, right_lat)
-        right_lon_interp = np.interp(grid, right_dist, right_lon)
+        left_lat_interp, left_lon_interp = _interpolate_boundary(left_lap_data, grid)
+        right_lat_interp, right_lon_interp = _interpolate_boundary(right_lap_data, grid)
 
         # Calculate centerline and track length
         center_lat = (left_lat_interp + right_lat_interp) / 2
@@ -150,19 +188,52 @@ class TrackBoundary(BaseModel):
             track_id=track_id,
             track_name=track_name,
             track_config_name=track_config_name,
-            grid_distance_pct=grid.tolist(),
-            left_latitude=left_lat_interp.tolist(),
-            left_longitude=left_lon_interp.tolist(),
-            right_latitude=right_lat_interp.tolist(),
-            right_longitude=right_lon_interp.tolist(),
+            grid_distance_pct=grid,
+            left_latitude=left_lat_interp,
+            left_longitude=left_lon_interp,
+            right_latitude=right_lat_interp,
+            right_longitude=right_lon_interp,
             grid_size=grid_size,
             source_left_frames=len(left_lap_data),
             source_right_frames=len(right_lap_data),
             track_length=track_length,
         )
 
+    def boundary_at(
+        self, lap_distance_pct: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Interpolate the boundaries at each lap distance percentage.
+
+        The grid is treated as uniform with spacing 1 / grid_size and wraps around at the
+        end of the lap, so each point is found by direct indexing rather than a search.
+
+        Args:
+            lap_distance_pct: Array of lap distance percentages (wrapped into [0, 1))
+
+        Returns:
+            Tuple of (left_lat, left_lon, right_lat, right_lon) arrays at each point
+        """
+        idx_float = (lap_distance_pct % 1.0) / (1.0 / self.grid_size)
+        idx_low = idx_float.astype(np.intp)
+        t = idx_float - idx_low
+        idx_low = idx_low % self.grid_size
+        idx_high = (idx_low + 1) % self.grid_size
+
+        def interp(values: np.ndarray) -> np.ndarray:
+            low = values[idx_low]
+            return low + t * (values[idx_high] - low)
+
+        return (
+            interp(self.left_latitude),
+            interp(self.left_longitude),
+            interp(self.right_latitude),
+            interp(self.right_longitude),
+        )
+
     def to_parquet(self, file_path: str | Path) -> None:
         """Save track boundary to Parquet format."""
+        import pandas as pd
         import pyarrow as pa
         import pyarrow.parquet as pq
 
@@ -230,11 +301,11 @@ class TrackBoundary(BaseModel):
             track_id=int(get_meta("track_id", "0")),
             track_name=get_meta("track_name", "Unknown"),
             track_config_name=track_config_name if track_config_name else None,
-            grid_distance_pct=df["grid_distance_pct"].tolist(),
-            left_latitude=df["left_latitude"].tolist(),
-            left_longitude=df["left_longitude"].tolist(),
-            right_latitude=df["right_latitude"].tolist(),
-            right_longitude=df["right_longitude"].tolist(),
+            grid_distance_pct=df["grid_distance_pct"].to_numpy(),
+            left_latitude=df["left_latitude"].to_numpy(),
+            left_longitude=df["left_longitude"].to_numpy(),
+            right_latitude=df["right_latitude"].to_numpy(),
+            right_longitude=df["right_longitude"].to_numpy(),
             grid_size=int(get_meta("grid_size", str(len(df)))),
             source_left_frames=int(get_meta("source_left_frames", "0")),
             source_right_frames=int(get_meta("source_right_frames", "0")),
@@ -262,12 +333,17 @@ class AugmentedTelemetryFrame(TelemetryFrame):
         lateral_position: float,
     ) -> Self:
         """Create an AugmentedTelemetryFrame from a TelemetryFrame."""
+        # The frame's field values are passed as they are instead of going through
+        # model_dump, which runs the serializer for every field
         return cls(
-            **frame.model_dump(),
+            **frame.__dict__,
             lateral_position=lateral_position,
         )
 
 
+_AUGMENTED_FRAME_LIST_ADAPTER = TypeAdapter(list[AugmentedTelemetryFrame])
+
+
 class AugmentedTelemetrySequence(BaseModel):
     """
     Efficient storage for augmented telemetry data.
@@ -296,6 +372,17 @@ class AugmentedTelemetrySequence(BaseModel):
         for frame, lat_pos in zip(self.frames, self.lateral_positions):
             yield AugmentedTelemetryFrame.from_telemetry_frame(frame, lat_pos)
 
+    def augmented_frames(self) -> list[AugmentedTelemetryFrame]:
+        """All frames as AugmentedTelemetryFrames, validated together in one call.
+
+        Faster than consuming ``iter_augmented`` when every frame is needed.
+        """
+        records = [
+            {**frame.__dict__, "lateral_position": lat_pos}
+            for frame, lat_pos in zip(self.frames, self.lateral_positions, strict=True)
+        ]
+        return _AUGMENTED_FRAME_LIST_ADAPTER.validate_python(records)
+
     @classmethod
     def from_telemetry_sequence(
         cls,
@@ -312,31 +399,30 @@ class AugmentedTelemetrySequence(BaseModel):
 
     def to_parquet(self, file_path: str | Path) -> None:
         """Save to Parquet with lateral positions included."""
-        file_path = Path(file_path)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
 
-        # Convert frames to dict and add lateral positions
-        data = []
-        for frame, lat_pos in zip(self.frames, self.lateral_positions):
-            frame_dict = frame.model_dump()
-            frame_dict["lateral_position"] = lat_pos
-            data.append(frame_dict)
+        file_path = Path(file_path)
 
-        df = pd.DataFrame(data)
-        df.to_parquet(file_path)
+        # Build the frame columns in bulk rather than dumping every frame
+        table = TelemetrySequence.model_construct(frames=self.frames).frames_table()
+        table = table.append_column(
+            "lateral_position", pa.array(self.lateral_positions, type=pa.float64())
+        )
+        pq.write_table(table, file_path)
 
         logger.info(f"Saved AugmentedTelemetrySequence ({len(self)} frames) to {file_path}")
 
     @classmethod
     def from_parquet(cls, file_path: str | Path) -> Self:
         """Load from Parquet."""
-        file_path = Path(file_path)
-        df = pd.read_parquet(file_path)
+        import pyarrow.parquet as pq
 
-        # Extract lateral positions
-        lateral_positions = df["lateral_position"].tolist()
+        file_path = Path(file_path)
+        table = pq.read_table(file_path)
 
-        # Remove lateral_position column and create TelemetryFrames
-        df = df.drop(columns=["lateral_position"])
-        frames = [TelemetryFrame(**row) for _, row in df.iterrows()]  # type: ignore
+        lateral_positions = table.column("lateral_position").to_pylist()
+        records = table.drop_columns("lateral_position").to_pylist()
+        frames = FRAME_LIST_ADAPTER.validate_python(records)
 
         return cls(frames=frames, lateral_positions=lateral_positions)
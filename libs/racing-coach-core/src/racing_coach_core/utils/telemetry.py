@@ -2,49 +2,87 @@ from datetime import datetime
 from pathlib import Path
 
 import irsdk  # pyright: ignore[reportMissingTypeStubs]
+import numpy as np
 
-from racing_coach_core.schemas.telemetry import SessionFrame, TelemetryFrame, TelemetrySequence
+from racing_coach_core.schemas.telemetry import (
+    FRAME_LIST_ADAPTER,
+    IRSDK_VARIABLES,
+    SessionFrame,
+    TelemetrySequence,
+)
 
 
-class _IBTFrameAdapter:
-    """Adapter to provide dict-like access to IBT frame data for TelemetryDataSource protocol."""
+def _read_ibt_column(ibt: irsdk.IBT, key: str) -> list[object] | None:
+    """Read every sample of an IBT variable, or None if the file does not record it.
 
-    def __init__(self, ibt: irsdk.IBT, frame_idx: int) -> None:
-        self._ibt = ibt
-        self._frame_idx = frame_idx
+    Returns the same values as ``ibt.get_all``, which unpacks one sample at a time in a
+    Python loop. Here the samples are read through a strided NumPy view of the file's
+    memory map and converted to Python objects in a single ``tolist`` call.
 
-    def __getitem__(self, key: str) -> object:
-        return self._ibt.get(self._frame_idx, key)  # pyright: ignore[reportUnknownMemberType]
+    The view relies on pyirsdk internals. If a pyirsdk release no longer has them, the
+    column is read with ``ibt.get_all`` instead.
+    """
+    try:
+        var_header = ibt._var_headers_dict.get(key)  # pyright: ignore[reportPrivateUsage]
+        header = ibt._header  # pyright: ignore[reportPrivateUsage]
+        record_count = ibt._disk_header.session_record_count  # pyright: ignore[reportPrivateUsage]
+        shared_mem = ibt._shared_mem  # pyright: ignore[reportPrivateUsage]
+    except AttributeError:
+        return ibt.get_all(key)  # pyright: ignore[reportUnknownMemberType]
+
+    if var_header is None:
+        return None
+
+    dtype = np.dtype(irsdk.VAR_TYPE_MAP[var_header.type])
+    is_array = var_header.count > 1
+    samples = np.ndarray(
+        shape=(record_count, var_header.count) if is_array else (record_count,),
+        dtype=dtype,
+        buffer=shared_mem,
+        offset=header.var_buf[0].buf_offset + var_header.offset,
+        strides=(header.buf_len, dtype.itemsize) if is_array else (header.buf_len,),
+    )
+    # The view must not outlive this call, since ibt.close() unmaps the file
+    return samples.tolist()
 
 
 def get_telemetry_sequence_from_ibt(ibt_path: str | Path) -> TelemetrySequence:
     """Read an IBT file and convert it to a TelemetrySequence
 
+    Each SDK variable is read once for the whole file straight from its memory map, and
+    the frames are validated together from the resulting columns.
+
     Args:
         ibt_path (str | Path): path to the IBT file
 
     Returns:
         TelemetrySequence: sequence of TelemetryFrame objects
+
+    Raises:
+        ValueError: If the file does not record a variable a TelemetryFrame needs
     """
     ibt = irsdk.IBT()
     ibt.open(ibt_file=ibt_path)  # pyright: ignore[reportUnknownMemberType]
 
     try:
-        session_times: list[float] | None = ibt.get_all("SessionTime")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-        total_frames = len(session_times) if session_times else 0
-
-        frames: list[TelemetryFrame] = []
-        timestamp = datetime.now()
-
-        for frame_idx in range(total_frames):
-            adapter = _IBTFrameAdapter(ibt, frame_idx)
-            frame = TelemetryFrame.from_irsdk(adapter, timestamp)
-            frames.append(frame)
-
-        return TelemetrySequence(frames=frames)
+        columns: dict[str, list[object] | None] = {
+            name: _read_ibt_column(ibt, variable) for name, variable in IRSDK_VARIABLES.items()
+        }
     finally:
         ibt.close()  # pyright: ignore[reportUnknownMemberType]
 
+    missing = [IRSDK_VARIABLES[name] for name, column in columns.items() if column is None]
+    if missing:
+        raise ValueError(f"IBT file {ibt_path} does not record {', '.join(missing)}")
+
+    timestamp = datetime.now()
+    names = (*columns, "timestamp")
+    records = [
+        dict(zip(names, (*values, timestamp), strict=True))
+        for values in zip(*columns.values(), strict=True)  # pyright: ignore[reportArgumentType]
+    ]
+    return TelemetrySequence(frames=FRAME_LIST_ADAPTER.validate_python(records))
+
 
 def get_session_frame_from_ibt(ibt_path: str | Path) -> SessionFrame:
     """Read an IBT file and extract session metadata.
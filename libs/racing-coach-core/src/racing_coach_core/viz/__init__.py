@@ -8,16 +8,9 @@ The CLI (python -m racing_coach_core.viz) requires the racing-coach-server-clien
 package. Install with: uv add racing-coach-core[viz-cli]
 """
 
-from .boundary import (
-    BOUNDARY_COLORS,
-    LATERAL_COLORSCALE,
-    create_augmented_telemetry_chart,
-    create_lateral_position_chart,
-    create_telemetry_with_lateral_chart,
-    create_track_boundary_map,
-    create_track_map_with_lateral_position,
-    create_track_map_with_racing_line,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .protocols import (
     BrakingZoneProtocol,
     CornerProtocol,
@@ -26,7 +19,43 @@ from .protocols import (
     TelemetryDataProtocol,
     TelemetryFrameProtocol,
 )
-from .report import generate_lap_report
+
+if TYPE_CHECKING:
+    from .boundary import (
+        BOUNDARY_COLORS,
+        LATERAL_COLORSCALE,
+        create_augmented_telemetry_chart,
+        create_lateral_position_chart,
+        create_telemetry_with_lateral_chart,
+        create_track_boundary_map,
+        create_track_map_with_lateral_position,
+        create_track_map_with_racing_line,
+    )
+    from .report import generate_lap_report, write_lap_report
+
+# The chart modules import plotly, so they are only loaded once one of their names is used
+_LAZY_ATTRIBUTES = {
+    "BOUNDARY_COLORS": ".boundary",
+    "LATERAL_COLORSCALE": ".boundary",
+    "create_augmented_telemetry_chart": ".boundary",
+    "create_lateral_position_chart": ".boundary",
+    "create_telemetry_with_lateral_chart": ".boundary",
+    "create_track_boundary_map": ".boundary",
+    "create_track_map_with_lateral_position": ".boundary",
+    "create_track_map_with_racing_line": ".boundary",
+    "generate_lap_report": ".report",
+    "write_lap_report": ".report",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Protocols for type hints
@@ -47,4 +76,5 @@ __all__ = [
     "create_track_map_with_racing_line",
     # Report generation
     "generate_lap_report",
+    "write_lap_report",
 ]
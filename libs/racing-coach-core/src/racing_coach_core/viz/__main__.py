@@ -16,12 +16,19 @@ Usage:
     # Generate visualization for a lap
     python -m racing_coach_core.viz --server http://localhost:8000 --lap LAP_ID
 
+    # Generate visualizations for every lap in a session
+    python -m racing_coach_core.viz --server http://localhost:8000 --session SESSION_ID
+
     # Options
     --output FILE    # Save to specific file (default: lap_<LAP_ID>.html)
+                     # With --session, the directory to save reports in
     --no-open        # Don't auto-open in browser
+    --skip-invalid   # Don't generate reports for laps marked invalid
 """
 
 import argparse
+import asyncio
+import importlib.util
 import sys
 import webbrowser
 from pathlib import Path
@@ -30,20 +37,6 @@ from uuid import UUID
 try:
     import httpx
     from racing_coach_server_client import Client
-    from racing_coach_server_client.api.metrics import (
-        get_lap_metrics_api_v1_metrics_lap_lap_id_get,
-    )
-    from racing_coach_server_client.api.sessions import (
-        get_lap_telemetry,
-        get_session_detail,
-        get_sessions_list,
-    )
-    from racing_coach_server_client.models import (
-        LapMetricsResponse,
-        LapTelemetryResponse,
-        SessionDetailResponse,
-        SessionListResponse,
-    )
 except ImportError:
     print(
         "Error: The viz CLI requires racing-coach-server-client package.",
@@ -52,7 +45,15 @@ except ImportError:
     print("Install with: uv add racing-coach-core[viz-cli]", file=sys.stderr)
     sys.exit(1)
 
-from .report import generate_lap_report
+from pydantic import BaseModel
+
+from ..schemas.responses import (
+    LapDetailResponse,
+    LapMetricsResponse,
+    LapTelemetryResponse,
+    SessionDetailResponse,
+    SessionListResponse,
+)
 
 
 def main() -> int:
@@ -87,31 +88,46 @@ def main() -> int:
         metavar="LAP_ID",
         help="Generate visualization for a specific lap",
     )
+    action_group.add_argument(
+        "--session",
+        metavar="SESSION_ID",
+        help="Generate visualizations for every lap in a session",
+    )
 
     # Output options
     parser.add_argument(
         "--output",
         "-o",
         metavar="FILE",
-        help="Output file path (default: lap_<LAP_ID>.html)",
+        help="Output file path (default: lap_<LAP_ID>.html), or directory with --session",
     )
     parser.add_argument(
         "--no-open",
         action="store_true",
         help="Don't auto-open the report in browser",
     )
+    parser.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="Don't generate reports for laps marked invalid",
+    )
 
     args = parser.parse_args()
 
     try:
-        client = Client(base_url=args.server)
-
-        if args.list_sessions:
-            return list_sessions(client)
-        elif args.list_laps:
-            return list_laps(client, args.list_laps)
-        elif args.lap:
-            return visualize_lap(client, args.lap, args.output, not args.no_open)
+        with Client(base_url=args.server, httpx_args=client_httpx_args()) as client:
+            if args.list_sessions:
+                return list_sessions(client)
+            elif args.list_laps:
+                return list_laps(client, args.list_laps)
+            elif args.lap:
+                return visualize_lap(
+                    client, args.lap, args.output, not args.no_open, args.skip_invalid
+                )
+            elif args.session:
+                return visualize_session(
+                    client, args.session, args.output, not args.no_open, args.skip_invalid
+                )
 
     except httpx.HTTPStatusError as e:
         print(f"HTTP error: {e}", file=sys.stderr)
@@ -129,9 +145,9 @@ def main() -> int:
 def list_sessions(client: Client) -> int:
     """List all sessions."""
     print("Fetching sessions...")
-    response = get_sessions_list.sync(client=client)
+    response = fetch_model(client, "/api/v1/sessions", SessionListResponse)
 
-    if not isinstance(response, SessionListResponse) or not response.sessions:
+    if response is None or not response.sessions:
         print("No sessions found.")
         return 0
 
@@ -139,6 +155,8 @@ def list_sessions(client: Client) -> int:
     print(f"{'ID':<38} {'Track':<30} {'Car':<25} {'Laps':<6} {'Date'}")
     print("-" * 120)
 
+    # Write the table in one call rather than a print per row
+    rows: list[str] = []
     for session in response.sessions:
         track = session.track_name
         if session.track_config_name:
@@ -152,17 +170,20 @@ def list_sessions(client: Client) -> int:
 
         date_str = session.created_at.strftime("%Y-%m-%d %H:%M")
 
-        print(f"{session.session_id:<38} {track:<30} {car:<25} {session.lap_count:<6} {date_str}")
+        rows.append(
+            f"{session.session_id:<38} {track:<30} {car:<25} {session.lap_count:<6} {date_str}\n"
+        )
 
+    sys.stdout.write("".join(rows))
     return 0
 
 
 def list_laps(client: Client, session_id: str) -> int:
     """List laps in a session."""
     print(f"Fetching session {session_id}...")
-    session = get_session_detail.sync(UUID(session_id), client=client)
+    session = fetch_model(client, f"/api/v1/sessions/{UUID(session_id)}", SessionDetailResponse)
 
-    if not isinstance(session, SessionDetailResponse):
+    if session is None:
         print(f"Error: Could not fetch session {session_id}", file=sys.stderr)
         return 1
 
@@ -181,13 +202,15 @@ def list_laps(client: Client, session_id: str) -> int:
     print(f"{'#':<4} {'Lap ID':<38} {'Time':<12} {'Valid':<7} {'Metrics'}")
     print("-" * 80)
 
+    rows: list[str] = []
     for lap in session.laps:
         lap_time = format_lap_time(lap.lap_time) if lap.lap_time else "N/A"
         valid = "Yes" if lap.is_valid else "No"
         metrics = "Yes" if lap.has_metrics else "No"
 
-        print(f"{lap.lap_number:<4} {lap.lap_id:<38} {lap_time:<12} {valid:<7} {metrics}")
+        rows.append(f"{lap.lap_number:<4} {lap.lap_id:<38} {lap_time:<12} {valid:<7} {metrics}\n")
 
+    sys.stdout.write("".join(rows))
     return 0
 
 
@@ -196,65 +219,54 @@ def visualize_lap(
     lap_id: str,
     output_path: str | None,
     open_browser: bool,
+    skip_invalid: bool = False,
 ) -> int:
     """Generate visualization for a lap."""
+    from .report import write_lap_report  # imports plotly, which the listings don't need
+
     print(f"Fetching data for lap {lap_id}...")
+    lap_uuid = UUID(lap_id)
 
-    # First, we need to find the session for this lap
-    # We'll get all sessions and find which one contains this lap
-    sessions = get_sessions_list.sync(client=client)
-    if not isinstance(sessions, SessionListResponse):
-        print("Error: Could not fetch sessions", file=sys.stderr)
+    # Look up the lap's session directly instead of searching every session for it
+    lap = fetch_model(client, f"/api/v1/sessions/laps/{lap_uuid}", LapDetailResponse)
+    if lap is None:
+        print(f"Error: Lap {lap_id} not found", file=sys.stderr)
         return 1
 
-    session_id: str | None = None
-    session_detail: SessionDetailResponse | None = None
+    if skip_invalid and not lap.is_valid:
+        print(f"  Lap {lap.lap_number} is marked invalid, skipping")
+        return 0
 
-    for session_summary in sessions.sessions:
-        session = get_session_detail.sync(UUID(session_summary.session_id), client=client)
-        if not isinstance(session, SessionDetailResponse):
-            continue
-        for lap in session.laps:
-            if lap.lap_id == lap_id:
-                session_id = session_summary.session_id
-                session_detail = session
-                break
-        if session_id:
-            break
-
-    if not session_id or not session_detail:
-        print(f"Error: Lap {lap_id} not found in any session", file=sys.stderr)
+    session_id = lap.session_id
+    session_detail = fetch_model(client, f"/api/v1/sessions/{session_id}", SessionDetailResponse)
+    if session_detail is None:
+        print(f"Error: Could not fetch session {session_id}", file=sys.stderr)
         return 1
 
     print(f"  Found in session: {session_detail.track_name}")
 
-    # Fetch telemetry
-    print("  Fetching telemetry...")
-    telemetry = get_lap_telemetry.sync(UUID(session_id), UUID(lap_id), client=client)
-    if not isinstance(telemetry, LapTelemetryResponse):
+    # Telemetry and metrics are independent, so fetch them concurrently
+    print("  Fetching telemetry and metrics...")
+    [(telemetry, metrics)] = asyncio.run(fetch_session_laps(client, session_id, [lap_id]))
+    if telemetry is None:
         print("Error: Could not fetch telemetry", file=sys.stderr)
         return 1
     print(f"  Got {telemetry.frame_count} telemetry frames")
 
-    # Try to fetch metrics (may not exist)
-    metrics: LapMetricsResponse | None = None
-    print("  Fetching metrics...")
-    metrics_response = get_lap_metrics_api_v1_metrics_lap_lap_id_get.sync(lap_id, client=client)
-    if isinstance(metrics_response, LapMetricsResponse):
-        metrics = metrics_response
+    # Metrics may not exist yet
+    if metrics is not None:
         print(f"  Got {metrics.total_braking_zones} braking zones, {metrics.total_corners} corners")
     else:
         print("  No metrics available for this lap")
 
     # Generate report
     print("  Generating visualization...")
-    html = generate_lap_report(telemetry, metrics, session_detail)
-
     # Determine output path
     out_file = Path(output_path) if output_path else Path(f"lap_{lap_id[:8]}.html")
 
-    # Write file
-    out_file.write_text(html)
+    # Stream the report straight into the file
+    with out_file.open("w") as file:
+        write_lap_report(file, telemetry, metrics, session_detail)
     print(f"\nReport saved to: {out_file.absolute()}")
 
     # Open in browser
@@ -265,6 +277,157 @@ def visualize_lap(
     return 0
 
 
+def visualize_session(
+    client: Client,
+    session_id: str,
+    output_dir: str | None,
+    open_browser: bool,
+    skip_invalid: bool = False,
+) -> int:
+    """Generate visualizations for every lap in a session."""
+    from .report import write_lap_report  # imports plotly, which the listings don't need
+
+    print(f"Fetching session {session_id}...")
+    session = fetch_model(client, f"/api/v1/sessions/{UUID(session_id)}", SessionDetailResponse)
+
+    if session is None:
+        print(f"Error: Could not fetch session {session_id}", file=sys.stderr)
+        return 1
+
+    # Drop invalid laps before fetching so their telemetry is never downloaded
+    session_laps = [lap for lap in session.laps if lap.is_valid or not skip_invalid]
+    if not session_laps:
+        print("No valid laps in this session." if session.laps else "No laps in this session.")
+        return 0
+
+    print(f"  Fetching telemetry and metrics for {len(session_laps)} lap(s)...")
+    lap_ids = [lap.lap_id for lap in session_laps]
+    laps = asyncio.run(fetch_session_laps(client, session.session_id, lap_ids))
+
+    out_dir = Path(output_dir) if output_dir else Path()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    out_files: list[Path] = []
+    for lap, (telemetry, metrics) in zip(session_laps, laps, strict=True):
+        if telemetry is None:
+            print(f"  Lap {lap.lap_number}: could not fetch telemetry, skipping")
+            continue
+
+        out_file = out_dir / f"lap_{lap.lap_id[:8]}.html"
+        with out_file.open("w") as file:
+            write_lap_report(file, telemetry, metrics, session)
+        out_files.append(out_file)
+        print(f"  Lap {lap.lap_number}: saved to {out_file}")
+
+    print(f"\nSaved {len(out_files)} report(s) to: {out_dir.absolute()}")
+
+    # Open the first report in browser
+    if open_browser and out_files:
+        print("Opening in browser...")
+        webbrowser.open(f"file://{out_files[0].absolute()}")
+
+    return 0
+
+
+async def fetch_session_laps(
+    client: Client,
+    session_id: str,
+    lap_ids: list[str],
+    max_concurrency: int = 16,
+) -> list[tuple[LapTelemetryResponse | None, LapMetricsResponse | None]]:
+    """
+    Fetch telemetry and metrics for many laps concurrently.
+
+    All requests share the client's async connection pool, so a whole session costs
+    roughly one round trip per ``max_concurrency`` laps instead of two per lap.
+
+    Args:
+        client: API client whose async HTTP connection pool is used
+        session_id: Session the laps belong to
+        lap_ids: Laps to fetch
+        max_concurrency: Maximum number of requests in flight at once
+
+    Returns:
+        A (telemetry, metrics) pair per lap, in the order of ``lap_ids``
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    lap_uuids = [UUID(lap_id) for lap_id in lap_ids]
+
+    async def fetch[M: BaseModel](url: str, model: type[M]) -> M | None:
+        async with semaphore:
+            return await afetch_model(client, url, model)
+
+    async with client:
+        telemetry, metrics = await asyncio.gather(
+            asyncio.gather(
+                *(
+                    fetch(
+                        f"/api/v1/sessions/{session_id}/laps/{lap_uuid}/telemetry",
+                        LapTelemetryResponse,
+                    )
+                    for lap_uuid in lap_uuids
+                )
+            ),
+            asyncio.gather(
+                *(
+                    fetch(f"/api/v1/metrics/lap/{lap_uuid}", LapMetricsResponse)
+                    for lap_uuid in lap_uuids
+                )
+            ),
+        )
+
+    return list(zip(telemetry, metrics, strict=True))
+
+
+def client_httpx_args() -> dict[str, object]:
+    """
+    Connection settings for the HTTP clients behind the API client.
+
+    Every request of a CLI run goes to the same server, so the connection pool keeps its
+    connections alive between calls. HTTP/2 lets the concurrent lap requests of ``--session``
+    share one connection to an HTTPS server. It needs the ``h2`` package (``httpx[http2]``,
+    part of the ``viz-cli`` extra) and is only enabled when that is installed.
+
+    Returns:
+        Keyword arguments for both the sync and the async ``httpx`` client
+    """
+    return {
+        "http2": importlib.util.find_spec("h2") is not None,
+        "limits": httpx.Limits(max_keepalive_connections=32, keepalive_expiry=30),
+    }
+
+
+def fetch_model[M: BaseModel](client: Client, url: str, model: type[M]) -> M | None:
+    """
+    GET a resource and decode the raw response body straight into a core response model.
+
+    The generated client turns a response into a dict with ``response.json()`` and then
+    walks it again in ``from_dict``, frame by frame for lap telemetry. Validating the raw
+    bytes with ``model_validate_json`` parses and validates in a single pass inside
+    pydantic-core instead.
+
+    Args:
+        client: API client whose HTTP connection is reused
+        url: Request path relative to the server URL
+        model: Response model to decode into
+
+    Returns:
+        The decoded model, or None if the server did not return 200
+    """
+    response = client.get_httpx_client().get(url)
+    if response.status_code != 200:
+        return None
+    return model.model_validate_json(response.content)
+
+
+async def afetch_model[M: BaseModel](client: Client, url: str, model: type[M]) -> M | None:
+    """Async version of ``fetch_model`` using the client's async connection pool."""
+    response = await client.get_async_httpx_client().get(url)
+    if response.status_code != 200:
+        return None
+    return model.model_validate_json(response.content)
+
+
 def format_lap_time(seconds: float | None) -> str:
     """Format lap time as M:SS.mmm."""
     if seconds is None:
@@ -54,10 +54,10 @@ def create_track_boundary_map(
     """
     fig = go.Figure()
 
-    left_lon = np.array(boundary.left_longitude)
-    left_lat = np.array(boundary.left_latitude)
-    right_lon = np.array(boundary.right_longitude)
-    right_lat = np.array(boundary.right_latitude)
+    left_lon = np.asarray(boundary.left_longitude)
+    left_lat = np.asarray(boundary.left_latitude)
+    right_lon = np.asarray(boundary.right_longitude)
+    right_lat = np.asarray(boundary.right_latitude)
 
     # Left boundary
     fig.add_trace(
@@ -164,10 +164,10 @@ def create_track_map_with_racing_line(
 
     # Track boundaries
     if show_boundaries:
-        left_lon = np.array(boundary.left_longitude)
-        left_lat = np.array(boundary.left_latitude)
-        right_lon = np.array(boundary.right_longitude)
-        right_lat = np.array(boundary.right_latitude)
+        left_lon = np.asarray(boundary.left_longitude)
+        left_lat = np.asarray(boundary.left_latitude)
+        right_lon = np.asarray(boundary.right_longitude)
+        right_lat = np.asarray(boundary.right_latitude)
 
         fig.add_trace(
             go.Scatter(
@@ -276,10 +276,10 @@ def create_track_map_with_lateral_position(
 
     # Track boundaries
     if show_boundaries:
-        left_lon = np.array(boundary.left_longitude)
-        left_lat = np.array(boundary.left_latitude)
-        right_lon = np.array(boundary.right_longitude)
-        right_lat = np.array(boundary.right_latitude)
+        left_lon = np.asarray(boundary.left_longitude)
+        left_lat = np.asarray(boundary.left_latitude)
+        right_lon = np.asarray(boundary.right_longitude)
+        right_lat = np.asarray(boundary.right_latitude)
 
         fig.add_trace(
             go.Scatter(
@@ -1,12 +1,14 @@
 """Chart building functions for lap visualization."""
 
-from typing import Sequence
+from operator import attrgetter
+from typing import Any
 
 import numpy as np
 import plotly.graph_objects as go
+from numpy.typing import NDArray
 
-from .constants import MS_TO_KMH, accel_to_g, rad_to_deg
-from .protocols import MetricsProtocol, TelemetryDataProtocol, TelemetryFrameProtocol
+from .constants import GRAVITY_MS2, MS_TO_KMH, RAD_TO_DEG
+from .protocols import MetricsProtocol, TelemetryDataProtocol
 from .styles import (
     COLORS,
     MARKER_SIZES,
@@ -16,10 +18,49 @@ from .styles import (
     get_yaxis,
 )
 
+type LapColumns = dict[str, NDArray[np.float64]]
+"""Per-frame telemetry values keyed by frame attribute name."""
+
+CHART_COLUMNS: tuple[str, ...] = (
+    "lap_distance",
+    "speed",
+    "throttle",
+    "brake",
+    "steering_angle",
+    "latitude",
+    "longitude",
+    "lateral_acceleration",
+    "longitudinal_acceleration",
+)
+"""Frame attributes read by the chart functions."""
+
+
+def extract_columns(telemetry: TelemetryDataProtocol) -> LapColumns:
+    """
+    Extract the frame attributes used by the charts into NumPy arrays.
+
+    Each column is filled with a single ``np.fromiter`` pass over the frames, avoiding
+    intermediate per-frame lists and dicts.
+
+    Args:
+        telemetry: Lap telemetry data
+
+    Returns:
+        Mapping of attribute name to a float64 array with one value per frame
+    """
+    frames = telemetry.frames
+    count = len(frames)
+
+    return {
+        name: np.fromiter(map(attrgetter(name), frames), dtype=np.float64, count=count)
+        for name in CHART_COLUMNS
+    }
+
 
 def create_track_map(
     telemetry: TelemetryDataProtocol,
     metrics: MetricsProtocol | None = None,
+    columns: LapColumns | None = None,
 ) -> go.Figure:
     """
     Create a track map showing the driving line colored by speed.
@@ -29,18 +70,21 @@ def create_track_map(
     Args:
         telemetry: Lap telemetry data
         metrics: Optional lap metrics for annotations
+        columns: Optional columns from ``extract_columns``, to share one extraction
+            between several charts
 
     Returns:
         Plotly figure with track map
     """
-    frames = telemetry.frames
+    if columns is None:
+        columns = extract_columns(telemetry)
 
     # Extract GPS position and speed data
     # Use longitude for X (east-west) and latitude for Y (north-south)
-    lon = [f.longitude for f in frames]
-    lat = [f.latitude for f in frames]
-    speed_kmh = [f.speed * MS_TO_KMH for f in frames]
-    distances = [f.lap_distance for f in frames]
+    lon = columns["longitude"]
+    lat = columns["latitude"]
+    speed_kmh = columns["speed"] * MS_TO_KMH
+    distances = columns["lap_distance"]
 
     fig = go.Figure()
 
@@ -60,7 +104,7 @@ def create_track_map(
                 },
                 "showscale": True,
             },
-            customdata=list(zip(speed_kmh, distances)),  # type: ignore[arg-type]  # plotly stubs incorrect
+            customdata=np.column_stack((speed_kmh, distances)),
             hovertemplate="Speed: %{customdata[0]:.1f} km/h<br>Distance: %{customdata[1]:.0f}m<extra></extra>",
             name="Driving Line",
             showlegend=False,
@@ -74,10 +118,10 @@ def create_track_map(
         brake_lat: list[float] = []
         brake_labels: list[str] = []
         for i, bz in enumerate(metrics.braking_zones, 1):
-            idx = _find_closest_frame_by_distance(frames, bz.braking_point_distance)
+            idx = _find_closest_index(distances, bz.braking_point_distance)
             if idx is not None:
-                brake_lon.append(frames[idx].longitude)
-                brake_lat.append(frames[idx].latitude)
+                brake_lon.append(float(lon[idx]))
+                brake_lat.append(float(lat[idx]))
                 brake_labels.append(f"B{i}")
 
         if brake_lon:
@@ -105,10 +149,10 @@ def create_track_map(
         apex_lat: list[float] = []
         apex_labels: list[str] = []
         for i, corner in enumerate(metrics.corners, 1):
-            idx = _find_closest_frame_by_distance(frames, corner.apex_distance)
+            idx = _find_closest_index(distances, corner.apex_distance)
             if idx is not None:
-                apex_lon.append(frames[idx].longitude)
-                apex_lat.append(frames[idx].latitude)
+                apex_lon.append(float(lon[idx]))
+                apex_lat.append(float(lat[idx]))
                 apex_labels.append(f"C{i}")
 
         if apex_lon:
@@ -151,6 +195,7 @@ def create_track_map(
 def create_speed_chart(
     telemetry: TelemetryDataProtocol,
     metrics: MetricsProtocol | None = None,
+    columns: LapColumns | None = None,
 ) -> go.Figure:
     """
     Create a speed vs distance chart with braking zone annotations.
@@ -158,14 +203,17 @@ def create_speed_chart(
     Args:
         telemetry: Lap telemetry data
         metrics: Optional lap metrics for annotations
+        columns: Optional columns from ``extract_columns``, to share one extraction
+            between several charts
 
     Returns:
         Plotly figure with speed chart
     """
-    frames = telemetry.frames
+    if columns is None:
+        columns = extract_columns(telemetry)
 
-    distances = [f.lap_distance for f in frames]
-    speed_kmh = [f.speed * MS_TO_KMH for f in frames]
+    distances = columns["lap_distance"]
+    speed_kmh = columns["speed"] * MS_TO_KMH
 
     fig = go.Figure()
 
@@ -201,6 +249,7 @@ def create_speed_chart(
 def create_inputs_chart(
     telemetry: TelemetryDataProtocol,
     metrics: MetricsProtocol | None = None,
+    columns: LapColumns | None = None,
 ) -> go.Figure:
     """
     Create a throttle/brake inputs vs distance chart.
@@ -208,15 +257,18 @@ def create_inputs_chart(
     Args:
         telemetry: Lap telemetry data
         metrics: Optional lap metrics for annotations
+        columns: Optional columns from ``extract_columns``, to share one extraction
+            between several charts
 
     Returns:
         Plotly figure with inputs chart
     """
-    frames = telemetry.frames
+    if columns is None:
+        columns = extract_columns(telemetry)
 
-    distances = [f.lap_distance for f in frames]
-    throttle = [f.throttle * 100 for f in frames]  # Convert to percentage
-    brake = [f.brake * 100 for f in frames]
+    distances = columns["lap_distance"]
+    throttle = columns["throttle"] * 100  # Convert to percentage
+    brake = columns["brake"] * 100
 
     fig = go.Figure()
 
@@ -269,6 +321,7 @@ def create_inputs_chart(
 def create_steering_chart(
     telemetry: TelemetryDataProtocol,
     metrics: MetricsProtocol | None = None,
+    columns: LapColumns | None = None,
 ) -> go.Figure:
     """
     Create a steering angle vs distance chart with corner annotations.
@@ -276,14 +329,17 @@ def create_steering_chart(
     Args:
         telemetry: Lap telemetry data
         metrics: Optional lap metrics for annotations
+        columns: Optional columns from ``extract_columns``, to share one extraction
+            between several charts
 
     Returns:
         Plotly figure with steering chart
     """
-    frames = telemetry.frames
+    if columns is None:
+        columns = extract_columns(telemetry)
 
-    distances = [f.lap_distance for f in frames]
-    steering_deg = [rad_to_deg(f.steering_angle) for f in frames]
+    distances = columns["lap_distance"]
+    steering_deg = columns["steering_angle"] * RAD_TO_DEG
 
     fig = go.Figure()
 
@@ -315,6 +371,7 @@ def create_steering_chart(
 def create_gforce_chart(
     telemetry: TelemetryDataProtocol,
     metrics: MetricsProtocol | None = None,
+    columns: LapColumns | None = None,
 ) -> go.Figure:
     """
     Create a G-force vs distance chart.
@@ -322,15 +379,18 @@ def create_gforce_chart(
     Args:
         telemetry: Lap telemetry data
         metrics: Optional lap metrics for annotations
+        columns: Optional columns from ``extract_columns``, to share one extraction
+            between several charts
 
     Returns:
         Plotly figure with G-force chart
     """
-    frames = telemetry.frames
+    if columns is None:
+        columns = extract_columns(telemetry)
 
-    distances = [f.lap_distance for f in frames]
-    lateral_g = [accel_to_g(f.lateral_acceleration) for f in frames]
-    longitudinal_g = [accel_to_g(f.longitudinal_acceleration) for f in frames]
+    distances = columns["lap_distance"]
+    lateral_g = columns["lateral_acceleration"] / GRAVITY_MS2
+    longitudinal_g = columns["longitudinal_acceleration"] / GRAVITY_MS2
 
     fig = go.Figure()
 
@@ -380,21 +440,27 @@ def create_gforce_chart(
     return fig
 
 
-def create_friction_circle(telemetry: TelemetryDataProtocol) -> go.Figure:
+def create_friction_circle(
+    telemetry: TelemetryDataProtocol,
+    columns: LapColumns | None = None,
+) -> go.Figure:
     """
     Create a G-G diagram (friction circle) showing lateral vs longitudinal G.
 
     Args:
         telemetry: Lap telemetry data
+        columns: Optional columns from ``extract_columns``, to share one extraction
+            between several charts
 
     Returns:
         Plotly figure with friction circle
     """
-    frames = telemetry.frames
+    if columns is None:
+        columns = extract_columns(telemetry)
 
-    lateral_g = [accel_to_g(f.lateral_acceleration) for f in frames]
-    longitudinal_g = [accel_to_g(f.longitudinal_acceleration) for f in frames]
-    speed_kmh = [f.speed * MS_TO_KMH for f in frames]
+    lateral_g = columns["lateral_acceleration"] / GRAVITY_MS2
+    longitudinal_g = columns["longitudinal_acceleration"] / GRAVITY_MS2
+    speed_kmh = columns["speed"] * MS_TO_KMH
 
     fig = go.Figure()
 
@@ -443,62 +509,121 @@ def create_friction_circle(telemetry: TelemetryDataProtocol) -> go.Figure:
 
 def _add_braking_zone_shading(fig: go.Figure, metrics: MetricsProtocol) -> None:
     """Add braking zone shading rectangles to a figure."""
-    for i, bz in enumerate(metrics.braking_zones, 1):
-        fig.add_vrect(
-            x0=bz.braking_point_distance,
-            x1=bz.end_distance,
-            fillcolor=COLORS["braking_zone"],
-            line_width=0,
-            layer="below",
-            annotation_text=f"B{i}",
-            annotation_position="top left",
-            annotation={"font": {"size": 10, "color": COLORS["brake"]}},
-        )
+    _add_layout_items(
+        fig,
+        shapes=[
+            _vrect_shape(bz.braking_point_distance, bz.end_distance, COLORS["braking_zone"])
+            for bz in metrics.braking_zones
+        ],
+        annotations=[
+            _top_left_label(bz.braking_point_distance, f"B{i}", 10, COLORS["brake"])
+            for i, bz in enumerate(metrics.braking_zones, 1)
+        ],
+    )
 
 
 def _add_corner_apex_markers(fig: go.Figure, metrics: MetricsProtocol) -> None:
     """Add corner apex vertical line markers to a figure."""
-    for i, corner in enumerate(metrics.corners, 1):
-        fig.add_vline(
-            x=corner.apex_distance,
-            line_dash="dot",
-            line_color=COLORS["apex_marker"],
-            opacity=0.5,
-            annotation_text=f"C{i}",
-            annotation_position="bottom",
-            annotation={"font": {"size": 9, "color": COLORS["apex_marker"]}},
-        )
+    _add_layout_items(
+        fig,
+        shapes=[
+            {
+                "type": "line",
+                "xref": "x",
+                "yref": "y domain",
+                "x0": corner.apex_distance,
+                "x1": corner.apex_distance,
+                "y0": 0,
+                "y1": 1,
+                "line": {"color": COLORS["apex_marker"], "dash": "dot"},
+                "opacity": 0.5,
+            }
+            for corner in metrics.corners
+        ],
+        annotations=[
+            {
+                "text": f"C{i}",
+                "xref": "x",
+                "yref": "y domain",
+                "x": corner.apex_distance,
+                "y": 0,
+                "xanchor": "center",
+                "yanchor": "top",
+                "showarrow": False,
+                "font": {"size": 9, "color": COLORS["apex_marker"]},
+            }
+            for i, corner in enumerate(metrics.corners, 1)
+        ],
+    )
 
 
 def _add_corner_region_shading(fig: go.Figure, metrics: MetricsProtocol) -> None:
     """Add corner region shading rectangles to a figure."""
-    for i, corner in enumerate(metrics.corners, 1):
-        fig.add_vrect(
-            x0=corner.turn_in_distance,
-            x1=corner.exit_distance,
-            fillcolor=COLORS["corner_region"],
-            line_width=0,
-            layer="below",
-            annotation_text=f"C{i}",
-            annotation_position="top left",
-            annotation={"font": {"size": 10, "color": COLORS["steering"]}},
-        )
+    _add_layout_items(
+        fig,
+        shapes=[
+            _vrect_shape(corner.turn_in_distance, corner.exit_distance, COLORS["corner_region"])
+            for corner in metrics.corners
+        ],
+        annotations=[
+            _top_left_label(corner.turn_in_distance, f"C{i}", 10, COLORS["steering"])
+            for i, corner in enumerate(metrics.corners, 1)
+        ],
+    )
 
 
-def _find_closest_frame_by_distance(
-    frames: Sequence[TelemetryFrameProtocol], target_distance: float
-) -> int | None:
-    """Find the index of the frame closest to the target distance."""
-    if not frames:
-        return None
+def _vrect_shape(x0: float, x1: float, fillcolor: str) -> dict[str, Any]:
+    """Build a full-height rectangle spanning x0..x1, equivalent to ``fig.add_vrect``."""
+    return {
+        "type": "rect",
+        "xref": "x",
+        "yref": "y domain",
+        "x0": x0,
+        "x1": x1,
+        "y0": 0,
+        "y1": 1,
+        "fillcolor": fillcolor,
+        "line": {"width": 0},
+        "layer": "below",
+    }
+
+
+def _top_left_label(x: float, text: str, size: int, color: str) -> dict[str, Any]:
+    """Build a label anchored to the top left of a region starting at x."""
+    return {
+        "text": text,
+        "xref": "x",
+        "yref": "y domain",
+        "x": x,
+        "y": 1,
+        "xanchor": "left",
+        "yanchor": "top",
+        "showarrow": False,
+        "font": {"size": size, "color": color},
+    }
+
+
+def _add_layout_items(
+    fig: go.Figure, shapes: list[dict[str, Any]], annotations: list[dict[str, Any]]
+) -> None:
+    """
+    Append shapes and annotations to a figure with a single layout update.
 
-    closest_idx = 0
-    closest_diff = abs(frames[0].lap_distance - target_distance)
+    Calling ``add_vrect``/``add_vline`` per item runs Plotly's validation once per call;
+    assigning the whole list at once validates everything in one pass.
+    """
+    if not shapes and not annotations:
+        return
 
-    for i, frame in enumerate(frames):
-        diff = abs(frame.lap_distance - target_distance)
-        if diff < closest_diff:
-            closest_diff = diff
-            closest_idx = i
+    fig.update_layout(
+        shapes=[*fig.layout.shapes, *shapes],  # type: ignore[attr-defined]
+        annotations=[*fig.layout.annotations, *annotations],  # type: ignore[attr-defined]
+    )
+
+
+def _find_closest_index(distances: NDArray[np.float64], target_distance: float) -> int | None:
+    """Find the index of the frame closest to the target distance."""
+    if distances.size == 0:
+        return None
 
-    return closest_idx
+    return int(np.argmin(np.abs(distances - target_distance)))
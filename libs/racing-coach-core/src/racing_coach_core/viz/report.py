@@ -1,5 +1,10 @@
 """HTML report generation for lap visualization."""
 
+import io
+from typing import TextIO
+
+import plotly.graph_objects as go
+
 from .charts import (
     create_friction_circle,
     create_gforce_chart,
@@ -7,6 +12,7 @@ from .charts import (
     create_speed_chart,
     create_steering_chart,
     create_track_map,
+    extract_columns,
 )
 from .constants import MS_TO_KMH, RAD_TO_DEG
 from .protocols import MetricsProtocol, SessionInfoProtocol, TelemetryDataProtocol
@@ -29,6 +35,29 @@ def generate_lap_report(
     Returns:
         Complete HTML string
     """
+    buffer = io.StringIO()
+    write_lap_report(buffer, telemetry, metrics, session)
+    return buffer.getvalue()
+
+
+def write_lap_report(
+    file: TextIO,
+    telemetry: TelemetryDataProtocol,
+    metrics: MetricsProtocol | None = None,
+    session: SessionInfoProtocol | None = None,
+) -> None:
+    """
+    Write a complete HTML report for a lap to a text file.
+
+    Each chart is converted to HTML and written out before the next one is built, so
+    only one chart's markup is held in memory instead of the whole report.
+
+    Args:
+        file: Text file to write the report to
+        telemetry: Lap telemetry data
+        metrics: Optional lap metrics
+        session: Optional session info for metadata
+    """
     # Build header info
     track_name = session.track_name if session else "Unknown Track"
     track_config = session.track_config_name if session and session.track_config_name else ""
@@ -38,14 +67,6 @@ def generate_lap_report(
 
     track_display = f"{track_name} - {track_config}" if track_config else track_name
 
-    # Generate individual charts
-    track_map = create_track_map(telemetry, metrics)
-    speed_chart = create_speed_chart(telemetry, metrics)
-    inputs_chart = create_inputs_chart(telemetry, metrics)
-    steering_chart = create_steering_chart(telemetry, metrics)
-    gforce_chart = create_gforce_chart(telemetry, metrics)
-    friction_circle = create_friction_circle(telemetry)
-
     # Build metrics summary HTML
     metrics_html = _build_metrics_summary_html(metrics) if metrics else ""
 
@@ -55,16 +76,11 @@ def generate_lap_report(
     # Build corners table
     corners_table_html = _build_corners_table_html(metrics) if metrics else ""
 
-    # Convert figures to HTML divs
-    track_map_html = track_map.to_html(full_html=False, include_plotlyjs=False)
-    speed_chart_html = speed_chart.to_html(full_html=False, include_plotlyjs=False)
-    inputs_chart_html = inputs_chart.to_html(full_html=False, include_plotlyjs=False)
-    steering_chart_html = steering_chart.to_html(full_html=False, include_plotlyjs=False)
-    gforce_chart_html = gforce_chart.to_html(full_html=False, include_plotlyjs=False)
-    friction_circle_html = friction_circle.to_html(full_html=False, include_plotlyjs=False)
+    # Charts share a single pass over the frames
+    columns = extract_columns(telemetry)
 
-    # Assemble the full HTML
-    html = f"""<!DOCTYPE html>
+    file.write(
+        f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -240,27 +256,51 @@ def generate_lap_report(
 
         <div class="grid-2col">
             <div class="chart-container tall">
-                {track_map_html}
+                """
+    )
+    _write_figure(file, create_track_map(telemetry, metrics, columns))
+    file.write(
+        """
             </div>
             <div class="chart-container tall">
-                {friction_circle_html}
+                """
+    )
+    _write_figure(file, create_friction_circle(telemetry, columns))
+    file.write(
+        """
             </div>
         </div>
 
         <div class="chart-container full-width" style="margin-bottom: 20px;">
-            {speed_chart_html}
+            """
+    )
+    _write_figure(file, create_speed_chart(telemetry, metrics, columns))
+    file.write(
+        """
         </div>
 
         <div class="chart-container full-width" style="margin-bottom: 20px;">
-            {inputs_chart_html}
+            """
+    )
+    _write_figure(file, create_inputs_chart(telemetry, metrics, columns))
+    file.write(
+        """
         </div>
 
         <div class="grid-2col">
             <div class="chart-container">
-                {steering_chart_html}
+                """
+    )
+    _write_figure(file, create_steering_chart(telemetry, metrics, columns))
+    file.write(
+        """
             </div>
             <div class="chart-container">
-                {gforce_chart_html}
+                """
+    )
+    _write_figure(file, create_gforce_chart(telemetry, metrics, columns))
+    file.write(
+        f"""
             </div>
         </div>
 
@@ -271,7 +311,12 @@ def generate_lap_report(
 </body>
 </html>
 """
-    return html
+    )
+
+
+def _write_figure(file: TextIO, figure: go.Figure) -> None:
+    """Write a figure as an HTML div, relying on the page to load plotly.js once."""
+    file.write(figure.to_html(full_html=False, include_plotlyjs=False))
 
 
 def _format_lap_time(seconds: float | None) -> str:
@@ -90,6 +90,69 @@ class TestTrackBoundary:
         assert len(boundary.left_latitude) == 500
         assert len(boundary.grid_distance_pct) == 500
 
+    def test_from_boundary_laps_sorts_and_dedups_samples(self) -> None:
+        """Test that unsorted boundary samples keep the first sample at each distance."""
+        data = pd.DataFrame(
+            {
+                "lap_distance_pct": [0.5, 0.0, 1.0, 0.5],
+                "latitude": [5.0, 0.0, 10.0, 99.0],
+                "longitude": [-5.0, 0.0, -10.0, 99.0],
+            }
+        )
+
+        boundary = TrackBoundary.from_boundary_laps(
+            track_id=1,
+            track_name="Test",
+            left_lap_data=data,
+            right_lap_data=data,
+            grid_size=5,
+        )
+
+        np.testing.assert_allclose(boundary.left_latitude, [0.0, 2.5, 5.0, 7.5, 10.0])
+        np.testing.assert_allclose(boundary.right_longitude, [0.0, -2.5, -5.0, -7.5, -10.0])
+        assert boundary.source_left_frames == 4
+
+    def test_boundary_fields_are_float_arrays(self, simple_track_boundary: TrackBoundary) -> None:
+        """Test that boundary lists are stored as float64 arrays and dumped back as lists."""
+        assert isinstance(simple_track_boundary.left_latitude, np.ndarray)
+        assert simple_track_boundary.left_latitude.dtype == np.float64
+
+        dumped = simple_track_boundary.model_dump()
+        assert dumped["left_latitude"] == simple_track_boundary.left_latitude.tolist()
+
+    def test_boundary_at_interpolates_and_wraps(self, simple_track_boundary: TrackBoundary) -> None:
+        """Test that boundary_at interpolates between grid points and wraps past the end."""
+        boundary = simple_track_boundary
+        step = 1.0 / boundary.grid_size
+
+        left_lat, left_lon, right_lat, right_lon = boundary.boundary_at(
+            np.array([2.5 * step, 1.0 + 2.5 * step, 1.0 - 0.5 * step])
+        )
+
+        expected = (boundary.left_latitude[2] + boundary.left_latitude[3]) / 2
+        np.testing.assert_allclose(left_lat[:2], [expected, expected])
+        last = (boundary.left_latitude[-1] + boundary.left_latitude[0]) / 2
+        np.testing.assert_allclose(left_lat[2], last)
+        np.testing.assert_allclose(left_lon, 0.0)
+        np.testing.assert_allclose(right_lon, 0.001)
+        np.testing.assert_allclose(right_lat, left_lat)
+
+    def test_boundaries_compare_by_value(self, simple_track_boundary: TrackBoundary) -> None:
+        """Test that separately built and round-tripped boundaries compare equal."""
+        rebuilt = TrackBoundary(**simple_track_boundary.model_dump())
+        shifted = simple_track_boundary.model_copy(
+            update={"left_latitude": simple_track_boundary.left_latitude + 1.0}
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "boundary.parquet"
+            simple_track_boundary.to_parquet(path)
+            loaded = TrackBoundary.from_parquet(path)
+
+        assert rebuilt == simple_track_boundary
+        assert loaded == simple_track_boundary
+        assert shifted != simple_track_boundary
+
     def test_parquet_roundtrip(self, simple_track_boundary: TrackBoundary) -> None:
         """Test saving and loading TrackBoundary to/from Parquet."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -200,6 +263,20 @@ class TestVectorizedComputation:
         )
         assert np.allclose(right_results, 1.0, atol=0.001)
 
+    def test_collapsed_boundaries_return_center(self, simple_track_boundary: TrackBoundary) -> None:
+        """Test that coincident boundaries give 0.0, matching get_lateral_position."""
+        collapsed = simple_track_boundary.model_copy(
+            update={"right_longitude": simple_track_boundary.left_longitude}
+        )
+        lap_pct = np.array([0.1, 0.5])
+        lats = np.array([0.1, 0.5])
+        lons = np.array([0.0005, 0.002])
+
+        results = compute_lateral_positions_vectorized(collapsed, lap_pct, lats, lons)
+
+        assert results.tolist() == [0.0, 0.0]
+        assert get_lateral_position(collapsed, 0.5, 0.5, 0.002) == 0.0
+
 
 class TestAugmentedTelemetry:
     """Tests for AugmentedTelemetryFrame and AugmentedTelemetrySequence."""
@@ -240,19 +317,34 @@ class TestAugmentedTelemetry:
             latitude=-33.45,
             longitude=149.55,
             altitude=100.0,
-            tire_temps={
-                "LF": {"left": 80, "middle": 85, "right": 80},
-                "RF": {"left": 80, "middle": 85, "right": 80},
-                "LR": {"left": 80, "middle": 85, "right": 80},
-                "RR": {"left": 80, "middle": 85, "right": 80},
-            },
-            tire_wear={
-                "LF": {"left": 100, "middle": 100, "right": 100},
-                "RF": {"left": 100, "middle": 100, "right": 100},
-                "LR": {"left": 100, "middle": 100, "right": 100},
-                "RR": {"left": 100, "middle": 100, "right": 100},
-            },
-            brake_line_pressure={"LF": 0, "RF": 0, "LR": 0, "RR": 0},
+            lf_tire_temp_left=80,
+            lf_tire_temp_middle=85,
+            lf_tire_temp_right=80,
+            rf_tire_temp_left=80,
+            rf_tire_temp_middle=85,
+            rf_tire_temp_right=80,
+            lr_tire_temp_left=80,
+            lr_tire_temp_middle=85,
+            lr_tire_temp_right=80,
+            rr_tire_temp_left=80,
+            rr_tire_temp_middle=85,
+            rr_tire_temp_right=80,
+            lf_tire_wear_left=100,
+            lf_tire_wear_middle=100,
+            lf_tire_wear_right=100,
+            rf_tire_wear_left=100,
+            rf_tire_wear_middle=100,
+            rf_tire_wear_right=100,
+            lr_tire_wear_left=100,
+            lr_tire_wear_middle=100,
+            lr_tire_wear_right=100,
+            rr_tire_wear_left=100,
+            rr_tire_wear_middle=100,
+            rr_tire_wear_right=100,
+            lf_brake_pressure=0,
+            rf_brake_pressure=0,
+            lr_brake_pressure=0,
+            rr_brake_pressure=0,
             track_temp=30.0,
             track_wetness=0,
             air_temp=25.0,
@@ -281,6 +373,13 @@ class TestAugmentedTelemetry:
         for i, augmented in enumerate(sequence.iter_augmented()):
             assert augmented.lateral_position == lateral_positions[i]
 
+    def test_augmented_frames_match_iteration(self, sample_frame: TelemetryFrame) -> None:
+        """Test that augmented_frames builds the same frames as iter_augmented."""
+        frames = [sample_frame.model_copy(update={"speed": float(i)}) for i in range(3)]
+        sequence = AugmentedTelemetrySequence(frames=frames, lateral_positions=[-1.0, 0.0, 1.0])
+
+        assert sequence.augmented_frames() == list(sequence.iter_augmented())
+
     def test_augmented_sequence_get_frame(self, sample_frame: TelemetryFrame) -> None:
         """Test getting single frame from AugmentedTelemetrySequence."""
         frames = [sample_frame] * 3
@@ -291,6 +390,21 @@ class TestAugmentedTelemetry:
         frame = sequence.get_augmented_frame(1)
         assert frame.lateral_position == 0.0
 
+    def test_augmented_sequence_parquet_roundtrip(self, sample_frame: TelemetryFrame) -> None:
+        """Test saving and loading AugmentedTelemetrySequence to/from Parquet."""
+        frames = [sample_frame.model_copy(update={"lap_distance_pct": i * 0.25}) for i in range(4)]
+        sequence = AugmentedTelemetrySequence(
+            frames=frames, lateral_positions=[-1.0, -0.5, 0.5, 1.0]
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "augmented.parquet"
+            sequence.to_parquet(path)
+            loaded = AugmentedTelemetrySequence.from_parquet(path)
+
+        assert loaded.frames == sequence.frames
+        assert loaded.lateral_positions == sequence.lateral_positions
+
     def test_compute_lateral_positions_for_sequence(
         self, simple_track_boundary: TrackBoundary, sample_frame: TelemetryFrame
     ) -> None:
@@ -298,10 +412,13 @@ class TestAugmentedTelemetry:
         # Create frames at different positions
         frames: list[TelemetryFrame] = []
         for i in range(5):
-            frame = sample_frame.model_copy()
-            frame.lap_distance_pct = i * 0.2
-            frame.latitude = i * 0.2  # Match test track pattern
-            frame.longitude = 0.0005  # Center
+            frame = sample_frame.model_copy(
+                update={
+                    "lap_distance_pct": i * 0.2,
+                    "latitude": i * 0.2,  # Match test track pattern
+                    "longitude": 0.0005,  # Center
+                }
+            )
             frames.append(frame)
 
         sequence = TelemetrySequence(frames=frames)
@@ -52,19 +52,34 @@ class TestExtractLapMetrics:
             latitude=0.0,
             longitude=0.0,
             altitude=0.0,
-            tire_temps={
-                "LF": {"left": 80.0, "middle": 80.0, "right": 80.0},
-                "RF": {"left": 80.0, "middle": 80.0, "right": 80.0},
-                "LR": {"left": 80.0, "middle": 80.0, "right": 80.0},
-                "RR": {"left": 80.0, "middle": 80.0, "right": 80.0},
-            },
-            tire_wear={
-                "LF": {"left": 1.0, "middle": 1.0, "right": 1.0},
-                "RF": {"left": 1.0, "middle": 1.0, "right": 1.0},
-                "LR": {"left": 1.0, "middle": 1.0, "right": 1.0},
-                "RR": {"left": 1.0, "middle": 1.0, "right": 1.0},
-            },
-            brake_line_pressure={"LF": 0.0, "RF": 0.0, "LR": 0.0, "RR": 0.0},
+            lf_tire_temp_left=80.0,
+            lf_tire_temp_middle=80.0,
+            lf_tire_temp_right=80.0,
+            rf_tire_temp_left=80.0,
+            rf_tire_temp_middle=80.0,
+            rf_tire_temp_right=80.0,
+            lr_tire_temp_left=80.0,
+            lr_tire_temp_middle=80.0,
+            lr_tire_temp_right=80.0,
+            rr_tire_temp_left=80.0,
+            rr_tire_temp_middle=80.0,
+            rr_tire_temp_right=80.0,
+            lf_tire_wear_left=1.0,
+            lf_tire_wear_middle=1.0,
+            lf_tire_wear_right=1.0,
+            rf_tire_wear_left=1.0,
+            rf_tire_wear_middle=1.0,
+            rf_tire_wear_right=1.0,
+            lr_tire_wear_left=1.0,
+            lr_tire_wear_middle=1.0,
+            lr_tire_wear_right=1.0,
+            rr_tire_wear_left=1.0,
+            rr_tire_wear_middle=1.0,
+            rr_tire_wear_right=1.0,
+            lf_brake_pressure=0.0,
+            rf_brake_pressure=0.0,
+            lr_brake_pressure=0.0,
+            rr_brake_pressure=0.0,
             track_temp=25.0,
             track_wetness=0,
             air_temp=20.0,
@@ -95,6 +110,7 @@ class TestExtractLapMetrics:
 
             frame = self._create_frame(
                 timestamp=base_time + timedelta(seconds=i * 0.1),
+                session_time=i * 0.1,
                 lap_distance=i * 0.1,
                 brake=brake_pressure,
                 speed=speed,
@@ -112,6 +128,9 @@ class TestExtractLapMetrics:
         assert braking_zone.braking_point_distance == pytest.approx(0.3, abs=0.01)  # type: ignore
         assert braking_zone.max_brake_pressure == pytest.approx(0.8, abs=0.01)  # type: ignore
         assert braking_zone.braking_point_speed > braking_zone.minimum_speed
+        # Frames 3-6 are braking, 0.1s apart on the session clock
+        assert braking_zone.braking_duration == pytest.approx(0.3)  # type: ignore
+        assert braking_zone.average_deceleration == pytest.approx(-30 / 0.3)  # type: ignore
 
     def test_detect_simple_corner(self) -> None:
         """Test detection of a simple corner."""
@@ -125,6 +144,7 @@ class TestExtractLapMetrics:
 
             frame = self._create_frame(
                 timestamp=base_time + timedelta(seconds=i * 0.1),
+                session_time=i * 0.1,
                 lap_distance=i * 0.05,
                 steering_angle=steering,
                 speed=speed,
@@ -158,6 +178,7 @@ class TestExtractLapMetrics:
 
             frame = self._create_frame(
                 timestamp=base_time + timedelta(seconds=i * 0.1),
+                session_time=i * 0.1,
                 lap_distance=i * 0.04,
                 brake=brake,
                 steering_angle=steering,
@@ -186,6 +207,7 @@ class TestExtractLapMetrics:
         for i in range(100):
             frame = self._create_frame(
                 timestamp=base_time + timedelta(seconds=i * 0.1),
+                session_time=i * 0.1,
                 lap_distance=i * 0.01,
                 brake=0.0,
                 throttle=0.9,
@@ -209,6 +231,7 @@ class TestExtractLapMetrics:
         for i in range(100):
             frame = self._create_frame(
                 timestamp=base_time + timedelta(seconds=i * 0.1),
+                session_time=i * 0.1,
                 lap_distance=i * 0.01,
                 steering_angle=0.05,  # Below threshold
                 speed=90.0,
@@ -235,6 +258,7 @@ class TestExtractLapMetrics:
 
             frame = self._create_frame(
                 timestamp=base_time + timedelta(seconds=i * 0.1),
+                session_time=i * 0.1,
                 lap_distance=dist,
                 steering_angle=steering,
                 speed=speed,
@@ -261,6 +285,7 @@ class TestExtractLapMetrics:
             for i in range(5):
                 frame = self._create_frame(
                     timestamp=base_time + timedelta(seconds=(corner_idx * 20 + i) * 0.1),
+                    session_time=(corner_idx * 20 + i) * 0.1,
                     lap_distance=base_dist + i * 0.01,
                     speed=80.0,
                     brake=0.0,
@@ -273,6 +298,7 @@ class TestExtractLapMetrics:
             for i in range(5):
                 frame = self._create_frame(
                     timestamp=base_time + timedelta(seconds=(corner_idx * 20 + 5 + i) * 0.1),
+                    session_time=(corner_idx * 20 + 5 + i) * 0.1,
                     lap_distance=base_dist + 0.05 + i * 0.01,
                     speed=80.0 - i * 10,
                     brake=0.9,
@@ -285,6 +311,7 @@ class TestExtractLapMetrics:
             for i in range(10):
                 frame = self._create_frame(
                     timestamp=base_time + timedelta(seconds=(corner_idx * 20 + 10 + i) * 0.1),
+                    session_time=(corner_idx * 20 + 10 + i) * 0.1,
                     lap_distance=base_dist + 0.1 + i * 0.01,
                     speed=40.0 + i * 2,
                     brake=0.0,
@@ -312,6 +339,7 @@ class TestExtractLapMetrics:
 
             frame = self._create_frame(
                 timestamp=base_time + timedelta(seconds=i * 0.1),
+                session_time=i * 0.1,
                 lap_distance=i * 0.1,
                 brake=brake,
                 speed=60.0,
@@ -340,6 +368,7 @@ class TestExtractLapMetrics:
 
             frame = self._create_frame(
                 timestamp=base_time + timedelta(seconds=i * 0.1),
+                session_time=i * 0.1,
                 lap_distance=i * 0.1,
                 speed=speed,
                 steering_angle=steering,
@@ -358,6 +387,7 @@ class TestExtractLapMetrics:
     def _create_frame(
         self,
         timestamp: datetime,
+        session_time: float,
         lap_distance: float,
         lap_number: int,
         speed: float = 60.0,
@@ -369,7 +399,7 @@ class TestExtractLapMetrics:
         """Create a telemetry frame with specified parameters."""
         return TelemetryFrame(
             timestamp=timestamp,
-            session_time=0.0,
+            session_time=session_time,
             lap_number=lap_number,
             lap_distance_pct=lap_distance,
             lap_distance=lap_distance,
@@ -398,19 +428,34 @@ class TestExtractLapMetrics:
             yaw=0.0,
             pitch=0.0,
             roll=0.0,
-            tire_temps={
-                "LF": {"left": 80.0, "middle": 80.0, "right": 80.0},
-                "RF": {"left": 80.0, "middle": 80.0, "right": 80.0},
-                "LR": {"left": 80.0, "middle": 80.0, "right": 80.0},
-                "RR": {"left": 80.0, "middle": 80.0, "right": 80.0},
-            },
-            tire_wear={
-                "LF": {"left": 1.0, "middle": 1.0, "right": 1.0},
-                "RF": {"left": 1.0, "middle": 1.0, "right": 1.0},
-                "LR": {"left": 1.0, "middle": 1.0, "right": 1.0},
-                "RR": {"left": 1.0, "middle": 1.0, "right": 1.0},
-            },
-            brake_line_pressure={"LF": brake, "RF": brake, "LR": brake, "RR": brake},
+            lf_tire_temp_left=80.0,
+            lf_tire_temp_middle=80.0,
+            lf_tire_temp_right=80.0,
+            rf_tire_temp_left=80.0,
+            rf_tire_temp_middle=80.0,
+            rf_tire_temp_right=80.0,
+            lr_tire_temp_left=80.0,
+            lr_tire_temp_middle=80.0,
+            lr_tire_temp_right=80.0,
+            rr_tire_temp_left=80.0,
+            rr_tire_temp_middle=80.0,
+            rr_tire_temp_right=80.0,
+            lf_tire_wear_left=1.0,
+            lf_tire_wear_middle=1.0,
+            lf_tire_wear_right=1.0,
+            rf_tire_wear_left=1.0,
+            rf_tire_wear_middle=1.0,
+            rf_tire_wear_right=1.0,
+            lr_tire_wear_left=1.0,
+            lr_tire_wear_middle=1.0,
+            lr_tire_wear_right=1.0,
+            rr_tire_wear_left=1.0,
+            rr_tire_wear_middle=1.0,
+            rr_tire_wear_right=1.0,
+            lf_brake_pressure=brake,
+            rf_brake_pressure=brake,
+            lr_brake_pressure=brake,
+            rr_brake_pressure=brake,
             track_temp=25.0,
             track_wetness=0,
             air_temp=20.0,
@@ -439,6 +484,7 @@ class TestSegmentBasedCornerExtraction:
 
             frame = telemetry_frame_factory.build(
                 timestamp=base_time + timedelta(seconds=i * 0.5),
+                session_time=i * 0.5,
                 lap_distance_pct=lap_pct,
                 lap_distance=lap_pct,
                 steering_angle=steering,
@@ -483,6 +529,7 @@ class TestSegmentBasedCornerExtraction:
 
             frame = telemetry_frame_factory.build(
                 timestamp=base_time + timedelta(seconds=i * 0.5),
+                session_time=i * 0.5,
                 lap_distance_pct=lap_pct,
                 lap_distance=lap_pct,
                 steering_angle=-0.3,  # Left turn (negative steering)
@@ -524,6 +571,7 @@ class TestSegmentBasedCornerExtraction:
 
             frame = telemetry_frame_factory.build(
                 timestamp=base_time + timedelta(seconds=i * 0.5),
+                session_time=i * 0.5,
                 lap_distance_pct=lap_pct,
                 lap_distance=lap_pct,
                 steering_angle=0.3,  # Right turn (positive steering)
@@ -564,6 +612,7 @@ class TestSegmentBasedCornerExtraction:
 
             frame = telemetry_frame_factory.build(
                 timestamp=base_time + timedelta(seconds=i * 0.5),
+                session_time=i * 0.5,
                 lap_distance_pct=lap_pct,
                 lap_distance=lap_pct,
                 steering_angle=0.3,
@@ -605,6 +654,7 @@ class TestSegmentBasedCornerExtraction:
 
             frame = telemetry_frame_factory.build(
                 timestamp=base_time + timedelta(seconds=i * 0.1),
+                session_time=i * 0.1,
                 lap_distance_pct=i * 0.1,
                 lap_distance=i * 0.1,
                 steering_angle=steering,
@@ -636,6 +686,7 @@ class TestSegmentBasedCornerExtraction:
 
             frame = telemetry_frame_factory.build(
                 timestamp=base_time + timedelta(seconds=i * 0.1),
+                session_time=i * 0.1,
                 lap_distance_pct=i * 0.1,
                 lap_distance=i * 0.1,
                 steering_angle=steering,
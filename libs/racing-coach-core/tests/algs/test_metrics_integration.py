@@ -110,56 +110,34 @@ def collect_lap_telemetry(ibt_file_path: Path, target_lap: int) -> list[Telemetr
                     yaw=ibt.get(frame_idx, "Yaw"),  # type: ignore
                     pitch=ibt.get(frame_idx, "Pitch"),  # type: ignore
                     roll=ibt.get(frame_idx, "Roll"),  # type: ignore
-                    tire_temps={  # type: ignore
-                        "LF": {
-                            "left": ibt.get(frame_idx, "LFtempCL"),  # type: ignore
-                            "middle": ibt.get(frame_idx, "LFtempCM"),  # type: ignore
-                            "right": ibt.get(frame_idx, "LFtempCR"),  # type: ignore
-                        },
-                        "RF": {
-                            "left": ibt.get(frame_idx, "RFtempCL"),  # type: ignore
-                            "middle": ibt.get(frame_idx, "RFtempCM"),  # type: ignore
-                            "right": ibt.get(frame_idx, "RFtempCR"),  # type: ignore
-                        },
-                        "LR": {
-                            "left": ibt.get(frame_idx, "LRtempCL"),  # type: ignore
-                            "middle": ibt.get(frame_idx, "LRtempCM"),  # type: ignore
-                            "right": ibt.get(frame_idx, "LRtempCR"),  # type: ignore
-                        },
-                        "RR": {
-                            "left": ibt.get(frame_idx, "RRtempCL"),  # type: ignore
-                            "middle": ibt.get(frame_idx, "RRtempCM"),  # type: ignore
-                            "right": ibt.get(frame_idx, "RRtempCR"),  # type: ignore
-                        },
-                    },
-                    tire_wear={  # type: ignore
-                        "LF": {
-                            "left": ibt.get(frame_idx, "LFwearL"),  # type: ignore
-                            "middle": ibt.get(frame_idx, "LFwearM"),  # type: ignore
-                            "right": ibt.get(frame_idx, "LFwearR"),  # type: ignore
-                        },
-                        "RF": {
-                            "left": ibt.get(frame_idx, "RFwearL"),  # type: ignore
-                            "middle": ibt.get(frame_idx, "RFwearM"),  # type: ignore
-                            "right": ibt.get(frame_idx, "RFwearR"),  # type: ignore
-                        },
-                        "LR": {
-                            "left": ibt.get(frame_idx, "LRwearL"),  # type: ignore
-                            "middle": ibt.get(frame_idx, "LRwearM"),  # type: ignore
-                            "right": ibt.get(frame_idx, "LRwearR"),  # type: ignore
-                        },
-                        "RR": {
-                            "left": ibt.get(frame_idx, "RRwearL"),  # type: ignore
-                            "middle": ibt.get(frame_idx, "RRwearM"),  # type: ignore
-                            "right": ibt.get(frame_idx, "RRwearR"),  # type: ignore
-                        },
-                    },
-                    brake_line_pressure={  # type: ignore
-                        "LF": ibt.get(frame_idx, "LFbrakeLinePress"),  # type: ignore
-                        "RF": ibt.get(frame_idx, "RFbrakeLinePress"),  # type: ignore
-                        "LR": ibt.get(frame_idx, "LRbrakeLinePress"),  # type: ignore
-                        "RR": ibt.get(frame_idx, "RRbrakeLinePress"),  # type: ignore
-                    },
+                    lf_tire_temp_left=ibt.get(frame_idx, "LFtempCL"),  # type: ignore
+                    lf_tire_temp_middle=ibt.get(frame_idx, "LFtempCM"),  # type: ignore
+                    lf_tire_temp_right=ibt.get(frame_idx, "LFtempCR"),  # type: ignore
+                    rf_tire_temp_left=ibt.get(frame_idx, "RFtempCL"),  # type: ignore
+                    rf_tire_temp_middle=ibt.get(frame_idx, "RFtempCM"),  # type: ignore
+                    rf_tire_temp_right=ibt.get(frame_idx, "RFtempCR"),  # type: ignore
+                    lr_tire_temp_left=ibt.get(frame_idx, "LRtempCL"),  # type: ignore
+                    lr_tire_temp_middle=ibt.get(frame_idx, "LRtempCM"),  # type: ignore
+                    lr_tire_temp_right=ibt.get(frame_idx, "LRtempCR"),  # type: ignore
+                    rr_tire_temp_left=ibt.get(frame_idx, "RRtempCL"),  # type: ignore
+                    rr_tire_temp_middle=ibt.get(frame_idx, "RRtempCM"),  # type: ignore
+                    rr_tire_temp_right=ibt.get(frame_idx, "RRtempCR"),  # type: ignore
+                    lf_tire_wear_left=ibt.get(frame_idx, "LFwearL"),  # type: ignore
+                    lf_tire_wear_middle=ibt.get(frame_idx, "LFwearM"),  # type: ignore
+                    lf_tire_wear_right=ibt.get(frame_idx, "LFwearR"),  # type: ignore
+                    rf_tire_wear_left=ibt.get(frame_idx, "RFwearL"),  # type: ignore
+                    rf_tire_wear_middle=ibt.get(frame_idx, "RFwearM"),  # type: ignore
+                    rf_tire_wear_right=ibt.get(frame_idx, "RFwearR"),  # type: ignore
+                    lr_tire_wear_left=ibt.get(frame_idx, "LRwearL"),  # type: ignore
+                    lr_tire_wear_middle=ibt.get(frame_idx, "LRwearM"),  # type: ignore
+                    lr_tire_wear_right=ibt.get(frame_idx, "LRwearR"),  # type: ignore
+                    rr_tire_wear_left=ibt.get(frame_idx, "RRwearL"),  # type: ignore
+                    rr_tire_wear_middle=ibt.get(frame_idx, "RRwearM"),  # type: ignore
+                    rr_tire_wear_right=ibt.get(frame_idx, "RRwearR"),  # type: ignore
+                    lf_brake_pressure=ibt.get(frame_idx, "LFbrakeLinePress"),  # type: ignore
+                    rf_brake_pressure=ibt.get(frame_idx, "RFbrakeLinePress"),  # type: ignore
+                    lr_brake_pressure=ibt.get(frame_idx, "LRbrakeLinePress"),  # type: ignore
+                    rr_brake_pressure=ibt.get(frame_idx, "RRbrakeLinePress"),  # type: ignore
                     track_temp=ibt.get(frame_idx, "TrackTempCrew"),  # type: ignore
                     track_wetness=ibt.get(frame_idx, "TrackWetness"),  # type: ignore
                     air_temp=ibt.get(frame_idx, "AirTemp"),  # type: ignore
@@ -29,15 +29,15 @@ class SessionFrameFactory(ModelFactory[SessionFrame]): ...
 class LapTelemetryFactory(ModelFactory[LapTelemetry]): ...
 
 
-class TelemetryAndSessionFactory(ModelFactory[TelemetryAndSession]): ...
+# ============================================================================
+# Dataclass Factories
+# ============================================================================
 
 
-class LapAndSessionFactory(ModelFactory[LapAndSession]): ...
+class TelemetryAndSessionFactory(DataclassFactory[TelemetryAndSession]): ...
 
 
-# ============================================================================
-# Dataclass Factories
-# ============================================================================
+class LapAndSessionFactory(DataclassFactory[LapAndSession]): ...
 
 
 class BrakingMetricsFactory(DataclassFactory[BrakingMetrics]): ...
@@ -15,7 +15,7 @@ import threading
 import time
 import tracemalloc
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
@@ -164,7 +164,7 @@ class LatencyTrackingCollector:
     """
 
     def __init__(self) -> None:
-        self.receive_times: dict[datetime, float] = {}
+        self.receive_times: dict[int, float] = {}
         self.events: list[Event[Any]] = []
         self._lock = threading.Lock()
         self.count = 0
@@ -174,7 +174,7 @@ class LatencyTrackingCollector:
         receive_time = time.perf_counter()
         with self._lock:
             self.events.append(context.event)
-            self.receive_times[context.event.timestamp] = receive_time
+            self.receive_times[context.event.timestamp_ns] = receive_time
             self.count += 1
 
     def get_event_count(self) -> int:
@@ -197,7 +197,7 @@ def create_telemetry_frame(index: int, frequency_hz: float = 60.0) -> TelemetryF
     lap_pct = (index % 3600) / 3600.0
 
     return TelemetryFrame(
-        timestamp=datetime.now(timezone.utc),
+        timestamp=datetime.now(UTC),
         session_time=index / frequency_hz,
         lap_number=lap_number,
         lap_distance_pct=lap_pct,
@@ -227,19 +227,34 @@ def create_telemetry_frame(index: int, frequency_hz: float = 60.0) -> TelemetryF
         latitude=0.0,
         longitude=0.0,
         altitude=0.0,
-        tire_temps={
-            "LF": {"left": 80.0, "middle": 85.0, "right": 82.0},
-            "RF": {"left": 81.0, "middle": 86.0, "right": 83.0},
-            "LR": {"left": 78.0, "middle": 83.0, "right": 80.0},
-            "RR": {"left": 79.0, "middle": 84.0, "right": 81.0},
-        },
-        tire_wear={
-            "LF": {"left": 0.95, "middle": 0.93, "right": 0.94},
-            "RF": {"left": 0.94, "middle": 0.92, "right": 0.93},
-            "LR": {"left": 0.96, "middle": 0.94, "right": 0.95},
-            "RR": {"left": 0.95, "middle": 0.93, "right": 0.94},
-        },
-        brake_line_pressure={"LF": 0.0, "RF": 0.0, "LR": 0.0, "RR": 0.0},
+        lf_tire_temp_left=80.0,
+        lf_tire_temp_middle=85.0,
+        lf_tire_temp_right=82.0,
+        rf_tire_temp_left=81.0,
+        rf_tire_temp_middle=86.0,
+        rf_tire_temp_right=83.0,
+        lr_tire_temp_left=78.0,
+        lr_tire_temp_middle=83.0,
+        lr_tire_temp_right=80.0,
+        rr_tire_temp_left=79.0,
+        rr_tire_temp_middle=84.0,
+        rr_tire_temp_right=81.0,
+        lf_tire_wear_left=0.95,
+        lf_tire_wear_middle=0.93,
+        lf_tire_wear_right=0.94,
+        rf_tire_wear_left=0.94,
+        rf_tire_wear_middle=0.92,
+        rf_tire_wear_right=0.93,
+        lr_tire_wear_left=0.96,
+        lr_tire_wear_middle=0.94,
+        lr_tire_wear_right=0.95,
+        rr_tire_wear_left=0.95,
+        rr_tire_wear_middle=0.93,
+        rr_tire_wear_right=0.94,
+        lf_brake_pressure=0.0,
+        rf_brake_pressure=0.0,
+        lr_brake_pressure=0.0,
+        rr_brake_pressure=0.0,
         track_temp=30.0,
         track_wetness=0,
         air_temp=25.0,
@@ -269,7 +284,7 @@ class HighFrequencyEventGenerator:
         self._running = False
         self._thread: threading.Thread | None = None
         self._events_published = 0
-        self._publish_times: dict[datetime, float] = {}
+        self._publish_times: dict[int, float] = {}
         self._creation_times: list[float] = []
         self._lock = threading.Lock()
 
@@ -302,7 +317,7 @@ class HighFrequencyEventGenerator:
 
             publish_time = time.perf_counter()
             with self._lock:
-                self._publish_times[event.timestamp] = publish_time
+                self._publish_times[event.timestamp_ns] = publish_time
 
             try:
                 self.event_bus.thread_safe_publish(event)
@@ -348,7 +363,7 @@ class HighFrequencyEventGenerator:
         with self._lock:
             return self._events_published
 
-    def get_publish_times(self) -> dict[datetime, float]:
+    def get_publish_times(self) -> dict[int, float]:
         with self._lock:
             return dict(self._publish_times)
 
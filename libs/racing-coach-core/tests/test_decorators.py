@@ -20,6 +20,8 @@ class TestFuncHandlesDecorator:
         # The decorator should return the original function
         assert callable(my_handler)
         assert my_handler.__name__ == "my_handler"
+        assert not hasattr(my_handler, "__wrapped__")
+        assert my_handler.__event_type__ == event_type  # type: ignore[attr-defined]
 
     def test_func_handles_decorator_preserves_functionality(self, event_bus: EventBus):
         """Test that decorated function still works correctly."""
@@ -103,6 +105,7 @@ class TestMethodHandlesDecorator:
 
         handler = MyHandler()
         assert callable(handler.handle)
+        assert handler.handle.__event_type__ == event_type  # type: ignore[attr-defined]
 
     def test_method_handles_decorator_preserves_functionality(self, event_bus: EventBus):
         """Test that decorated method still works correctly."""
@@ -327,3 +330,50 @@ class TestDecoratorEdgeCases:
             pass
 
         assert my_custom_handler_name.__name__ == "my_custom_handler_name"
+
+    def test_decorator_sets_event_group(self):
+        """Test that the group argument is stored on the handler for the EventBus."""
+        event_type = EventType[str](name="TEST", data_type=str)
+
+        @func_handles(event_type, group="laps")
+        def grouped(context: HandlerContext[str]) -> None:
+            pass
+
+        class MyHandler:
+            @method_handles(event_type, group="laps")
+            def handle(self, context: HandlerContext[str]) -> None:
+                pass
+
+        @func_handles(event_type)
+        def ungrouped(context: HandlerContext[str]) -> None:
+            pass
+
+        assert grouped.__event_group__ == "laps"  # type: ignore[attr-defined]
+        assert MyHandler().handle.__event_group__ == "laps"  # type: ignore[attr-defined]
+        assert not hasattr(ungrouped, "__event_group__")
+
+    def test_decorator_marks_sync_handlers(self):
+        """Test that sync=True marks the handler to be called inline by the EventBus."""
+        event_type = EventType[str](name="TEST", data_type=str)
+
+        @func_handles(event_type, sync=True)
+        def inline(context: HandlerContext[str]) -> None:
+            pass
+
+        @func_handles(event_type)
+        def queued(context: HandlerContext[str]) -> None:
+            pass
+
+        assert inline.__event_sync__  # type: ignore[attr-defined]
+        assert not hasattr(queued, "__event_sync__")
+
+    def test_decorator_stores_cost(self):
+        """Test that cost_us is stored on the handler for the EventBus."""
+        event_type = EventType[str](name="TEST", data_type=str)
+
+        class MyHandler:
+            @method_handles(event_type, cost_us=20)
+            def handle(self, context: HandlerContext[str]) -> None:
+                pass
+
+        assert MyHandler().handle.__cost_us__ == 20  # type: ignore[attr-defined]
@@ -1,6 +1,8 @@
 """Tests for the EventBus class."""
 
 import asyncio
+import os
+import threading
 import time
 from typing import Any
 
@@ -36,6 +38,25 @@ class TestEventBusInitialization:
         assert bus._max_queue_size == 500  # type: ignore
         assert bus._thread_pool._thread_name_prefix == "TestHandler"  # type: ignore
 
+    def test_default_workers_match_cpu_count(self):
+        """Test that the thread pool defaults to one worker per CPU core."""
+        bus = EventBus()
+        assert bus._thread_pool._max_workers == (os.cpu_count() or 1)  # type: ignore
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+    def test_pin_workers(self):
+        """Test that pinned workers run on a single core named in the thread name."""
+        bus = EventBus(max_workers=1, pin_workers=True)
+
+        def worker_info() -> tuple[str, set[int]]:
+            return threading.current_thread().name, os.sched_getaffinity(0)
+
+        name, cores = bus._thread_pool.submit(worker_info).result(timeout=1.0)  # type: ignore
+        bus._thread_pool.shutdown()  # type: ignore
+
+        assert len(cores) == 1
+        assert name.endswith(f"-core{next(iter(cores))}")
+
     def test_event_bus_initial_state(self):
         """Test that EventBus starts in the correct initial state."""
         bus = EventBus()
@@ -100,6 +121,23 @@ class TestEventBusSubscription:
 
         assert len(event_bus._handlers[sample_event_type]) == 0  # type: ignore
 
+    def test_dispatchers_track_subscriptions(
+        self, event_bus: EventBus, sample_event_type: EventType[str]
+    ):
+        """Test that the dispatch table only has entries for event types with handlers."""
+        type_id = sample_event_type._id  # type: ignore
+
+        def handler(context: HandlerContext[str]) -> None:
+            pass
+
+        event_bus.subscribe(sample_event_type, handler)
+        assert event_bus._dispatchers[type_id] is not None  # type: ignore
+        with pytest.raises(TypeError):
+            event_bus._dispatchers[type_id] = None  # type: ignore
+
+        event_bus.unsubscribe(sample_event_type, handler)
+        assert event_bus._dispatchers[type_id] is None  # type: ignore
+
     def test_unsubscribe_nonexistent_handler(
         self, event_bus: EventBus, sample_event_type: EventType[str]
     ):
@@ -211,6 +249,20 @@ class TestEventBusStartStop:
         event_bus.stop()
         assert not event_bus.is_running()
 
+    def test_publish_immediately_after_start(
+        self, event_bus: EventBus, sample_event_type: EventType[str]
+    ):
+        """Test that the bus accepts events as soon as start() returns."""
+        received = threading.Event()
+        event_bus.subscribe(sample_event_type, lambda context: received.set())
+
+        event_bus.start()
+        try:
+            event_bus.thread_safe_publish(Event(type=sample_event_type, data="test data"))
+            assert received.wait(timeout=1.0)
+        finally:
+            event_bus.stop()
+
     def test_stop_event_bus_not_running(self, event_bus: EventBus):
         """Test stopping an event bus that is not running."""
         # Should not raise an error
@@ -281,6 +333,22 @@ class TestEventBusPublishIntegration:
         assert received_data1 == ["test data"]
         assert received_data2 == ["test data"]
 
+    async def test_handlers_share_one_context_per_event(self, running_event_bus: EventBus):
+        """Test that all handlers of an event are given the same HandlerContext."""
+        event_type = EventType[str](name="TEST", data_type=str)
+        contexts1: list[HandlerContext[str]] = []
+        contexts2: list[HandlerContext[str]] = []
+
+        running_event_bus.subscribe(event_type, contexts1.append)
+        running_event_bus.subscribe(event_type, contexts2.append)
+
+        for data in ("a", "b"):
+            await running_event_bus.publish(Event(type=event_type, data=data))
+        await asyncio.sleep(0.2)
+
+        assert [context.event.data for context in contexts1] == ["a", "b"]
+        assert all(c1 is c2 for c1, c2 in zip(contexts1, contexts2, strict=True))
+
     async def test_handler_not_called_for_different_event_type(self, running_event_bus: EventBus):
         """Test that handlers are only called for their subscribed event types."""
         event_type1 = EventType[str](name="TYPE_1", data_type=str)
@@ -320,6 +388,142 @@ class TestEventBusPublishIntegration:
         assert len(received_data) == 5
         assert received_data == [f"data_{i}" for i in range(5)]
 
+    async def test_publish_async_waits_for_full_queue(self):
+        """Test that publish_async waits for a free slot instead of dropping the event."""
+        bus = EventBus(max_queue_size=2, max_workers=1)
+        bus.start()
+        event_type = EventType[int](name="TEST", data_type=int)
+        release = threading.Event()
+        received_data: list[int] = []
+
+        def handler(context: HandlerContext[int]) -> None:
+            release.wait(timeout=2.0)
+            received_data.append(context.event.data)
+
+        bus.subscribe(event_type, handler)
+
+        try:
+            # The first event blocks the consumer, the next two fill the queue
+            for i in range(3):
+                await bus.publish(Event(type=event_type, data=i))
+                await asyncio.sleep(0.05)
+
+            waiting = asyncio.ensure_future(bus.publish_async(Event(type=event_type, data=3)))
+            await asyncio.sleep(0.1)
+            assert not waiting.done()
+
+            release.set()
+            await asyncio.wait_for(waiting, timeout=2.0)
+            await asyncio.sleep(0.2)
+        finally:
+            release.set()
+            bus.stop()
+
+        assert received_data == [0, 1, 2, 3]
+
+    async def test_grouped_handlers_share_a_worker(self, running_event_bus: EventBus):
+        """Test that handlers in one group run sequentially in the same thread."""
+        event_type = EventType[str](name="TEST", data_type=str)
+        calls: list[tuple[str, str]] = []
+
+        def first(context: HandlerContext[str]) -> None:
+            time.sleep(0.05)
+            calls.append(("first", threading.current_thread().name))
+
+        def second(context: HandlerContext[str]) -> None:
+            calls.append(("second", threading.current_thread().name))
+
+        first.__event_group__ = "group"  # type: ignore[attr-defined]
+        second.__event_group__ = "group"  # type: ignore[attr-defined]
+        running_event_bus.subscribe(event_type, first)
+        running_event_bus.subscribe(event_type, second)
+
+        await running_event_bus.publish(Event(type=event_type, data="test data"))
+        await asyncio.sleep(0.2)
+
+        assert [name for name, _ in calls] == ["first", "second"]
+        assert calls[0][1] == calls[1][1]
+
+    async def test_batched_events_keep_order_across_types(self, running_event_bus: EventBus):
+        """Test that events drained as one batch reach handlers in publish order."""
+        type_a = EventType[str](name="TYPE_A", data_type=str)
+        type_b = EventType[str](name="TYPE_B", data_type=str)
+        release = threading.Event()
+        received_data: list[str] = []
+
+        def handler(context: HandlerContext[str]) -> None:
+            release.wait(timeout=2.0)
+            received_data.append(context.event.data)
+
+        running_event_bus.subscribe(type_a, handler)
+        running_event_bus.subscribe(type_b, handler)
+
+        # The first event blocks the consumer so the rest are drained as one batch
+        published = [(type_a, "a0"), (type_a, "a1"), (type_a, "a2"), (type_b, "b0"), (type_a, "a3")]
+        for event_type, data in published:
+            running_event_bus.thread_safe_publish(Event(type=event_type, data=data))
+            await asyncio.sleep(0.01)
+
+        release.set()
+        await asyncio.sleep(0.2)
+
+        assert received_data == [data for _, data in published]
+
+    async def test_sync_handler_runs_inline(self, running_event_bus: EventBus):
+        """Test that sync handlers run on the publisher's thread before publish returns."""
+        event_type = EventType[str](name="TEST", data_type=str)
+        sync_calls: list[tuple[str, str]] = []
+        queued_calls: list[str] = []
+
+        def sync_handler(context: HandlerContext[str]) -> None:
+            sync_calls.append((context.event.data, threading.current_thread().name))
+
+        def queued_handler(context: HandlerContext[str]) -> None:
+            queued_calls.append(context.event.data)
+
+        sync_handler.__event_sync__ = True  # type: ignore[attr-defined]
+        running_event_bus.subscribe(event_type, sync_handler)
+        running_event_bus.subscribe(event_type, queued_handler)
+        assert running_event_bus._sync_handlers[event_type._id] == (sync_handler,)  # type: ignore
+
+        running_event_bus.publish_sync(Event(type=event_type, data="a"))
+        assert sync_calls == [("a", threading.current_thread().name)]
+
+        await running_event_bus.publish(Event(type=event_type, data="b"))
+        assert [data for data, _ in sync_calls] == ["a", "b"]
+
+        await asyncio.sleep(0.2)
+        assert queued_calls == ["a", "b"]
+
+    async def test_cheap_handlers_skip_thread_pool(self, running_event_bus: EventBus):
+        """Test that handlers declaring a small cost run on the loop thread, others in the pool."""
+        event_type = EventType[str](name="TEST", data_type=str)
+        threads: dict[str, str] = {}
+
+        def cheap(context: HandlerContext[str]) -> None:
+            threads["cheap"] = threading.current_thread().name
+
+        def expensive(context: HandlerContext[str]) -> None:
+            threads["expensive"] = threading.current_thread().name
+
+        cheap.__cost_us__ = 5  # type: ignore[attr-defined]
+        expensive.__cost_us__ = 5000  # type: ignore[attr-defined]
+        running_event_bus.subscribe(event_type, cheap)
+        running_event_bus.subscribe(event_type, expensive)
+
+        await running_event_bus.publish(Event(type=event_type, data="test data"))
+        await asyncio.sleep(0.2)
+
+        assert threads["cheap"] == running_event_bus._thread.name  # type: ignore
+        assert threads["expensive"].startswith("EventHandler")
+
+        running_event_bus.unsubscribe(event_type, expensive)
+        threads.clear()
+        await running_event_bus.publish(Event(type=event_type, data="test data"))
+        await asyncio.sleep(0.2)
+
+        assert threads == {"cheap": running_event_bus._thread.name}  # type: ignore
+
     @pytest.mark.slow
     async def test_handler_exception_does_not_stop_processing(self, running_event_bus: EventBus):
         """Test that an exception in one handler doesn't stop other handlers."""
@@ -369,6 +573,66 @@ class TestEventBusThreadSafePublish:
 
         assert received_data == ["thread data"]
 
+    async def test_thread_safe_publish_from_many_threads(self, running_event_bus: EventBus):
+        """Test that events published from several threads are all delivered in order."""
+        event_type = EventType[tuple[int, int]](name="TEST", data_type=tuple)
+        received_data: list[tuple[int, int]] = []
+
+        def handler(context: HandlerContext[tuple[int, int]]) -> None:
+            received_data.append(context.event.data)
+
+        running_event_bus.subscribe(event_type, handler)
+
+        def publish_events(thread_id: int) -> None:
+            for i in range(20):
+                running_event_bus.thread_safe_publish(Event(type=event_type, data=(thread_id, i)))
+                time.sleep(0.001)
+
+        threads = [threading.Thread(target=publish_events, args=(t,)) for t in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        await asyncio.sleep(0.3)
+
+        assert len(received_data) == 60
+        for t in range(3):
+            assert [i for tid, i in received_data if tid == t] == list(range(20))
+
+    async def test_thread_safe_publish_drops_when_full(self):
+        """Test that publishing to a full queue drops the event and counts it."""
+        bus = EventBus(max_queue_size=2, max_workers=1)
+        bus.start()
+        event_type = EventType[int](name="TEST", data_type=int)
+        release = threading.Event()
+        received_data: list[int] = []
+
+        def handler(context: HandlerContext[int]) -> None:
+            release.wait(timeout=2.0)
+            received_data.append(context.event.data)
+
+        bus.subscribe(event_type, handler)
+
+        try:
+            # The first event blocks the consumer, the next two fill the queue
+            for i in range(4):
+                bus.thread_safe_publish(Event(type=event_type, data=i))
+                await asyncio.sleep(0.05)
+
+            stats = bus.stats()
+            assert stats.queued == 2
+            assert stats.dropped == 1
+
+            release.set()
+            await asyncio.sleep(0.2)
+        finally:
+            release.set()
+            bus.stop()
+
+        assert received_data == [0, 1, 2]
+        assert bus.stats().dropped == 1
+
     async def test_thread_safe_publish_not_running(self, event_bus: EventBus):
         """Test that thread-safe publishing to a non-running bus raises an error."""
         event_type = EventType[str](name="TEST", data_type=str)
@@ -50,6 +50,14 @@ class TestEventType:
         event_type2 = EventType[str](name="TEST_EVENT_2", data_type=str)
         assert event_type1 != event_type2
 
+    def test_event_type_id_shared_by_equal_types(self):
+        """Test that equal EventTypes get the same handler index and others a different one."""
+        event_type1 = EventType[str](name="TEST_EVENT", data_type=str)
+        event_type2 = EventType[str](name="TEST_EVENT", data_type=str)
+        event_type3 = EventType[str](name="OTHER_EVENT", data_type=str)
+        assert event_type1._id == event_type2._id  # type: ignore
+        assert event_type1._id != event_type3._id  # type: ignore
+
     def test_event_type_with_complex_data_type(self):
         """Test creating an EventType with a complex data type."""
         event_type = EventType[dict[Any, Any]](name="COMPLEX_EVENT", data_type=dict)
@@ -104,12 +112,27 @@ class TestEvent:
         event = Event(type=sample_event_type, data="test data", timestamp=custom_time)
         assert event.timestamp == custom_time
 
+    def test_event_timestamp_ns(self, sample_event_type: EventType[str]):
+        """Test that timestamp_ns keeps microseconds and matches the timestamp property."""
+        custom_time = datetime(2024, 1, 1, 12, 0, 0, 123456)
+        event = Event(type=sample_event_type, data="test data", timestamp=custom_time)
+        assert event.timestamp_ns % 1_000_000_000 == 123_456_000
+        assert event.timestamp == custom_time
+
+        copy = Event(type=sample_event_type, data="test data", timestamp_ns=event.timestamp_ns)
+        assert copy.timestamp == custom_time
+
     def test_event_frozen(self, sample_event_type: EventType[str]):
         """Test that Event is immutable (frozen)."""
         event = Event(type=sample_event_type, data="test data")
         with pytest.raises(Exception):  # dataclass frozen=True raises FrozenInstanceError
             event.data = "changed"  # type: ignore
 
+    def test_event_has_no_instance_dict(self, sample_event_type: EventType[str]):
+        """Test that events use slots instead of a per-instance __dict__."""
+        event = Event(type=sample_event_type, data="test data")
+        assert not hasattr(event, "__dict__")
+
     def test_event_with_complex_data(self):
         """Test creating an Event with complex data types."""
         event_type = EventType[dict[str, Any]](name="COMPLEX", data_type=dict)
@@ -0,0 +1,139 @@
+"""Tests for reading telemetry from IBT files."""
+
+import struct
+from pathlib import Path
+from types import SimpleNamespace
+
+import irsdk  # pyright: ignore[reportMissingTypeStubs]
+import pytest
+from racing_coach_core.schemas.telemetry import IRSDK_VARIABLES, TelemetryFrame, TrackSurface
+from racing_coach_core.utils import telemetry as telemetry_utils
+
+_VAR_HEADER_OFFSET = 144
+_VAR_HEADER_SIZE = 144
+
+_TYPE_CODES = {float: "d", int: "i", bool: "?", TrackSurface: "i"}
+
+
+def _write_ibt(path: Path, variables: dict[str, tuple[str, list[object]]]) -> None:
+    """Write a minimal IBT file holding each variable's (type code, samples).
+
+    Only the header fields irsdk.IBT reads are filled in. A sample that is a list makes the
+    variable an array of that length.
+    """
+    record_count = len(next(iter(variables.values()))[1])
+    headers = b""
+    formats: list[str] = []
+    buf_len = 0
+    for name, (code, samples) in variables.items():
+        count = len(samples[0]) if isinstance(samples[0], list) else 1  # pyright: ignore[reportUnknownArgumentType]
+        headers += struct.pack(
+            "iii?3x32s64s32s",
+            irsdk.VAR_TYPE_MAP.index(code),
+            buf_len,
+            count,
+            False,
+            name.encode(),
+            b"",
+            b"",
+        )
+        formats.append(code * count)
+        buf_len += struct.calcsize(code * count)
+
+    data_offset = _VAR_HEADER_OFFSET + len(variables) * _VAR_HEADER_SIZE
+    rows = b""
+    for index in range(record_count):
+        for (_, samples), fmt in zip(variables.values(), formats, strict=True):
+            sample = samples[index]
+            rows += struct.pack(fmt, *(sample if isinstance(sample, list) else [sample]))  # pyright: ignore[reportUnknownArgumentType]
+
+    header = struct.pack("10i", 1, 1, 60, 0, 0, 0, len(variables), _VAR_HEADER_OFFSET, 1, buf_len)
+    header = header.ljust(48, b"\0") + struct.pack("ii", 0, data_offset)
+    disk_header = struct.pack("Qddii", 0, 0.0, 0.0, 0, record_count)
+    path.write_bytes(header.ljust(112, b"\0") + disk_header.ljust(32, b"\0") + headers + rows)
+
+
+def _frame_variables(record_count: int) -> dict[str, tuple[str, list[object]]]:
+    """Every variable a TelemetryFrame reads, where each sample equals its frame index."""
+    fields = TelemetryFrame.model_fields
+    variables: dict[str, tuple[str, list[object]]] = {}
+    for name, variable in IRSDK_VARIABLES.items():
+        code = _TYPE_CODES[fields[name].annotation]
+        samples: list[object] = [bool(i) if code == "?" else i for i in range(record_count)]
+        variables[variable] = (code, samples)
+    return variables
+
+
+@pytest.mark.unit
+def test_columns_match_irsdk_get_all(tmp_path: Path):
+    """Test that columns read from the memory map equal pyirsdk's own get_all."""
+    path = tmp_path / "session.ibt"
+    _write_ibt(
+        path,
+        {
+            "Char": ("c", [b"a", b"b", b"c"]),
+            "Flag": ("?", [True, False, True]),
+            "Int": ("i", [-1, 0, 7]),
+            "Bits": ("I", [1, 2, 2**31]),
+            "Float": ("f", [0.1, 1.5, -2.25]),
+            "Double": ("d", [0.1, 1.5, -2.25]),
+            "Temps": ("f", [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]),
+        },
+    )
+    ibt = irsdk.IBT()
+    ibt.open(ibt_file=path)  # pyright: ignore[reportUnknownMemberType]
+
+    try:
+        for key in ("Char", "Flag", "Int", "Bits", "Float", "Double", "Temps"):
+            column = telemetry_utils._read_ibt_column(ibt, key)  # pyright: ignore[reportPrivateUsage]
+            assert column == ibt.get_all(key)  # pyright: ignore[reportUnknownMemberType]
+        assert telemetry_utils._read_ibt_column(ibt, "Missing") is None  # pyright: ignore[reportPrivateUsage]
+    finally:
+        ibt.close()  # pyright: ignore[reportUnknownMemberType]
+
+
+@pytest.mark.unit
+def test_columns_fall_back_to_get_all(tmp_path: Path):
+    """Test that columns are read with get_all when pyirsdk's internals are missing."""
+    path = tmp_path / "session.ibt"
+    _write_ibt(
+        path, {"Int": ("i", [-1, 0, 7]), "Temps": ("f", [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])}
+    )
+    ibt = irsdk.IBT()
+    ibt.open(ibt_file=path)  # pyright: ignore[reportUnknownMemberType]
+    # Only the public reader is left, as if a pyirsdk release renamed the private attributes
+    public_ibt = SimpleNamespace(get_all=ibt.get_all)  # pyright: ignore[reportUnknownMemberType]
+
+    try:
+        for key in ("Int", "Temps"):
+            column = telemetry_utils._read_ibt_column(public_ibt, key)  # pyright: ignore[reportPrivateUsage, reportArgumentType]
+            assert column == telemetry_utils._read_ibt_column(ibt, key)  # pyright: ignore[reportPrivateUsage]
+        assert telemetry_utils._read_ibt_column(public_ibt, "Missing") is None  # pyright: ignore[reportPrivateUsage, reportArgumentType]
+    finally:
+        ibt.close()  # pyright: ignore[reportUnknownMemberType]
+
+
+@pytest.mark.unit
+def test_sequence_from_ibt(tmp_path: Path):
+    """Test that every frame of an IBT file is read with the frame field types."""
+    path = tmp_path / "session.ibt"
+    _write_ibt(path, _frame_variables(2))
+
+    sequence = telemetry_utils.get_telemetry_sequence_from_ibt(path)
+
+    assert len(sequence.frames) == 2
+    assert sequence.frames[1].speed == 1.0
+    assert sequence.frames[1].track_surface is TrackSurface.PIT_STALL
+    assert sequence.frames[1].on_pit_road is True
+
+
+@pytest.mark.unit
+def test_sequence_requires_every_variable(tmp_path: Path):
+    """Test that a file missing a telemetry variable is rejected by name."""
+    path = tmp_path / "session.ibt"
+    variables = _frame_variables(2)
+    del variables["Speed"]
+    _write_ibt(path, variables)
+
+    with pytest.raises(ValueError, match="Speed"):
+        telemetry_utils.get_telemetry_sequence_from_ibt(path)
@@ -0,0 +1,85 @@
+"""Tests for the MPSCRing buffer."""
+
+import threading
+
+import pytest
+from racing_coach_core.events.ringbuf import MPSCRing
+
+
+@pytest.mark.unit
+class TestMPSCRing:
+    """Unit tests for MPSCRing."""
+
+    def test_drain_returns_items_in_order(self):
+        """Test that items come out in the order they were pushed."""
+        ring = MPSCRing[int](8)
+
+        for i in range(5):
+            assert ring.push(i)
+
+        assert ring.qsize() == 5
+        assert ring.drain() == [0, 1, 2, 3, 4]
+        assert ring.empty()
+
+    def test_push_fails_when_full(self):
+        """Test that a bounded ring rejects items once every slot is taken."""
+        ring = MPSCRing[int](3)
+
+        assert all(ring.push(i) for i in range(3))
+        assert not ring.push(3)
+        assert ring.drain() == [0, 1, 2]
+        assert ring.push(4)
+
+    def test_wraps_around(self):
+        """Test that slots are reused after the indices pass the capacity."""
+        ring = MPSCRing[int](4)
+
+        drained: list[int] = []
+        for i in range(10):
+            ring.push(i)
+            if i % 3 == 2:
+                drained.extend(ring.drain())
+        drained.extend(ring.drain())
+
+        assert drained == list(range(10))
+
+    def test_drain_max_items(self):
+        """Test that drain stops at max_items and leaves the rest queued."""
+        ring = MPSCRing[int](8)
+        for i in range(5):
+            ring.push(i)
+
+        assert ring.drain(max_items=2) == [0, 1]
+        assert ring.drain() == [2, 3, 4]
+
+    def test_unbounded_ring_grows(self):
+        """Test that a ring with capacity 0 keeps accepting items."""
+        ring = MPSCRing[int](0)
+        ring.push(-1)
+        ring.drain()
+
+        for i in range(3000):
+            assert ring.push(i)
+
+        assert ring.drain() == list(range(3000))
+
+    def test_concurrent_producers(self):
+        """Test that items from many producer threads are neither lost nor duplicated."""
+        ring = MPSCRing[tuple[int, int]](0)
+        per_thread = 2000
+
+        def produce(thread_id: int) -> None:
+            for i in range(per_thread):
+                ring.push((thread_id, i))
+
+        threads = [threading.Thread(target=produce, args=(t,)) for t in range(4)]
+        drained: list[tuple[int, int]] = []
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            drained.extend(ring.drain())
+        drained.extend(ring.drain())
+
+        assert sorted(drained) == [(t, i) for t in range(4) for i in range(per_thread)]
+        for t in range(4):
+            assert [i for tid, i in drained if tid == t] == list(range(per_thread))
@@ -7,6 +7,13 @@ All tests require the Rust extension to be compiled and available.
 from datetime import datetime, timezone
 
 import pytest
+from racing_coach_core.algs.metrics import (
+    BRAKE_THRESHOLD,
+    STEERING_THRESHOLD,
+    THROTTLE_THRESHOLD,
+    _extract_braking_zones,  # pyright: ignore[reportPrivateUsage]
+    _extract_corners,  # pyright: ignore[reportPrivateUsage]
+)
 from racing_coach_core.rust_ext import (
     compute_speed_stats,
     extract_braking_zones,
@@ -28,6 +35,9 @@ pytestmark = [
 # Fixtures
 # =============================================================================
 
+FRAME_INTERVAL = 1 / 60
+"""Session clock step between fixture frames (60 Hz telemetry)."""
+
 
 def create_telemetry_frame(
     *,
@@ -39,12 +49,13 @@ def create_telemetry_frame(
     lateral_acceleration: float = 0.0,
     longitudinal_acceleration: float = 0.0,
     timestamp: datetime | None = None,
+    session_time: float = 0.0,
     lap_number: int = 1,
 ) -> TelemetryFrame:
     """Create a TelemetryFrame with sensible defaults."""
     return TelemetryFrame(
         timestamp=timestamp or datetime.now(timezone.utc),
-        session_time=0.0,
+        session_time=session_time,
         lap_number=lap_number,
         lap_distance_pct=lap_distance_pct,
         lap_distance=lap_distance_pct * 5000,  # Assume 5km track
@@ -73,9 +84,34 @@ def create_telemetry_frame(
         latitude=0.0,
         longitude=0.0,
         altitude=0.0,
-        tire_temps={"LF": {"left": 80.0, "middle": 85.0, "right": 82.0}},
-        tire_wear={"LF": {"left": 0.95, "middle": 0.93, "right": 0.94}},
-        brake_line_pressure={"LF": 2.5},
+        lf_tire_temp_left=80.0,
+        lf_tire_temp_middle=85.0,
+        lf_tire_temp_right=82.0,
+        rf_tire_temp_left=0.0,
+        rf_tire_temp_middle=0.0,
+        rf_tire_temp_right=0.0,
+        lr_tire_temp_left=0.0,
+        lr_tire_temp_middle=0.0,
+        lr_tire_temp_right=0.0,
+        rr_tire_temp_left=0.0,
+        rr_tire_temp_middle=0.0,
+        rr_tire_temp_right=0.0,
+        lf_tire_wear_left=0.95,
+        lf_tire_wear_middle=0.93,
+        lf_tire_wear_right=0.94,
+        rf_tire_wear_left=0.0,
+        rf_tire_wear_middle=0.0,
+        rf_tire_wear_right=0.0,
+        lr_tire_wear_left=0.0,
+        lr_tire_wear_middle=0.0,
+        lr_tire_wear_right=0.0,
+        rr_tire_wear_left=0.0,
+        rr_tire_wear_middle=0.0,
+        rr_tire_wear_right=0.0,
+        lf_brake_pressure=2.5,
+        rf_brake_pressure=0.0,
+        lr_brake_pressure=0.0,
+        rr_brake_pressure=0.0,
         track_temp=30.0,
         track_wetness=0,
         air_temp=25.0,
@@ -88,7 +124,10 @@ def create_telemetry_frame(
 @pytest.fixture
 def minimal_telemetry_sequence() -> TelemetrySequence:
     """Create minimal valid TelemetrySequence with 10 frames."""
-    frames = [create_telemetry_frame(lap_distance_pct=i / 10) for i in range(10)]
+    frames = [
+        create_telemetry_frame(lap_distance_pct=i / 10, session_time=i * FRAME_INTERVAL)
+        for i in range(10)
+    ]
     return TelemetrySequence(frames=frames)
 
 
@@ -112,6 +151,7 @@ def braking_telemetry_sequence() -> TelemetrySequence:
             # Straight - full throttle
             frame = create_telemetry_frame(
                 lap_distance_pct=pct,
+                session_time=i * FRAME_INTERVAL,
                 throttle=1.0,
                 brake=0.0,
                 speed=80.0,
@@ -124,6 +164,7 @@ def braking_telemetry_sequence() -> TelemetrySequence:
             speed = 80.0 - (brake_intensity * 50)  # 80 -> 30 m/s
             frame = create_telemetry_frame(
                 lap_distance_pct=pct,
+                session_time=i * FRAME_INTERVAL,
                 throttle=0.0,
                 brake=0.8 + brake_intensity * 0.2,  # 0.8 to 1.0
                 speed=speed,
@@ -135,6 +176,7 @@ def braking_telemetry_sequence() -> TelemetrySequence:
             corner_pct = (pct - 0.5) / 0.2
             frame = create_telemetry_frame(
                 lap_distance_pct=pct,
+                session_time=i * FRAME_INTERVAL,
                 throttle=0.0,
                 brake=0.3 - corner_pct * 0.3,  # Trail off brake
                 speed=30.0 + corner_pct * 10,  # Slowly accelerating
@@ -146,6 +188,7 @@ def braking_telemetry_sequence() -> TelemetrySequence:
             exit_pct = (pct - 0.7) / 0.3
             frame = create_telemetry_frame(
                 lap_distance_pct=pct,
+                session_time=i * FRAME_INTERVAL,
                 throttle=0.5 + exit_pct * 0.5,
                 brake=0.0,
                 speed=40.0 + exit_pct * 30,
@@ -171,6 +214,7 @@ def cornering_telemetry_sequence() -> TelemetrySequence:
             # Approach
             frame = create_telemetry_frame(
                 lap_distance_pct=pct,
+                session_time=i * FRAME_INTERVAL,
                 throttle=0.8,
                 speed=60.0,
                 steering_angle=0.0,
@@ -181,6 +225,7 @@ def cornering_telemetry_sequence() -> TelemetrySequence:
             turn_pct = (pct - 0.2) / 0.2
             frame = create_telemetry_frame(
                 lap_distance_pct=pct,
+                session_time=i * FRAME_INTERVAL,
                 throttle=0.3,
                 speed=50.0 - turn_pct * 15,
                 steering_angle=turn_pct * 0.8,  # Increasing steering
@@ -190,6 +235,7 @@ def cornering_telemetry_sequence() -> TelemetrySequence:
             # Apex
             frame = create_telemetry_frame(
                 lap_distance_pct=pct,
+                session_time=i * FRAME_INTERVAL,
                 throttle=0.2,
                 speed=35.0,
                 steering_angle=0.8,  # Max steering
@@ -200,6 +246,7 @@ def cornering_telemetry_sequence() -> TelemetrySequence:
             exit_pct = (pct - 0.6) / 0.2
             frame = create_telemetry_frame(
                 lap_distance_pct=pct,
+                session_time=i * FRAME_INTERVAL,
                 throttle=0.5 + exit_pct * 0.5,
                 speed=35.0 + exit_pct * 25,
                 steering_angle=0.8 - exit_pct * 0.6,  # Unwinding
@@ -209,6 +256,7 @@ def cornering_telemetry_sequence() -> TelemetrySequence:
             # Straight
             frame = create_telemetry_frame(
                 lap_distance_pct=pct,
+                session_time=i * FRAME_INTERVAL,
                 throttle=1.0,
                 speed=60.0,
                 steering_angle=0.1,
@@ -478,6 +526,40 @@ class TestSyntheticData:
             assert 0.0 <= zone.max_brake_pressure <= 1.0
             assert zone.braking_duration >= 0
 
+    def test_braking_durations_match_python(
+        self, braking_telemetry_sequence: TelemetrySequence
+    ) -> None:
+        """Braking duration and deceleration agree with the Python implementation."""
+        zones = extract_braking_zones(braking_telemetry_sequence)
+        py_zones = _extract_braking_zones(
+            braking_telemetry_sequence.frames, BRAKE_THRESHOLD, STEERING_THRESHOLD
+        )
+
+        assert len(zones) == len(py_zones) >= 1
+        for zone, py_zone in zip(zones, py_zones, strict=True):
+            assert zone.braking_duration > 0
+            assert zone.braking_duration == pytest.approx(py_zone.braking_duration)
+            assert zone.initial_deceleration == pytest.approx(py_zone.initial_deceleration)
+            assert zone.average_deceleration == pytest.approx(py_zone.average_deceleration)
+
+    def test_corner_durations_match_python(
+        self, cornering_telemetry_sequence: TelemetrySequence
+    ) -> None:
+        """Time in corner agrees with the Python implementation.
+
+        Rust ends a corner on its last turning frame, Python on the first frame below the
+        steering threshold, so the Python time is one frame longer.
+        """
+        corners = extract_corners(cornering_telemetry_sequence)
+        py_corners = _extract_corners(
+            cornering_telemetry_sequence.frames, STEERING_THRESHOLD, THROTTLE_THRESHOLD
+        )
+
+        assert len(corners) == len(py_corners) >= 1
+        for corner, py_corner in zip(corners, py_corners, strict=True):
+            assert corner.time_in_corner > 0
+            assert corner.time_in_corner == pytest.approx(py_corner.time_in_corner - FRAME_INTERVAL)
+
     def test_corner_detected(self, cornering_telemetry_sequence: TelemetrySequence) -> None:
         """Corners are detected in realistic data."""
         result = extract_lap_metrics(cornering_telemetry_sequence)
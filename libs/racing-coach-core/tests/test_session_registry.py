@@ -112,6 +112,20 @@ class TestSessionRegistryUnit:
 
         assert not registry.has_active_session
 
+    def test_get_session_by_id(self):
+        """Test that started sessions can be looked up by ID, also after they end."""
+        registry = SessionRegistry()
+        session1 = SessionFrameFactory.build()
+        session2 = SessionFrameFactory.build()
+
+        registry.start_session(session1)
+        registry.end_session(session1.session_id)
+        registry.start_session(session2)
+
+        assert registry.get_session(session1.session_id) is session1
+        assert registry.get_session(session2.session_id) is session2
+        assert registry.get_session(uuid4()) is None
+
 
 @pytest.mark.integration
 class TestSessionRegistryThreadSafety:
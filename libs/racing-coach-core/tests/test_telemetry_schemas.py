@@ -0,0 +1,353 @@
+"""Tests for the telemetry schemas."""
+
+import subprocess
+import sys
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import BaseModel, ValidationError
+from racing_coach_core.schemas.telemetry import (
+    IRSDK_VARIABLES,
+    LapTelemetry,
+    SessionFrame,
+    TelemetryFrame,
+    TelemetryFrameBuffer,
+    TelemetrySequence,
+    TrackSurface,
+)
+
+from tests.factories import LapTelemetryFactory, SessionFrameFactory, TelemetryFrameFactory
+
+
+@pytest.mark.unit
+class TestSerializationCache:
+    """Unit tests for the cached dumps on telemetry models."""
+
+    def test_lap_json_dump_is_cached(self):
+        """Test that the lap is only dumped once."""
+        lap = LapTelemetryFactory.build(frames=TelemetryFrameFactory.batch(5))
+
+        first = lap.json_dump
+
+        assert first is lap.json_dump
+        assert first == lap.model_dump(mode="json")
+
+    def test_session_json_dump_is_cached(self):
+        """Test that the session is only dumped once."""
+        session = SessionFrameFactory.build()
+
+        assert session.json_dump is session.json_dump
+        assert session.json_dump["session_id"] == str(session.session_id)
+
+    def test_cached_dump_does_not_affect_equality(self):
+        """Test that populating the cache leaves model equality unchanged."""
+        lap = LapTelemetryFactory.build(frames=TelemetryFrameFactory.batch(3))
+        copy = LapTelemetry(frames=lap.frames, lap_time=lap.lap_time)
+
+        _ = lap.json_dump
+
+        assert lap == copy
+        assert "json_dump" not in lap.model_dump()
+
+    def test_model_copy_drops_cached_values(self):
+        """Test that a copy with updated fields does not reuse the original's caches."""
+        lap = LapTelemetryFactory.build(frames=TelemetryFrameFactory.batch(10))
+        session = SessionFrameFactory.build()
+        _ = lap.json_dump, lap.frame_arrays, lap.frames_dataframe, session.json_dump
+
+        shorter = lap.model_copy(update={"frames": lap.frames[:3]})
+        renamed = session.model_copy(update={"track_name": "Renamed"})
+
+        assert len(shorter.frame_arrays["speed"]) == 3
+        assert len(shorter.frames_dataframe) == 3
+        assert shorter.json_dump == shorter.model_dump(mode="json")
+        assert renamed.json_dump["track_name"] == "Renamed"
+        assert len(lap.frame_arrays["speed"]) == 10
+
+
+@pytest.mark.unit
+class TestFrameArrays:
+    """Unit tests for the columnar frame cache on TelemetrySequence."""
+
+    def test_arrays_hold_numeric_fields(self):
+        """Test that each numeric field becomes an array in frame order."""
+        frames = TelemetryFrameFactory.batch(4)
+        sequence = TelemetrySequence(frames=frames)
+
+        arrays = sequence.frame_arrays
+
+        assert arrays["speed"].tolist() == [frame.speed for frame in frames]
+        assert arrays["gear"].dtype == np.int64
+        assert "timestamp" not in arrays
+        assert sequence.frame_arrays is arrays
+
+    def test_arrays_are_read_only(self):
+        """Test that consumers cannot modify the shared arrays."""
+        sequence = TelemetrySequence(frames=TelemetryFrameFactory.batch(2))
+
+        with pytest.raises(ValueError):
+            sequence.frame_arrays["speed"][0] = 0.0
+
+
+@pytest.mark.unit
+class TestLapTelemetryParquet:
+    """Unit tests for LapTelemetry parquet round trips."""
+
+    def test_round_trip(self, tmp_path: Path):
+        """Test that frames survive a parquet round trip."""
+        lap = LapTelemetryFactory.build(frames=TelemetryFrameFactory.batch(10), lap_time=90.5)
+        file_path = tmp_path / "lap.parquet"
+
+        lap.to_parquet(file_path)
+        loaded = LapTelemetry.from_parquet(file_path)
+
+        assert loaded.frames == lap.frames
+
+    @pytest.mark.parametrize("lap_time", [90.5, None])
+    def test_round_trip_keeps_lap_time(self, tmp_path: Path, lap_time: float | None):
+        """Test that the lap time is restored from the parquet metadata."""
+        lap = LapTelemetryFactory.build(frames=TelemetryFrameFactory.batch(3), lap_time=lap_time)
+        file_path = tmp_path / "lap.parquet"
+
+        lap.to_parquet(file_path)
+
+        assert LapTelemetry.from_parquet(file_path).lap_time == lap_time
+
+    def test_frames_dataframe_matches_model_dump(self):
+        """Test that the column-built DataFrame holds the same values as the frame dumps."""
+        lap = LapTelemetryFactory.build(frames=TelemetryFrameFactory.batch(5))
+
+        expected = pd.DataFrame([frame.model_dump() for frame in lap.frames])
+
+        pd.testing.assert_frame_equal(lap.frames_dataframe, expected, check_dtype=False)
+        assert lap.frames_dataframe["track_surface"].dtype == np.int8
+
+    def test_round_trip_restores_field_types(self, tmp_path: Path):
+        """Test that loaded frames get the model's types back, not the parquet ones."""
+        lap = LapTelemetryFactory.build(frames=TelemetryFrameFactory.batch(3), lap_time=90.5)
+        file_path = tmp_path / "lap.parquet"
+
+        lap.to_parquet(file_path)
+        frame = LapTelemetry.from_parquet(file_path).frames[0]
+
+        assert isinstance(frame.track_surface, TrackSurface)
+        assert type(frame.on_pit_road) is bool
+
+    def test_loaded_frame_arrays_come_from_parquet(self, tmp_path: Path):
+        """Test that a loaded lap keeps the parquet columns as its frame_arrays."""
+        lap = LapTelemetryFactory.build(frames=TelemetryFrameFactory.batch(4))
+        file_path = tmp_path / "lap.parquet"
+
+        lap.to_parquet(file_path)
+        loaded = LapTelemetry.from_parquet(file_path)
+
+        assert "frame_arrays" in loaded.__dict__
+        assert loaded.frame_arrays.keys() == lap.frame_arrays.keys()
+        for name, array in lap.frame_arrays.items():
+            assert loaded.frame_arrays[name].dtype == array.dtype
+            np.testing.assert_array_equal(loaded.frame_arrays[name], array)
+            assert not loaded.frame_arrays[name].flags.writeable
+
+    def test_frames_dataframe_shares_frame_arrays(self):
+        """Test that numeric DataFrame columns reuse the frame_arrays buffers."""
+        lap = LapTelemetryFactory.build(frames=TelemetryFrameFactory.batch(5))
+
+        column = lap.frames_dataframe["speed"].to_numpy()
+
+        assert np.shares_memory(column, lap.frame_arrays["speed"])
+
+    def test_to_parquet_leaves_cached_dataframe_untouched(self, tmp_path: Path):
+        """Test that writing the lap_time column does not modify the cached DataFrame."""
+        lap = LapTelemetryFactory.build(frames=TelemetryFrameFactory.batch(3), lap_time=90.5)
+
+        lap.to_parquet(tmp_path / "lap.parquet")
+
+        assert "lap_time" not in lap.frames_dataframe.columns
+
+
+@pytest.mark.unit
+class TestTelemetryFrameTireFields:
+    """Unit tests for the flat tire and brake fields on TelemetryFrame."""
+
+    def test_tire_temps_groups_flat_fields(self):
+        """Test that tire_temps rebuilds the per-wheel mapping from the flat fields."""
+        frame = TelemetryFrameFactory.build(lf_tire_temp_left=80.0, rr_tire_temp_right=95.5)
+
+        assert frame.tire_temps["LF"]["left"] == 80.0
+        assert frame.tire_temps["RR"]["right"] == 95.5
+        assert set(frame.tire_temps) == {"LF", "RF", "LR", "RR"}
+
+    def test_brake_line_pressure_groups_flat_fields(self):
+        """Test that brake_line_pressure maps each wheel to its flat field."""
+        frame = TelemetryFrameFactory.build(lf_brake_pressure=1.5, rf_brake_pressure=2.5)
+
+        assert frame.brake_line_pressure["LF"] == 1.5
+        assert frame.brake_line_pressure["RF"] == 2.5
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("model", [TelemetryFrame, SessionFrame, TelemetrySequence, LapTelemetry])
+def test_schema_is_built_at_import(model: type[BaseModel]):
+    """Test that validators are built at import instead of lazily on the first frame."""
+    assert model.__pydantic_complete__
+
+
+@pytest.mark.unit
+def test_schemas_import_without_pandas():
+    """Test that pandas is only imported once a DataFrame or parquet file is needed."""
+    code = "import sys, racing_coach_core.schemas; print('pandas' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.unit
+def test_frames_are_frozen():
+    """Test that telemetry frames reject attribute assignment."""
+    frame = TelemetryFrameFactory.build()
+
+    with pytest.raises(ValidationError):
+        frame.speed = 0.0  # type: ignore[misc]
+
+
+class _ConstantSource:
+    """Telemetry source returning the same value for every variable."""
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def __getitem__(self, key: str) -> object:
+        return self.value
+
+
+@pytest.mark.unit
+class TestTelemetryFrameFromIrsdk:
+    """Unit tests for building a TelemetryFrame from SDK data."""
+
+    def test_from_irsdk_skips_validation(self):
+        """Test that from_irsdk stores the SDK values without coercing them."""
+        frame = TelemetryFrame.from_irsdk(_ConstantSource(1), datetime(2024, 1, 1))
+
+        assert frame.speed == 1
+        assert frame.lf_tire_temp_left == 1
+        assert frame.timestamp == datetime(2024, 1, 1)
+
+    def test_from_irsdk_converts_track_surface(self):
+        """Test that from_irsdk frames hold a TrackSurface and dump without warnings."""
+        source = _source_for(TelemetryFrameFactory.build())
+        source["PlayerTrackSurface"] = 3
+
+        frame = TelemetryFrame.from_irsdk(source, datetime(2024, 1, 1))
+
+        assert frame.track_surface is TrackSurface.ON_TRACK
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            frame.model_dump_json()
+            frame.model_dump()
+
+    def test_from_irsdk_validated_rejects_bad_values(self):
+        """Test that from_irsdk_validated runs pydantic validation."""
+        with pytest.raises(ValidationError):
+            TelemetryFrame.from_irsdk_validated(_ConstantSource("fast"), datetime(2024, 1, 1))
+
+    def test_both_constructors_agree_on_valid_data(self):
+        """Test that validated and unvalidated construction produce equal frames."""
+        source = _ConstantSource(1.0)
+        timestamp = datetime(2024, 1, 1)
+
+        assert TelemetryFrame.from_irsdk(source, timestamp) == TelemetryFrame.from_irsdk_validated(
+            source, timestamp
+        )
+
+
+def _source_for(frame: TelemetryFrame) -> dict[str, object]:
+    """SDK variables that from_irsdk would turn back into the given frame."""
+    return {variable: getattr(frame, name) for name, variable in IRSDK_VARIABLES.items()}
+
+
+@pytest.mark.unit
+class TestTelemetryFrameBuffer:
+    """Unit tests for filling a sequence straight from SDK samples."""
+
+    def test_to_sequence_matches_from_irsdk(self):
+        """Test that buffered samples become the same frames as from_irsdk."""
+        frames = TelemetryFrameFactory.batch(5)
+        buffer = TelemetryFrameBuffer()
+        for frame in frames:
+            buffer.append_irsdk(_source_for(frame), frame.timestamp)
+
+        lap = buffer.to_sequence(LapTelemetry, lap_time=None)
+
+        assert len(buffer) == 5
+        assert lap.frames == frames
+        assert isinstance(lap.frames[0].track_surface, TrackSurface)
+
+    def test_grows_past_capacity(self):
+        """Test that the buffer keeps every sample once its capacity is exceeded."""
+        frames = TelemetryFrameFactory.batch(5)
+        buffer = TelemetryFrameBuffer(capacity=2)
+        for frame in frames:
+            buffer.append_irsdk(_source_for(frame), frame.timestamp)
+
+        expected = TelemetrySequence(frames=frames).frame_arrays
+        arrays = buffer.frame_arrays()
+
+        assert arrays.keys() == expected.keys()
+        for name, array in expected.items():
+            np.testing.assert_array_equal(arrays[name], array)
+
+    def test_sequence_reuses_buffer_arrays(self):
+        """Test that the built sequence takes its frame_arrays from the buffer."""
+        frame = TelemetryFrameFactory.build()
+        buffer = TelemetryFrameBuffer()
+        buffer.append_irsdk(_source_for(frame), frame.timestamp)
+
+        sequence = buffer.to_sequence(TelemetrySequence)
+
+        assert "frame_arrays" in sequence.__dict__
+        np.testing.assert_array_equal(sequence.frame_arrays["speed"], [frame.speed])
+
+    def test_clear_empties_the_buffer(self):
+        """Test that clear drops buffered samples so the buffer can start a new lap."""
+        frames = TelemetryFrameFactory.batch(3)
+        buffer = TelemetryFrameBuffer()
+        buffer.append_irsdk(_source_for(frames[0]), frames[0].timestamp)
+
+        buffer.clear()
+        for frame in frames[1:]:
+            buffer.append_irsdk(_source_for(frame), frame.timestamp)
+
+        assert buffer.to_sequence(TelemetrySequence).frames == frames[1:]
+
+
+@pytest.mark.unit
+class TestLapValidity:
+    """Unit tests for LapTelemetry.is_valid."""
+
+    def test_on_track_lap_is_valid(self):
+        """Test that a lap driven entirely on track is valid."""
+        lap = LapTelemetryFactory.build(
+            frames=TelemetryFrameFactory.batch(5, track_surface=TrackSurface.ON_TRACK)
+        )
+
+        assert lap.is_valid() == (True, -1)
+
+    def test_reports_first_off_track_frame(self):
+        """Test that the index of the first frame off track is returned."""
+        surfaces = [
+            TrackSurface.ON_TRACK,
+            TrackSurface.ON_TRACK,
+            TrackSurface.OFF_TRACK,
+            TrackSurface.ON_TRACK,
+            TrackSurface.PIT_STALL,
+        ]
+        frames = [TelemetryFrameFactory.build(track_surface=surface) for surface in surfaces]
+        lap = LapTelemetryFactory.build(frames=frames)
+
+        assert lap.is_valid() == (False, 2)